@@ -0,0 +1,426 @@
+"""Detección de gastos atípicos en lote.
+
+Las páginas de gastos ajustaban un ``IsolationForest`` por cada tipo de gasto
+que se elegía y otro sobre todos los gastos. Acá se ajustan todos de una vez
+por versión de los datos, en paralelo: uno general, uno por IdTipoGasto y uno
+por IdSucursal, siempre sobre el Monto. El resultado es una tabla con una
+fila por IdGasto y, para cada agrupación, su puntaje (más alto, más atípico)
+y si quedó marcado como atípico; se guarda junto con los modelos en
+``.cache_datos/anomalias`` y las páginas sólo filtran esas columnas.
+
+Cuando la ingesta incremental agrega gastos nuevos, ``incorporar()`` los
+puntúa con los modelos ya guardados en lugar de volver a ajustarlos.
+
+Las ventas tienen su propio circuito, pensado para revisar fraudes a medida
+que llegan: un ``IsolationForest`` sobre Cantidad y Precio se ajusta una sola
+vez con la historia y queda guardado; ``vigilar_ventas()`` puntúa las ventas
+nuevas en lotes chicos (la ingesta lo llama con cada tanda) y agrega cada
+lote como una parte más a una tabla de puntajes que sólo crece, con el último
+IdVenta puntuado en un manifiesto. ``python anomalias.py ventas --vigilar 60``
+deja el proceso ingiriendo y puntuando cada minuto. El manifiesto también
+guarda la versión de ventas.csv ya puntuada y, como la ingesta, el largo y el
+hash de sus últimos bytes: si el CSV sólo creció se puntúan las filas nuevas,
+pero si se reemplazó o editó el modelo se vuelve a ajustar con la historia
+actual. También se reajusta a pedido (``--reajustar``).
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+import datos
+import metricas
+
+# Nombre de la agrupación -> columna que separa los modelos (None: uno solo)
+AGRUPACIONES = {"General": None, "Tipo": "IdTipoGasto", "Sucursal": "IdSucursal"}
+
+DIMENSIONES = ("sucursales", "tipos_gasto")
+
+CONTAMINACION = 0.05
+
+CONTAMINACION_VENTAS = 0.02
+
+# Ventas que se puntúan y guardan juntas al vigilar las que llegan; la historia
+# que falta al consultar los puntajes se guarda en una sola parte
+LOTE_VENTAS = 5000
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _base(gastos):
+    """Gastos con monto, tipo y sucursal conocidos (los que se analizan)."""
+    tipos = datos.load_tipos_gasto()
+    sucursales = datos.load_sucursales()
+    tipos_validos = tipos.loc[tipos["Descripcion"].notna(), "IdTipoGasto"]
+    sucursales_validas = sucursales.loc[sucursales["Sucursal"].notna(), "ID"]
+    validos = (
+        gastos["Monto"].notna()
+        & gastos["IdTipoGasto"].isin(tipos_validos)
+        & gastos["IdSucursal"].isin(sucursales_validas)
+    )
+    return gastos.loc[validos, ["IdGasto", "IdTipoGasto", "IdSucursal", "Monto"]].reset_index(drop=True)
+
+
+def _grupos(base):
+    """(agrupación, clave, filas) de cada modelo a ajustar."""
+    for agrupacion, columna in AGRUPACIONES.items():
+        if columna is None:
+            yield agrupacion, None, base
+        else:
+            for clave, filas in base.groupby(columna, sort=True):
+                yield agrupacion, int(clave), filas
+
+
+def _ajustar(montos):
+    from sklearn.ensemble import IsolationForest
+
+    return IsolationForest(contamination=CONTAMINACION, random_state=42).fit(montos)
+
+
+def puntuar(gastos, modelos):
+    """Puntaje y marca de atípico de ``gastos`` con los ``modelos`` dados.
+
+    Las filas sin modelo para su grupo (un tipo o sucursal nuevos) quedan
+    sin puntaje y sin marcar.
+    """
+    base = _base(gastos)
+    resultado = pd.DataFrame({"IdGasto": base["IdGasto"]})
+    for agrupacion, columna in AGRUPACIONES.items():
+        puntaje = np.full(len(base), np.nan)
+        atipico = np.zeros(len(base), dtype=bool)
+        if columna is None:
+            grupos = [(None, base.index)]
+        else:
+            grupos = [(int(clave), filas) for clave, filas in base.groupby(columna, sort=False).groups.items()]
+        for clave, filas in grupos:
+            modelo = modelos.get((agrupacion, clave))
+            if modelo is None:
+                continue
+            # ``base`` tiene índice 0..n-1: etiquetas y posiciones coinciden
+            posiciones = np.asarray(filas)
+            montos = base.loc[filas, ["Monto"]]
+            normalidad = modelo.score_samples(montos)
+            puntaje[posiciones] = -normalidad
+            # Igual que ``predict() == -1``, sin recorrer los árboles otra vez
+            atipico[posiciones] = normalidad - modelo.offset_ < 0
+        resultado[f"Puntaje{agrupacion}"] = puntaje
+        resultado[f"Atipico{agrupacion}"] = atipico
+    return resultado
+
+
+def construir(gastos, procesos=None):
+    """Ajusta todos los modelos en paralelo y devuelve (modelos, puntajes)."""
+    base = _base(gastos)
+    grupos = list(_grupos(base))
+    ajustados = joblib.Parallel(n_jobs=procesos or -1)(
+        joblib.delayed(_ajustar)(filas[["Monto"]]) for _, _, filas in grupos
+    )
+    modelos = {(agrupacion, clave): modelo for (agrupacion, clave, _), modelo in zip(grupos, ajustados)}
+    return modelos, puntuar(gastos, modelos)
+
+
+def version(version_gastos=None):
+    """Versión de los puntajes: la de los gastos y la de sus dimensiones."""
+    version_gastos = version_gastos or datos.version("gastos")
+    return hashlib.sha1(f"{version_gastos}|{datos.version(*DIMENSIONES)}".encode()).hexdigest()[:16]
+
+
+def directorio(version_puntajes):
+    return os.path.join(datos.DIRECTORIO_CACHE, "anomalias", f"gastos-{version_puntajes}")
+
+
+def _rutas(version_puntajes):
+    carpeta = directorio(version_puntajes)
+    return os.path.join(carpeta, "puntajes.parquet"), os.path.join(carpeta, "modelos.joblib")
+
+
+def _guardar(version_puntajes, modelos, puntajes):
+    _cache["puntajes"] = (version_puntajes, puntajes)
+    _cache["modelos"] = (version_puntajes, modelos)
+    if datos.HAY_PARQUET:
+        ruta_puntajes, ruta_modelos = _rutas(version_puntajes)
+        temporal = f"{ruta_modelos}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(os.path.dirname(ruta_modelos), exist_ok=True)
+        joblib.dump(modelos, temporal, compress=3)
+        os.replace(temporal, ruta_modelos)
+        # Los puntajes van últimos: su presencia indica que la versión está completa
+        datos.escribir_parquet(puntajes, ruta_puntajes)
+        for viejo in glob.glob(os.path.join(os.path.dirname(directorio(version_puntajes)), "gastos-*")):
+            if viejo != directorio(version_puntajes):
+                shutil.rmtree(viejo, ignore_errors=True)
+
+
+def _buscar_puntajes(version_puntajes):
+    en_cache = _cache.get("puntajes")
+    if en_cache is not None and en_cache[0] == version_puntajes:
+        metricas.cache("anomalias_gastos", "memoria")
+        return en_cache[1]
+    ruta_puntajes, _ = _rutas(version_puntajes)
+    if datos.HAY_PARQUET and os.path.exists(ruta_puntajes):
+        metricas.cache("anomalias_gastos", "disco")
+        _cache["puntajes"] = (version_puntajes, pd.read_parquet(ruta_puntajes))
+        return _cache["puntajes"][1]
+    return None
+
+
+def _buscar_modelos(version_puntajes):
+    """Los modelos pesan bastante más que los puntajes: se leen sólo si se van a usar."""
+    en_cache = _cache.get("modelos")
+    if en_cache is not None and en_cache[0] == version_puntajes:
+        return en_cache[1]
+    _, ruta_modelos = _rutas(version_puntajes)
+    if datos.HAY_PARQUET and os.path.exists(ruta_modelos):
+        try:
+            _cache["modelos"] = (version_puntajes, joblib.load(ruta_modelos))
+        except Exception:
+            # Modelos de otra versión de sklearn o archivo incompleto
+            return None
+        return _cache["modelos"][1]
+    return None
+
+
+def _calcular(version_puntajes, procesos=None):
+    modelos, puntajes = construir(datos.load_gastos(), procesos)
+    _guardar(version_puntajes, modelos, puntajes)
+    return modelos, puntajes
+
+
+def puntajes_gastos(procesos=None):
+    """IdGasto con Puntaje y Atipico de cada agrupación (General, Tipo, Sucursal)."""
+    with metricas.tramo("anomalias.gastos", "carga"), _lock:
+        actual = version()
+        puntajes = _buscar_puntajes(actual)
+        if puntajes is None:
+            metricas.cache("anomalias_gastos", "calculo")
+            puntajes = _calcular(actual, procesos)[1]
+    return puntajes.copy(deep=False)
+
+
+def modelos_gastos():
+    """Modelos de la versión actual: (agrupación, clave) -> IsolationForest."""
+    with _lock:
+        actual = version()
+        modelos = _buscar_modelos(actual)
+        if modelos is None:
+            modelos = _calcular(actual)[0]
+    return modelos
+
+
+def incorporar(nuevas, version_anterior, version_nueva):
+    """Puntúa gastos nuevos con los modelos de ``version_anterior`` y guarda la nueva versión.
+
+    Las versiones son las de la tabla de gastos. Si los puntajes anteriores
+    nunca se calcularon devuelve False y se calcularán completos la próxima
+    vez que se consulten.
+    """
+    with _lock:
+        anterior = version(version_anterior)
+        puntajes, modelos = _buscar_puntajes(anterior), _buscar_modelos(anterior)
+        if puntajes is None or modelos is None:
+            return False
+        puntajes = pd.concat([puntajes, puntuar(nuevas, modelos)], ignore_index=True)
+        _guardar(version(version_nueva), modelos, puntajes)
+    return True
+
+
+# -----------------------------
+# VENTAS: PUNTAJE CONTINUO
+# -----------------------------
+def directorio_ventas():
+    return os.path.join(datos.DIRECTORIO_CACHE, "anomalias", "ventas")
+
+
+def _ruta_manifiesto_ventas():
+    return os.path.join(directorio_ventas(), "manifiesto.json")
+
+
+def _leer_manifiesto_ventas():
+    if not os.path.exists(_ruta_manifiesto_ventas()):
+        return None
+    with open(_ruta_manifiesto_ventas(), encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def _guardar_manifiesto_ventas(estado):
+    destino = _ruta_manifiesto_ventas()
+    temporal = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(estado, archivo, indent=2)
+    os.replace(temporal, destino)
+
+
+def _modelo_ventas(estado):
+    en_cache = _cache.get("modelo_ventas")
+    if en_cache is not None and en_cache[0] == estado["modelo"]:
+        return en_cache[1]
+    modelo = joblib.load(os.path.join(directorio_ventas(), estado["modelo"]))
+    _cache["modelo_ventas"] = (estado["modelo"], modelo)
+    return modelo
+
+
+def _marcar_fuente(estado):
+    """Anota en ``estado`` la versión de ventas.csv ya puntuada y su final, para la próxima comparación."""
+    import ingesta
+
+    largo = datos.firma("ventas")[1]
+    with open(datos.ruta("ventas"), "rb") as archivo:
+        cola = ingesta._hash_cola(archivo, largo)
+    estado["version"] = datos.version("ventas")
+    estado["fuente"] = {"esquema": datos.hash_esquema("ventas"), "offset": largo, "cola": cola}
+
+
+def _vigente(estado):
+    """True si los puntajes de ``estado`` valen para ventas.csv: es el mismo o sólo creció por el final."""
+    import ingesta
+
+    if estado.get("version") == datos.version("ventas"):
+        return True
+    fuente = estado.get("fuente")
+    if fuente is None or fuente["esquema"] != datos.hash_esquema("ventas"):
+        return False
+    if datos.firma("ventas")[1] < fuente["offset"]:
+        return False
+    with open(datos.ruta("ventas"), "rb") as archivo:
+        return ingesta._hash_cola(archivo, fuente["offset"]) == fuente["cola"]
+
+
+def _ajustar_ventas(ventas):
+    """Ajusta el modelo con la historia y arranca una tabla de puntajes vacía."""
+    from sklearn.ensemble import IsolationForest
+
+    shutil.rmtree(directorio_ventas(), ignore_errors=True)
+    os.makedirs(directorio_ventas())
+    historia = ventas[["Cantidad", "Precio"]].dropna()
+    modelo = IsolationForest(contamination=CONTAMINACION_VENTAS, random_state=42).fit(historia)
+    nombre = f"modelo-{datos.version('ventas')}.joblib"
+    joblib.dump(modelo, os.path.join(directorio_ventas(), nombre), compress=3)
+    _cache["modelo_ventas"] = (nombre, modelo)
+    _cache.pop("ventas", None)
+    estado = {"modelo": nombre, "ajustado": time.strftime("%Y-%m-%d %H:%M:%S"), "ultimo_id": 0, "partes": []}
+    _guardar_manifiesto_ventas(estado)
+    return estado
+
+
+def _puntuar_ventas(estado, nuevas, lote=None):
+    """Puntúa en lotes de ``lote`` (None: todas juntas) las ventas con IdVenta posterior al último ya puntuado."""
+    pendientes = nuevas[nuevas["IdVenta"] > estado["ultimo_id"]].dropna(subset=["Cantidad", "Precio"])
+    if not len(pendientes):
+        return pendientes.iloc[:0]
+    modelo = _modelo_ventas(estado)
+    lote = lote or len(pendientes)
+    marcadas = []
+    for inicio in range(0, len(pendientes), lote):
+        filas = pendientes.iloc[inicio:inicio + lote]
+        normalidad = modelo.score_samples(filas[["Cantidad", "Precio"]])
+        puntajes = pd.DataFrame({
+            "IdVenta": filas["IdVenta"].to_numpy(),
+            "Fecha": filas["Fecha"].to_numpy(),
+            "Cantidad": filas["Cantidad"].to_numpy(),
+            "Precio": filas["Precio"].to_numpy(),
+            "Puntaje": -normalidad,
+            "Atipico": normalidad - modelo.offset_ < 0,
+            "Puntuada": pd.Timestamp.now().floor("s"),
+        })
+        nombre = f"parte-{len(estado['partes']):05d}.parquet"
+        datos.escribir_parquet(puntajes, os.path.join(directorio_ventas(), nombre))
+        # El manifiesto se guarda después de cada lote: si algo se corta, se retoma desde ahí
+        estado["partes"].append(nombre)
+        estado["ultimo_id"] = max(estado["ultimo_id"], int(filas["IdVenta"].max()))
+        _guardar_manifiesto_ventas(estado)
+        marcadas.append(puntajes[puntajes["Atipico"]])
+    return pd.concat(marcadas, ignore_index=True)
+
+
+def vigilar_ventas(nuevas, lote=LOTE_VENTAS):
+    """Puntúa ventas recién llegadas con el modelo guardado y devuelve las marcadas.
+
+    Si el modelo todavía no se ajustó, o ventas.csv cambió en otro lugar que
+    no sea el final, no hace nada: se ajustará con toda la historia la próxima
+    vez que se consulten los puntajes.
+    """
+    if not datos.HAY_PARQUET:
+        return None
+    with _lock:
+        estado = _leer_manifiesto_ventas()
+        if estado is None or not _vigente(estado):
+            return None
+        return _puntuar_ventas(estado, nuevas, lote)
+
+
+def puntajes_ventas(reajustar=False):
+    """IdVenta, Fecha, Cantidad, Precio, Puntaje, Atipico y Puntuada de todas las ventas.
+
+    Ajusta el modelo si todavía no existe, si ventas.csv no sólo creció desde
+    la última vez (o si ``reajustar``) y puntúa las ventas que falten; las
+    partes ya leídas se conservan en memoria.
+    """
+    if not datos.HAY_PARQUET:
+        raise RuntimeError("Se necesita pyarrow para la tabla de puntajes de ventas")
+    with metricas.tramo("anomalias.ventas", "carga"), _lock:
+        estado = _leer_manifiesto_ventas()
+        if estado is None or reajustar or not _vigente(estado):
+            metricas.cache("anomalias_ventas", "calculo")
+            estado = _ajustar_ventas(datos.load_ventas(columnas=["Cantidad", "Precio"]))
+        ventas = datos.load_ventas(columnas=["IdVenta", "Fecha", "Cantidad", "Precio"])
+        _puntuar_ventas(estado, ventas)
+        if estado.get("version") != datos.version("ventas"):
+            _marcar_fuente(estado)
+            _guardar_manifiesto_ventas(estado)
+
+        leidas, tabla = _cache.get("ventas", ((), None))
+        if tuple(estado["partes"][:len(leidas)]) != leidas:
+            leidas, tabla = (), None
+        nuevas = [pd.read_parquet(os.path.join(directorio_ventas(), p)) for p in estado["partes"][len(leidas):]]
+        if nuevas or tabla is None:
+            metricas.cache("anomalias_ventas", "disco")
+            partes = ([tabla] if tabla is not None else []) + nuevas
+            tabla = pd.concat(partes, ignore_index=True) if partes else pd.DataFrame(
+                columns=["IdVenta", "Fecha", "Cantidad", "Precio", "Puntaje", "Atipico", "Puntuada"])
+            _cache["ventas"] = (tuple(estado["partes"]), tabla)
+        else:
+            metricas.cache("anomalias_ventas", "memoria")
+    return tabla.copy(deep=False)
+
+
+def ventas_marcadas():
+    """Ventas marcadas como atípicas, de la más sospechosa a la menos."""
+    puntajes = puntajes_ventas()
+    return puntajes[puntajes["Atipico"]].sort_values("Puntaje", ascending=False, ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcula los puntajes de gastos y ventas atípicos")
+    parser.add_argument("tabla", nargs="?", default="gastos", choices=["gastos", "ventas"])
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo para gastos (por defecto, uno por CPU)")
+    parser.add_argument("--reajustar", action="store_true", help="Ventas: vuelve a ajustar el modelo con toda la historia")
+    parser.add_argument("--vigilar", type=float, default=None, metavar="SEGUNDOS",
+                        help="Ventas: cada tantos segundos ingiere las filas nuevas del CSV y las puntúa")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    if args.tabla == "gastos":
+        puntajes = puntajes_gastos(args.procesos)
+        marcados = {a: int(puntajes[f"Atipico{a}"].sum()) for a in AGRUPACIONES}
+        print(f"{len(puntajes)} gastos, atípicos {marcados}, {time.perf_counter() - inicio:.1f}s")
+    else:
+        puntajes = puntajes_ventas(reajustar=args.reajustar)
+        print(f"{len(puntajes)} ventas, {int(puntajes['Atipico'].sum())} marcadas, {time.perf_counter() - inicio:.1f}s", flush=True)
+        if args.vigilar:
+            import ingesta
+
+            while True:
+                time.sleep(args.vigilar)
+                nuevas = ingesta.ingerir("ventas")
+                # La ingesta ya las puntúa; esto sólo cubre el caso en que rearmó el almacén
+                vigilar_ventas(nuevas)
+                estado = _leer_manifiesto_ventas()
+                print(f"{time.strftime('%H:%M:%S')} {len(nuevas)} ventas nuevas, último id puntuado {estado['ultimo_id']}", flush=True)
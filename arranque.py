@@ -0,0 +1,134 @@
+"""Medición del tiempo de arranque y de render de la app.
+
+``Main.py`` toma la hora al empezar, después de sus importaciones y al terminar
+cada ejecución, y llama a ``registrar()``. Cada ejecución queda como una fila en
+``.cache_datos/metricas/arranque.csv``: sección, si fue la primera del proceso
+(en frío), segundos de importación, segundos de render y qué librerías pesadas
+estaban cargadas al terminar. En memoria se conservan las últimas ``HISTORIAL``
+filas, y cuando el CSV pasa de ``MAXIMO_BYTES`` se rota a ``arranque.1.csv``
+(se pisa la rotación anterior), así que un servidor de larga vida no crece sin
+límite.
+
+``python arranque.py`` mide en un proceso nuevo por sección el arranque en
+frío (login/Inicio) y el primer render de cada sección, para poder seguirlos
+en el tiempo.
+"""
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Librerías cuyo costo de importación vale la pena seguir
+PESADAS = ("matplotlib", "seaborn", "plotly", "folium", "statsmodels", "sklearn", "scipy")
+
+CAMPOS = ["fecha", "seccion", "en_frio", "importacion_s", "render_s", "librerias"]
+
+HISTORIAL = 200
+MAXIMO_BYTES = 5 * 2**20
+
+historial = deque(maxlen=HISTORIAL)
+_en_frio = True
+_lock = threading.Lock()
+
+
+def ahora():
+    return time.perf_counter()
+
+
+def librerias_cargadas():
+    return [nombre for nombre in PESADAS if nombre in sys.modules]
+
+
+def ruta_registro():
+    # datos ya está importado cuando se registra; importarlo antes falsearía la medición
+    import datos
+    return os.path.join(datos.DIRECTORIO_CACHE, "metricas", "arranque.csv")
+
+
+def registrar(seccion, inicio, fin_importaciones):
+    """Guarda los tiempos de una ejecución completa del script."""
+    global _en_frio
+    fin = ahora()
+    with _lock:
+        fila = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "seccion": seccion,
+            "en_frio": _en_frio,
+            "importacion_s": round(fin_importaciones - inicio, 4),
+            "render_s": round(fin - fin_importaciones, 4),
+            "librerias": ";".join(librerias_cargadas()),
+        }
+        _en_frio = False
+        historial.append(fila)
+        try:
+            destino = ruta_registro()
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            if os.path.exists(destino) and os.path.getsize(destino) > MAXIMO_BYTES:
+                os.replace(destino, destino[:-len(".csv")] + ".1.csv")
+            nuevo = not os.path.exists(destino)
+            with open(destino, "a", newline="", encoding="utf-8") as archivo:
+                escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+                if nuevo:
+                    escritor.writeheader()
+                escritor.writerow(fila)
+        except OSError:
+            # Sin disco escribible la medición sigue disponible en ``historial``
+            pass
+    return fila
+
+
+# -----------------------------
+# MEDICION EN PROCESOS NUEVOS
+# -----------------------------
+def _medir_en_este_proceso(seccion):
+    from streamlit.testing.v1 import AppTest
+    import arranque  # el módulo que importa Main.py, no este __main__
+
+    app = AppTest.from_file(os.path.join(os.path.dirname(os.path.abspath(__file__)), "Main.py"), default_timeout=600)
+    app.secrets["acceso"] = {"clave": "medicion"}
+    app.session_state["authenticated"] = True
+    app.session_state["admin"] = True
+    app.run()
+    if seccion != "Inicio":
+        app.sidebar.selectbox[0].set_value(seccion)
+        app.run()
+    print(json.dumps(list(arranque.historial)))
+
+
+def medir(seccion):
+    """Arranque en frío y primer render de ``seccion`` en un intérprete nuevo."""
+    salida = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--proceso", seccion],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mide el arranque en frío de DataEnterprise")
+    parser.add_argument("secciones", nargs="*", help="Secciones a medir (por defecto todas)")
+    parser.add_argument("--proceso", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.proceso:
+        _medir_en_este_proceso(args.proceso)
+        sys.exit(0)
+
+    from paginas import SECCIONES
+
+    desconocidas = set(args.secciones) - set(SECCIONES)
+    if desconocidas:
+        parser.error(f"Secciones desconocidas: {', '.join(sorted(desconocidas))}")
+
+    print(f"{'sección':32} {'import (s)':>10} {'arranque (s)':>12} {'1er render (s)':>14}  librerías")
+    for seccion in args.secciones or SECCIONES:
+        filas = medir(seccion)
+        frio, ultima = filas[0], filas[-1]
+        render = ultima["render_s"] if seccion != "Inicio" else frio["render_s"]
+        print(f"{seccion:32} {frio['importacion_s']:>10.3f} {frio['render_s']:>12.3f} {render:>14.3f}  {ultima['librerias'] or '-'}")
@@ -0,0 +1,45 @@
+"""Codificación de variables para los modelos de demanda.
+
+Los ids de producto, proveedor o canal tienen cientos de valores. Con
+``pd.get_dummies`` cada uno se vuelve una columna densa por fila; acá se
+codifican con encoders de sklearn que se ajustan sólo con los datos de
+entrenamiento y viajan junto al modelo en un ``Pipeline``:
+
+- ``modelo_lineal`` (Ridge, LinearRegression): one-hot disperso (CSR), que
+  estos estimadores aceptan directamente.
+- ``modelo_arboles`` (RandomForest): un código entero por categoría, porque
+  los árboles pueden cortar sobre él sin necesitar una columna por valor.
+"""
+import numpy as np
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder
+
+
+def codificador_disperso(numericas, categoricas):
+    """Numéricas tal cual + one-hot de las categóricas, como matriz CSR."""
+    return ColumnTransformer(
+        [
+            ("numericas", "passthrough", list(numericas)),
+            # drop="first" equivale al drop_first de get_dummies; una categoría
+            # que no estaba en el entrenamiento queda toda en cero
+            ("categoricas", OneHotEncoder(drop="first", handle_unknown="ignore", dtype=np.float32), list(categoricas)),
+        ],
+        sparse_threshold=1.0,
+    )
+
+
+def codificador_compacto(numericas, categoricas):
+    """Numéricas tal cual + un código entero por categoría (-1 si es nueva)."""
+    return ColumnTransformer([
+        ("numericas", "passthrough", list(numericas)),
+        ("categoricas", OrdinalEncoder(handle_unknown="use_encoded_value", unknown_value=-1, dtype=np.int32), list(categoricas)),
+    ])
+
+
+def modelo_lineal(estimador, numericas, categoricas):
+    return make_pipeline(codificador_disperso(numericas, categoricas), estimador)
+
+
+def modelo_arboles(estimador, numericas, categoricas):
+    return make_pipeline(codificador_compacto(numericas, categoricas), estimador)
@@ -0,0 +1,207 @@
+"""Cubos mensuales precalculados de ventas y gastos.
+
+Casi todos los gráficos de ventas son un ``groupby`` por mes y una dimensión.
+En lugar de recorrer la tabla completa en cada interacción, se materializa
+una vez por versión de datos un conjunto de cuboides (el cubo base mes ×
+producto × sucursal × canal × empleado y sus agregaciones más usadas) y
+``rollup()`` responde desde el cuboide más chico que alcance para la consulta.
+Los gastos tienen su propio cubo (mes × sucursal × tipo de gasto).
+
+Cuando llegan filas nuevas, ``incorporar()`` suma su agregado a los cuboides
+existentes sin volver a recorrer la tabla.
+"""
+import glob
+import os
+import shutil
+import threading
+
+import pandas as pd
+
+import datos
+import metricas
+
+CUBOS = {
+    "ventas": {
+        "dimensiones": ("Mes", "IdProducto", "IdSucursal", "IdCanal", "IdEmpleado"),
+        "medidas": ("Cantidad", "Ingreso", "Registros"),
+        # Cuboides materializados: nombre -> dimensiones que conserva
+        "cuboides": {
+            "base": ("Mes", "IdProducto", "IdSucursal", "IdCanal", "IdEmpleado"),
+            "mes": ("Mes",),
+            "mes_producto": ("Mes", "IdProducto"),
+            "mes_canal": ("Mes", "IdCanal"),
+            "mes_sucursal": ("Mes", "IdSucursal"),
+            "mes_sucursal_empleado": ("Mes", "IdSucursal", "IdEmpleado"),
+        },
+    },
+    "gastos": {
+        "dimensiones": ("Mes", "IdSucursal", "IdTipoGasto"),
+        "medidas": ("Monto", "Registros"),
+        "cuboides": {
+            "base": ("Mes", "IdSucursal", "IdTipoGasto"),
+            "mes_sucursal": ("Mes", "IdSucursal"),
+            "mes_tipo": ("Mes", "IdTipoGasto"),
+        },
+    },
+}
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def filas(tabla, df):
+    """Pasa filas de ventas o gastos al grano del cubo base (sin agregar)."""
+    mes = df["Fecha"].dt.to_period("M").dt.to_timestamp()
+    if tabla == "ventas":
+        return pd.DataFrame({
+            "Mes": mes,
+            "IdProducto": df["IdProducto"],
+            "IdSucursal": df["IdSucursal"],
+            "IdCanal": df["IdCanal"],
+            "IdEmpleado": df["IdEmpleado"],
+            "Cantidad": df["Cantidad"].astype("float64"),
+            "Ingreso": df["Precio"].astype("float64") * df["Cantidad"].astype("float64"),
+            "Registros": 1,
+        })
+    return pd.DataFrame({
+        "Mes": mes,
+        "IdSucursal": df["IdSucursal"],
+        "IdTipoGasto": df["IdTipoGasto"],
+        "Monto": df["Monto"].astype("float64"),
+        "Registros": 1,
+    })
+
+
+def _agregar(df, dimensiones, medidas):
+    if not dimensiones:
+        return pd.DataFrame([df[list(medidas)].sum()])
+    return df.groupby(list(dimensiones), sort=True)[list(medidas)].sum().reset_index()
+
+
+def construir(tabla, df):
+    """Arma todos los cuboides de ``tabla`` a partir de sus filas."""
+    definicion = CUBOS[tabla]
+    base = _agregar(filas(tabla, df), definicion["cuboides"]["base"], definicion["medidas"])
+    cubo = {"base": base}
+    for nombre, dimensiones in definicion["cuboides"].items():
+        if nombre != "base":
+            cubo[nombre] = _agregar(base, dimensiones, definicion["medidas"])
+    return cubo
+
+
+def directorio(tabla, version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "cubo", f"{tabla}-{version}")
+
+
+def _rutas(tabla, version):
+    carpeta = directorio(tabla, version)
+    return {nombre: os.path.join(carpeta, f"{nombre}.parquet") for nombre in CUBOS[tabla]["cuboides"]}
+
+
+def _guardar(tabla, version, cubo):
+    _cache[tabla] = (version, cubo)
+    if datos.HAY_PARQUET:
+        for nombre, ruta in _rutas(tabla, version).items():
+            datos.escribir_parquet(cubo[nombre], ruta)
+        # Las versiones anteriores del cubo ya no se van a consultar
+        for viejo in glob.glob(os.path.join(os.path.dirname(directorio(tabla, version)), f"{tabla}-*")):
+            if viejo != directorio(tabla, version):
+                shutil.rmtree(viejo, ignore_errors=True)
+
+
+def _buscar(tabla, version):
+    """Cubo ya calculado para esa versión (en memoria o en disco), o None."""
+    en_cache = _cache.get(tabla)
+    if en_cache is not None and en_cache[0] == version:
+        metricas.cache("cubo", "memoria")
+        return en_cache[1]
+    rutas = _rutas(tabla, version)
+    if datos.HAY_PARQUET and all(os.path.exists(r) for r in rutas.values()):
+        metricas.cache("cubo", "disco")
+        _cache[tabla] = (version, {nombre: pd.read_parquet(r) for nombre, r in rutas.items()})
+        return _cache[tabla][1]
+    return None
+
+
+def cubo(tabla="ventas"):
+    """Cuboides de la versión actual de los datos (en memoria y en disco)."""
+    with metricas.tramo(f"cubo.{tabla}", "carga"), _lock:
+        actual = datos.version(tabla)
+        if _buscar(tabla, actual) is None:
+            metricas.cache("cubo", "calculo")
+            _guardar(tabla, actual, construir(tabla, datos.cargar(tabla)))
+        return _cache[tabla][1]
+
+
+def cubo_ventas():
+    return cubo("ventas")
+
+
+def cubo_gastos():
+    return cubo("gastos")
+
+
+def incorporar(tabla, nuevas, version_anterior, version_nueva):
+    """Suma filas nuevas al cubo de ``version_anterior`` y lo guarda como ``version_nueva``.
+
+    El costo depende del tamaño del cubo y de las filas nuevas, no del de la
+    tabla completa. Si el cubo anterior nunca se calculó devuelve False y se
+    armará completo la próxima vez que se consulte.
+    """
+    definicion = CUBOS[tabla]
+    with _lock:
+        anterior = _buscar(tabla, version_anterior)
+        if anterior is None:
+            return False
+        delta = construir(tabla, nuevas)
+        actualizado = {}
+        for nombre, dimensiones in definicion["cuboides"].items():
+            combinado = pd.concat([anterior[nombre], delta[nombre]], ignore_index=True)
+            actualizado[nombre] = _agregar(combinado, dimensiones, definicion["medidas"])
+        _guardar(tabla, version_nueva, actualizado)
+    return True
+
+
+def _elegir_cuboide(tabla, cuboides, necesarias):
+    candidatos = [n for n, dims in CUBOS[tabla]["cuboides"].items() if necesarias <= set(dims)]
+    return min(candidatos, key=lambda n: len(cuboides[n]))
+
+
+def rollup(dimensiones=(), filtros=None, tabla="ventas"):
+    """Suma de las medidas del cubo agrupada por ``dimensiones``.
+
+    ``filtros`` es un dict dimensión -> valor (o lista de valores). Sin
+    dimensiones devuelve una sola fila con los totales.
+    """
+    filtros = filtros or {}
+    definicion = CUBOS[tabla]
+    desconocidas = (set(dimensiones) | set(filtros)) - set(definicion["dimensiones"])
+    if desconocidas:
+        raise KeyError(f"Dimensiones desconocidas: {', '.join(sorted(desconocidas))}")
+
+    cuboides = cubo(tabla)
+    resultado = cuboides[_elegir_cuboide(tabla, cuboides, set(dimensiones) | set(filtros))]
+    for dimension, valor in filtros.items():
+        if pd.api.types.is_list_like(valor):
+            resultado = resultado[resultado[dimension].isin(valor)]
+        else:
+            resultado = resultado[resultado[dimension] == valor]
+    return _agregar(resultado, dimensiones, definicion["medidas"])
+
+
+def etiquetar(df):
+    """Agrega el nombre de producto, canal, sucursal y tipo de gasto presentes."""
+    df = df.copy()
+    if "IdProducto" in df.columns:
+        productos = datos.load_productos().drop_duplicates("ID_PRODUCTO").set_index("ID_PRODUCTO")
+        df["Concepto"] = df["IdProducto"].map(productos["Concepto"])
+    if "IdCanal" in df.columns:
+        canal = datos.load_canal().drop_duplicates("CODIGO").set_index("CODIGO")
+        df["Canal"] = df["IdCanal"].map(canal["DESCRIPCION"]).astype(str)
+    if "IdSucursal" in df.columns:
+        sucursales = datos.load_sucursales().drop_duplicates("ID").set_index("ID")
+        df["Sucursal"] = df["IdSucursal"].map(sucursales["Sucursal"])
+    if "IdTipoGasto" in df.columns:
+        tipos = datos.load_tipos_gasto().drop_duplicates("IdTipoGasto").set_index("IdTipoGasto")
+        df["Descripcion"] = df["IdTipoGasto"].map(tipos["Descripcion"]).astype(str)
+    return df
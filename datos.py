@@ -0,0 +1,394 @@
+"""Capa de acceso a datos compartida por todas las secciones de la app.
+
+Cada tabla tiene un único loader (``load_ventas``, ``load_compras``, ...). Los
+DataFrames se parsean una sola vez por proceso y se comparten entre todas las
+sesiones de Streamlit; la caché se invalida sola cuando cambia el archivo en
+disco (mtime/tamaño) o a mano con ``invalidar()``.
+
+La primera vez que se lee un CSV se materializa una copia columnar (Parquet)
+identificada por el hash del archivo fuente; las lecturas siguientes, incluso
+desde otros procesos, salen de esa copia y pueden pedir sólo algunas columnas.
+También se puede generar de antemano con ``python datos.py materializar``.
+Ventas, compras y gastos sólo crecen por el final: ``ingesta.py`` agrega sus
+filas nuevas como partes Parquet y, mientras esas partes cubran el CSV actual,
+se leen de ahí sin volver a convertir el archivo entero.
+
+Los tipos de cada columna se declaran en ``ESQUEMAS`` (categorías para texto de
+baja cardinalidad, enteros del menor ancho posible para los ids, float32 para
+precios y montos y fechas ya parseadas); ``python datos.py memoria`` muestra
+cuánto ocupa cada tabla con y sin el esquema.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+import metricas
+
+try:
+    import pyarrow  # noqa: F401
+    HAY_PARQUET = True
+except ImportError:
+    HAY_PARQUET = False
+
+# -----------------------------
+# ARCHIVOS Y ESQUEMAS
+# -----------------------------
+DIRECTORIO_DATOS = os.environ.get(
+    "DATAENTERPRISE_DATOS", os.path.dirname(os.path.abspath(__file__))
+)
+DIRECTORIO_CACHE = os.environ.get(
+    "DATAENTERPRISE_CACHE", os.path.join(DIRECTORIO_DATOS, ".cache_datos")
+)
+
+ARCHIVOS = {
+    "ventas": "Venta_transformado.csv",
+    "compras": "Compra_transformada.csv",
+    "gastos": "Gasto_transformado.csv",
+    "clientes": "Clientes_transformados.csv",
+    "empleados": "Empleados_transformados.csv",
+    "productos": "PRODUCTOS_transformado.csv",
+    "proveedores": "Proveedores_transformado.csv",
+    "sucursales": "Sucursales_transformado.csv",
+    "canal": "CanalDeVenta_Tranfor.csv",
+    "tipos_gasto": "TiposDeGasto_T.csv",
+}
+
+FECHA = "datetime64[ns]"
+
+# Tablas que sólo reciben filas nuevas al final, con su clave creciente
+INCREMENTALES = {"ventas": "IdVenta", "compras": "IdCompra", "gastos": "IdGasto"}
+
+# Columnas sin tipo declarado (nombres, direcciones, teléfonos) quedan como texto
+ESQUEMAS = {
+    "ventas": {
+        "IdVenta": "int32", "Fecha": FECHA, "Fecha_Entrega": FECHA, "IdCanal": "int8",
+        "IdCliente": "int32", "IdSucursal": "int16", "IdEmpleado": "int16",
+        "IdProducto": "int32", "Precio": "float32", "Cantidad": "float32",
+    },
+    "compras": {
+        "IdCompra": "int32", "Fecha": FECHA, "IdProducto": "int32", "Cantidad": "int32",
+        "Precio": "float32", "IdProveedor": "int16",
+    },
+    "gastos": {
+        "IdGasto": "int32", "IdSucursal": "int16", "IdTipoGasto": "int8", "Fecha": FECHA,
+        "Monto": "float32",
+    },
+    "clientes": {
+        "ID": "int32", "Provincia": "category", "Edad": "int16", "Localidad": "category",
+        "X": "float64", "Y": "float64", "Fecha_Alta": FECHA, "Usuario_Alta": "category",
+        "Fecha_Ultima_Modificacion": FECHA, "Usuario_Ultima_Modificacion": "category",
+        "Marca_Baja": "int8",
+    },
+    "empleados": {
+        "ID_empleado": "int16", "Sucursal": "category", "Sector": "category",
+        "Cargo": "category", "Salario": "float32",
+    },
+    "productos": {
+        "ID_PRODUCTO": "int32", "Tipo": "category", "Precio": "float32",
+    },
+    "proveedores": {
+        "IDProveedor": "int16", "City": "category", "State": "category",
+        "Country": "category", "departamen": "category",
+    },
+    "sucursales": {
+        "ID": "int16", "Localidad": "category", "Provincia": "category",
+        "Latitud": "float64", "Longitud": "float64",
+    },
+    "canal": {
+        "CODIGO": "int8", "DESCRIPCION": "category",
+    },
+    "tipos_gasto": {
+        "IdTipoGasto": "int8", "Descripcion": "category", "Monto_Aproximado": "float32",
+    },
+}
+
+# -----------------------------
+# CACHE COMPARTIDA POR PROCESO
+# -----------------------------
+_cache = {}
+_hashes = {}
+# Bytes por eslabón del hash de la fuente (ver ``hash_fuente``)
+BLOQUE_HASH = 1 << 20
+_locks = {tabla: threading.Lock() for tabla in ARCHIVOS}
+
+
+def ruta(tabla):
+    return os.path.join(DIRECTORIO_DATOS, ARCHIVOS[tabla])
+
+
+def firma(tabla):
+    """Identifica la versión del archivo en disco (mtime y tamaño)."""
+    stat = os.stat(ruta(tabla))
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def hash_fuente(tabla, desde=None):
+    """Hash del contenido del CSV; se recalcula sólo si cambió la firma.
+
+    Se encadena por bloques de ``BLOQUE_HASH`` bytes: cada bloque se hashea
+    junto con el hash de los anteriores. ``desde`` es un ``punto_hash()``
+    tomado antes de que el archivo creciera por el final; el hash se sigue
+    desde ahí y sólo se leen los bytes nuevos.
+    """
+    actual = firma(tabla)
+    memo = _hashes.get(tabla)
+    if memo is None or memo[0] != actual:
+        inicio, previo = desde if desde and desde[0] <= actual[1] else (0, hashlib.sha1().hexdigest())
+        punto = (inicio, previo)
+        with open(ruta(tabla), "rb") as archivo:
+            archivo.seek(inicio)
+            for bloque in iter(lambda: archivo.read(BLOQUE_HASH), b""):
+                previo = hashlib.sha1(previo.encode() + bloque).hexdigest()
+                if len(bloque) == BLOQUE_HASH:
+                    punto = (archivo.tell(), previo)
+        memo = (actual, previo[:16], punto)
+        _hashes[tabla] = memo
+    return memo[1]
+
+
+def punto_hash(tabla):
+    """(byte, hash) del último bloque completo del hash de la fuente, para ``hash_fuente(desde=...)``."""
+    hash_fuente(tabla)
+    return _hashes[tabla][2]
+
+
+def hash_esquema(tabla):
+    """Cambia cuando se modifica el esquema declarado de la tabla."""
+    return hashlib.sha1(repr(sorted(ESQUEMAS[tabla].items())).encode()).hexdigest()[:8]
+
+
+def version(*tablas):
+    """Identificador de la versión conjunta de los datos de esas tablas.
+
+    Sirve como clave para todo lo que se deriva de ellas (tablas de hechos,
+    agregados, modelos): cambia si cambia el contenido o el esquema.
+    """
+    partes = [f"{t}:{hash_fuente(t)}:{hash_esquema(t)}" for t in sorted(tablas or ARCHIVOS)]
+    return hashlib.sha1("|".join(partes).encode()).hexdigest()[:16]
+
+
+# -----------------------------
+# COPIA COLUMNAR (PARQUET)
+# -----------------------------
+def ruta_columnar(tabla):
+    nombre = f"{tabla}-{hash_fuente(tabla)}-{hash_esquema(tabla)}.parquet"
+    return os.path.join(DIRECTORIO_CACHE, "columnar", nombre)
+
+
+def _leer_csv(tabla, columnas=None, fuente=None, encabezado=None):
+    """Lee el CSV de la tabla con su esquema.
+
+    ``fuente`` permite leer otro origen (por ejemplo un bloque de bytes ya
+    leído) y ``encabezado`` da los nombres de columna cuando ese bloque no
+    trae la primera línea del archivo.
+    """
+    esquema = ESQUEMAS[tabla]
+    if columnas is not None:
+        esquema = {c: t for c, t in esquema.items() if c in columnas}
+    tipos = {c: t for c, t in esquema.items() if t != FECHA}
+    fechas = [c for c, t in esquema.items() if t == FECHA]
+    opciones = {} if encabezado is None else {"names": encabezado, "header": None}
+    return pd.read_csv(
+        ruta(tabla) if fuente is None else fuente,
+        usecols=columnas, dtype=tipos, parse_dates=fechas or False, **opciones
+    )
+
+
+def escribir_parquet(df, destino, reemplaza=None):
+    """Escribe ``df`` en ``destino`` de forma atómica.
+
+    ``reemplaza`` es un patrón glob (relativo a la carpeta de destino) de
+    versiones anteriores que se borran una vez escrita la nueva.
+    """
+    os.makedirs(os.path.dirname(destino), exist_ok=True)
+    temporal = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+    df.to_parquet(temporal, index=False)
+    os.replace(temporal, destino)
+
+    if reemplaza is not None:
+        for viejo in glob.glob(os.path.join(os.path.dirname(destino), reemplaza)):
+            if viejo != destino:
+                os.remove(viejo)
+    return destino
+
+
+def materializar(tabla, forzar=False):
+    """Genera (si falta) la copia Parquet de la tabla y devuelve su ruta."""
+    destino = ruta_columnar(tabla)
+    if os.path.exists(destino) and not forzar:
+        return destino
+    return escribir_parquet(_leer_csv(tabla), destino, reemplaza=f"{tabla}-*.parquet")
+
+
+def ruta_ingesta(tabla):
+    return os.path.join(DIRECTORIO_CACHE, "ingesta", tabla)
+
+
+def partes_ingeridas(tabla):
+    """Partes del almacén incremental, sólo si cubren exactamente el CSV actual."""
+    manifiesto = os.path.join(ruta_ingesta(tabla), "manifiesto.json")
+    if tabla not in INCREMENTALES or not os.path.exists(manifiesto):
+        return None
+    with open(manifiesto, encoding="utf-8") as archivo:
+        estado = json.load(archivo)
+    if estado.get("esquema") != hash_esquema(tabla) or estado.get("hash") != hash_fuente(tabla):
+        return None
+    return [os.path.join(ruta_ingesta(tabla), parte) for parte in estado["partes"]]
+
+
+def _leer(tabla, columnas=None):
+    if HAY_PARQUET:
+        partes = partes_ingeridas(tabla)
+        if partes:
+            return pd.concat(
+                [pd.read_parquet(parte, columns=columnas) for parte in partes], ignore_index=True
+            )
+        return pd.read_parquet(materializar(tabla), columns=columnas)
+    return _leer_csv(tabla, columnas)
+
+
+def cargar(tabla, columnas=None):
+    """Devuelve la tabla pedida, leyéndola sólo si cambió en disco.
+
+    Con ``columnas`` se lee únicamente esa proyección (salvo que la tabla
+    completa ya esté en memoria). Se entrega una copia superficial: las
+    páginas pueden agregar o reemplazar columnas sin alterar la versión
+    compartida.
+    """
+    if tabla not in ARCHIVOS:
+        raise KeyError(f"Tabla desconocida: {tabla}")
+    clave = (tabla, tuple(columnas) if columnas is not None else None)
+
+    with metricas.tramo(f"datos.{tabla}", "carga"), _locks[tabla]:
+        actual = firma(tabla)
+        completa = _cache.get((tabla, None))
+        if columnas is not None and completa is not None and completa[0] == actual:
+            metricas.cache("datos", "memoria")
+            return completa[1][list(columnas)].copy(deep=False)
+
+        en_cache = _cache.get(clave)
+        if en_cache is None or en_cache[0] != actual:
+            # "disco" si hay copia columnar o partes ingeridas; "calculo" si hay que parsear el CSV
+            columnar = HAY_PARQUET and (partes_ingeridas(tabla) or os.path.exists(ruta_columnar(tabla)))
+            metricas.cache("datos", "disco" if columnar else "calculo")
+            en_cache = (actual, _leer(tabla, list(columnas) if columnas is not None else None))
+            _cache[clave] = en_cache
+        else:
+            metricas.cache("datos", "memoria")
+    return en_cache[1].copy(deep=False)
+
+
+def anexar(tabla, nuevas, firma_anterior, firma_nueva):
+    """Extiende la tabla completa ya cargada en memoria con filas nuevas.
+
+    Lo usa la ingesta incremental para que la próxima lectura no vuelva a
+    disco; sólo aplica si lo cargado corresponde a ``firma_anterior``. Las
+    proyecciones en caché se descartan.
+    """
+    with _locks[tabla]:
+        completa = _cache.get((tabla, None))
+        for clave in [c for c in _cache if c[0] == tabla]:
+            del _cache[clave]
+        if completa is not None and completa[0] == firma_anterior:
+            _cache[(tabla, None)] = (firma_nueva, pd.concat([completa[1], nuevas], ignore_index=True))
+
+
+def reporte_memoria(tablas=None):
+    """Memoria de cada tabla con tipos inferidos por pandas vs. con ``ESQUEMAS``."""
+    filas = []
+    for tabla in tablas or ARCHIVOS:
+        inferida = pd.read_csv(ruta(tabla))
+        tipada = cargar(tabla)
+        mb_inferida = inferida.memory_usage(deep=True).sum() / 2**20
+        mb_tipada = tipada.memory_usage(deep=True).sum() / 2**20
+        filas.append({
+            "Tabla": tabla,
+            "Filas": len(tipada),
+            "MB inferido": round(mb_inferida, 2),
+            "MB con esquema": round(mb_tipada, 2),
+            "Ahorro %": round(100 * (1 - mb_tipada / mb_inferida), 1) if mb_inferida else 0.0,
+        })
+    return pd.DataFrame(filas)
+
+
+def invalidar(tabla=None):
+    """Descarta la caché de una tabla (o de todas si no se indica)."""
+    for clave in list(_cache):
+        if tabla is None or clave[0] == tabla:
+            del _cache[clave]
+
+
+# -----------------------------
+# LOADERS POR TABLA
+# -----------------------------
+def load_ventas(columnas=None):
+    return cargar("ventas", columnas)
+
+
+def load_compras(columnas=None):
+    return cargar("compras", columnas)
+
+
+def load_gastos(columnas=None):
+    return cargar("gastos", columnas)
+
+
+def load_clientes(columnas=None):
+    return cargar("clientes", columnas)
+
+
+def load_empleados(columnas=None):
+    return cargar("empleados", columnas)
+
+
+def load_productos(columnas=None):
+    return cargar("productos", columnas)
+
+
+def load_proveedores(columnas=None):
+    return cargar("proveedores", columnas)
+
+
+def load_sucursales(columnas=None):
+    return cargar("sucursales", columnas)
+
+
+def load_canal(columnas=None):
+    return cargar("canal", columnas)
+
+
+def load_tipos_gasto(columnas=None):
+    return cargar("tipos_gasto", columnas)
+
+
+# -----------------------------
+# LINEA DE COMANDOS
+# -----------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Herramientas de la capa de datos de DataEnterprise")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    cmd_materializar = subcomandos.add_parser("materializar", help="Genera las copias Parquet de los CSV")
+    cmd_materializar.add_argument("tablas", nargs="*", help=f"Tablas a convertir (por defecto todas): {', '.join(ARCHIVOS)}")
+    cmd_materializar.add_argument("--forzar", action="store_true", help="Regenera aunque ya exista la copia")
+
+    cmd_memoria = subcomandos.add_parser("memoria", help="Muestra la memoria ocupada por cada tabla")
+    cmd_memoria.add_argument("tablas", nargs="*")
+
+    args = parser.parse_args()
+    desconocidas = set(args.tablas) - set(ARCHIVOS)
+    if desconocidas:
+        parser.error(f"Tablas desconocidas: {', '.join(sorted(desconocidas))}")
+
+    if args.comando == "materializar":
+        if not HAY_PARQUET:
+            parser.error("Se necesita pyarrow para generar las copias Parquet")
+        for tabla in args.tablas or ARCHIVOS:
+            print(f"{tabla}: {materializar(tabla, forzar=args.forzar)}")
+    elif args.comando == "memoria":
+        print(reporte_memoria(args.tablas).to_string(index=False))
@@ -0,0 +1,106 @@
+"""Gráficos de dispersión de plotly con muchos puntos.
+
+``px.scatter`` manda cada fila al navegador como JSON: con las ventas de
+producción son megabytes en cada rerun. ``scatter()`` arma el mismo gráfico,
+pero si el DataFrame supera ``MAXIMO_PUNTOS`` filas lo reduce antes con
+``reducir()`` y usa trazas WebGL:
+
+- se divide el plano en una grilla de ``CELDAS`` x ``CELDAS`` (en un eje de
+  categorías, una celda por categoría) y se conserva al menos un punto de
+  cada celda ocupada, así no desaparecen las zonas poco pobladas;
+- el resto del cupo se llena con una muestra uniforme de las demás filas, que
+  conserva la densidad relativa de cada zona;
+- las filas marcadas en ``destacar`` (atípicos) entran antes que las demás.
+  Si solas superan el cupo, primero se descartan las que caen exactamente en
+  el mismo punto (se ven igual) y, si todavía sobran, se eligen con la misma
+  grilla: al menos una por celda ocupada y el resto al azar. Así el gráfico
+  nunca pasa de ``MAXIMO_PUNTOS`` puntos.
+
+La muestra es determinística (``semilla``): el gráfico no cambia entre
+reruns mientras no cambien los datos. El subtítulo del gráfico indica
+cuántos puntos se muestran de cuántos.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+MAXIMO_PUNTOS = int(os.environ.get("DATAENTERPRISE_PUNTOS", "20000"))
+CELDAS = 200
+
+
+def _celdas(columna):
+    """Número de celda de cada valor: categorías por código, números en ``CELDAS`` tramos."""
+    if pd.api.types.is_datetime64_any_dtype(columna):
+        columna = columna.astype("int64")
+    elif not pd.api.types.is_numeric_dtype(columna):
+        return pd.factorize(columna)[0].astype("int64")
+    valores = columna.to_numpy(dtype="float64", na_value=np.nan)
+    finitos = valores[np.isfinite(valores)]
+    if not len(finitos):
+        return np.zeros(len(valores), dtype="int64")
+    minimo, maximo = finitos.min(), finitos.max()
+    ancho = (maximo - minimo) / CELDAS or 1.0
+    celdas = np.floor((valores - minimo) / ancho)
+    return np.nan_to_num(np.minimum(celdas, CELDAS - 1), nan=-1).astype("int64")
+
+
+def _estratificar(df, x, y, filas, cupo, rng):
+    """Hasta ``cupo`` posiciones de ``filas``: una por celda ocupada y el resto al azar."""
+    if len(filas) <= cupo:
+        return filas
+    celda = _celdas(df[x])[filas] * (CELDAS + 1) + _celdas(df[y])[filas]
+    # En orden de prioridad al azar, la primera fila de cada celda es su representante
+    orden = rng.permutation(len(filas))
+    representante = ~pd.Series(celda[orden]).duplicated().to_numpy()
+    return filas[np.concatenate([orden[representante], orden[~representante]])[:cupo]]
+
+
+def _mascara(df, destacar):
+    if destacar is None:
+        return np.zeros(len(df), dtype=bool)
+    return np.asarray(df[destacar] if isinstance(destacar, str) else destacar, dtype=bool)
+
+
+def reducir(df, x, y, destacar=None, maximo=None, semilla=0):
+    """Hasta ``maximo`` filas de ``df`` que conservan la forma de la nube de (``x``, ``y``).
+
+    ``destacar`` es una máscara booleana (o el nombre de una columna booleana)
+    de filas que entran antes que las demás; si solas no entran en el cupo,
+    se descartan las repetidas en el mismo (``x``, ``y``) y, si hace falta, se
+    eligen por celda como el resto. Las filas elegidas mantienen su orden
+    original.
+    """
+    maximo = MAXIMO_PUNTOS if maximo is None else maximo
+    if len(df) <= maximo:
+        return df
+    rng = np.random.default_rng(semilla)
+    fijas = _mascara(df, destacar)
+    destacadas = np.flatnonzero(fijas)
+    if len(destacadas) > maximo:
+        destacadas = destacadas[~df.iloc[destacadas].duplicated([x, y]).to_numpy()]
+        destacadas = _estratificar(df, x, y, destacadas, maximo, rng)
+    resto = _estratificar(df, x, y, np.flatnonzero(~fijas), maximo - len(destacadas), rng)
+
+    return df.iloc[np.sort(np.concatenate([destacadas, resto]))]
+
+
+def scatter(df, x, y, destacar=None, maximo=None, **kwargs):
+    """``px.scatter(df, x, y, **kwargs)``, reducido y en WebGL si ``df`` es grande."""
+    maximo = MAXIMO_PUNTOS if maximo is None else maximo
+    if len(df) <= maximo:
+        return px.scatter(df, x=x, y=y, **kwargs)
+
+    muestra = reducir(df, x, y, destacar, maximo)
+    fig = px.scatter(muestra, x=x, y=y, render_mode="webgl", **kwargs)
+    aviso = f"Se muestran {len(muestra):,} de {len(df):,} puntos".replace(",", ".")
+    if destacar is not None:
+        fijas = _mascara(df, destacar)
+        todos, mostrados = fijas.sum(), fijas[df.index.get_indexer(muestra.index)].sum()
+        if mostrados == todos:
+            aviso += ", con todos los destacados"
+        else:
+            aviso += f", {mostrados:,} de {todos:,} destacados".replace(",", ".")
+    fig.update_layout(title_subtitle_text=aviso)
+    return fig
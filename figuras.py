@@ -0,0 +1,101 @@
+"""Caché de figuras de matplotlib/seaborn ya dibujadas.
+
+Las páginas de análisis arman cada gráfico en una función que devuelve la
+figura y lo muestran con ``mostrar(nombre, construir, tablas, entradas)``. La
+primera vez se construye la figura y se dibuja a PNG (o SVG) con las mismas
+opciones que ``st.pyplot``; las siguientes, en cualquier sesión, se muestran
+los bytes guardados sin volver a calcular ni a rasterizar.
+
+La clave combina el módulo de la página, el nombre de la figura, los valores
+de los widgets que la afectan (``entradas``), la versión de las tablas de
+las que sale (``datos.version``) y el formato: si cambian los datos o el
+usuario elige otra opción, es otra figura. Las figuras se guardan en memoria,
+compartidas por el proceso, y se descartan las de uso más antiguo cuando se
+supera ``MAXIMO_BYTES`` (64 MB, o ``DATAENTERPRISE_FIGURAS_MB``).
+"""
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+import datos
+import metricas
+
+FORMATOS = ("png", "svg")
+
+# Las mismas opciones con las que st.pyplot dibuja las figuras
+OPCIONES = {"dpi": 200, "bbox_inches": "tight"}
+
+MAXIMO_BYTES = int(float(os.environ.get("DATAENTERPRISE_FIGURAS_MB", "64")) * 2**20)
+
+_cache = OrderedDict()
+_ocupado = 0
+_lock = threading.Lock()
+
+
+def rasterizar(fig, formato="png"):
+    """Bytes de la figura en ``formato``; la figura se cierra."""
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=formato, **OPCIONES)
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def _guardar(clave, contenido):
+    global _ocupado
+    if len(contenido) > MAXIMO_BYTES:
+        return
+    with _lock:
+        anterior = _cache.pop(clave, None)
+        if anterior is not None:
+            _ocupado -= len(anterior)
+        _cache[clave] = contenido
+        _ocupado += len(contenido)
+        while _ocupado > MAXIMO_BYTES:
+            _, viejo = _cache.popitem(last=False)
+            _ocupado -= len(viejo)
+
+
+def obtener(nombre, construir, tablas, entradas=(), formato="png"):
+    """Bytes de la figura ``nombre``; ``construir()`` sólo se llama si no está en caché."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de figura desconocido: {formato}")
+    clave = (construir.__module__, nombre, tuple(entradas), datos.version(*tablas), formato)
+    with _lock:
+        contenido = _cache.get(clave)
+        if contenido is not None:
+            _cache.move_to_end(clave)
+    if contenido is not None:
+        metricas.cache("figuras", "memoria")
+        return contenido
+
+    metricas.cache("figuras", "calculo")
+    with metricas.tramo(f"figuras.{nombre}", "transformacion"):
+        fig = construir()
+    with metricas.tramo("figuras.rasterizar", "render"):
+        contenido = rasterizar(fig, formato)
+    _guardar(clave, contenido)
+    return contenido
+
+
+def mostrar(nombre, construir, tablas, entradas=(), formato="png"):
+    """Muestra la figura como ``st.pyplot``, desde la caché si ya se dibujó."""
+    contenido = obtener(nombre, construir, tablas, entradas, formato)
+    st.image(contenido.decode() if formato == "svg" else contenido, width="stretch")
+
+
+def estado():
+    """Cantidad de figuras, bytes ocupados y tope, para diagnóstico."""
+    with _lock:
+        return {"figuras": len(_cache), "bytes": _ocupado, "maximo": MAXIMO_BYTES}
+
+
+def vaciar():
+    global _ocupado
+    with _lock:
+        _cache.clear()
+        _ocupado = 0
@@ -0,0 +1,343 @@
+"""Agrupamiento geográfico con distancias reales sobre la Tierra.
+
+Escalar Latitud y Longitud con ``StandardScaler`` y medir distancias
+euclídeas deforma las distancias (un grado de longitud no mide lo mismo que
+uno de latitud) y obliga a recalcular todo con cada cambio de parámetros.
+Acá los puntos (sucursales, clientes por sus coordenadas X/Y y proveedores)
+se indexan una vez por versión de los datos en un ``BallTree`` con métrica
+haversine, y al primer uso de DBSCAN se guarda la distancia de cada punto a
+sus ``MIN_SAMPLES_MAXIMO`` vecinos más cercanos: con eso se sabe qué puntos
+son núcleo para cualquier ``eps`` (en km, hasta ``radio_maximo_km``) y
+``min_samples``. Los clusters se arman uniendo núcleos con consultas por
+radio al árbol, por bloques de a lo sumo ``ARISTAS_POR_BLOQUE`` pares, así
+que la memoria no crece con el cuadrado de la cantidad de puntos aunque los
+clientes estén concentrados. Las últimas ``DBSCAN_GUARDADOS`` etiquetas de
+cada conjunto quedan en memoria.
+
+Los proveedores no tienen coordenadas propias: se ubican en la mediana de los
+clientes y sucursales de su ciudad o, si no hay, de su provincia.
+
+El mismo índice de sucursales sirve para la proximidad logística:
+``asignar()`` busca en bloque las k sucursales más cercanas a cada cliente o
+proveedor, con la distancia en km, y ``area_de_influencia()`` resume por
+sucursal los clientes que tiene más cerca. Las asignaciones se guardan por
+versión de los datos en memoria y en ``.cache_datos/geografia``.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import datos
+import metricas
+
+RADIO_TIERRA_KM = 6371.0088
+
+# Conjunto de puntos -> tablas de las que sale y eps máximo (km) de DBSCAN
+CONJUNTOS = {
+    "sucursales": {"tablas": ("sucursales",), "radio_maximo_km": 1000.0},
+    "clientes": {"tablas": ("clientes",), "radio_maximo_km": 20.0},
+    "proveedores": {"tablas": ("proveedores", "clientes", "sucursales"), "radio_maximo_km": 1000.0},
+}
+
+# Vecinos más cercanos (incluido el propio punto) que se guardan por punto:
+# acota el min_samples de DBSCAN
+MIN_SAMPLES_MAXIMO = 10
+
+# Pares de núcleos por consulta al unir clusters de DBSCAN (acota la memoria)
+ARISTAS_POR_BLOQUE = 2_000_000
+
+# Resultados de DBSCAN (eps, min_samples) que se guardan por conjunto
+DBSCAN_GUARDADOS = 16
+
+# Sucursales más cercanas que se guardan por punto
+K_SUCURSALES = 3
+
+# Puntos por consulta al árbol al asignar sucursales (acota la memoria)
+BLOQUE = 500_000
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _normalizar(textos):
+    return textos.astype(str).str.strip().str.lower()
+
+
+def ubicar_proveedores():
+    """Id, Nombre, Latitud, Longitud y Ubicacion (ciudad o provincia) de cada proveedor."""
+    proveedores = datos.load_proveedores(columnas=["IDProveedor", "Nombre", "City", "State"])
+    clientes = datos.load_clientes(columnas=["Localidad", "Provincia", "X", "Y"])
+    sucursales = datos.load_sucursales(columnas=["Localidad", "Provincia", "Latitud", "Longitud"])
+    referencias = pd.concat([
+        clientes.rename(columns={"Y": "Latitud", "X": "Longitud"}), sucursales,
+    ], ignore_index=True).dropna(subset=["Latitud", "Longitud"])
+
+    resultado = pd.DataFrame({"Id": proveedores["IDProveedor"], "Nombre": proveedores["Nombre"]})
+    resultado[["Latitud", "Longitud"]] = np.nan
+    resultado["Ubicacion"] = None
+    for nivel, columna_referencia, columna_proveedor in (
+        ("ciudad", "Localidad", "City"), ("provincia", "Provincia", "State"),
+    ):
+        # Mediana y no promedio: algunos clientes tienen las coordenadas invertidas
+        centros = referencias.groupby(_normalizar(referencias[columna_referencia]))[["Latitud", "Longitud"]].median()
+        faltan = resultado["Latitud"].isna().to_numpy()
+        claves = _normalizar(proveedores[columna_proveedor])[faltan]
+        encontrados = centros.reindex(claves)
+        resultado.loc[faltan, "Latitud"] = encontrados["Latitud"].to_numpy()
+        resultado.loc[faltan, "Longitud"] = encontrados["Longitud"].to_numpy()
+        resultado.loc[faltan & resultado["Latitud"].notna().to_numpy(), "Ubicacion"] = nivel
+    return resultado
+
+
+def _leer_puntos(conjunto):
+    if conjunto == "sucursales":
+        df = datos.load_sucursales(columnas=["ID", "Sucursal", "Latitud", "Longitud"])
+        df = df.rename(columns={"ID": "Id", "Sucursal": "Nombre"})
+    elif conjunto == "clientes":
+        df = datos.load_clientes(columnas=["ID", "Nombre_y_Apellido", "Y", "X"])
+        df = df.rename(columns={"ID": "Id", "Nombre_y_Apellido": "Nombre", "Y": "Latitud", "X": "Longitud"})
+    elif conjunto == "proveedores":
+        df = ubicar_proveedores()
+    else:
+        raise KeyError(f"Conjunto de puntos desconocido: {conjunto}")
+    return df.dropna(subset=["Latitud", "Longitud"]).reset_index(drop=True)
+
+
+def radianes(puntos):
+    return np.radians(puntos[["Latitud", "Longitud"]].to_numpy(dtype="float64"))
+
+
+def cartesianas(puntos):
+    """Puntos sobre la esfera unitaria (x, y, z): la distancia euclídea sigue a la real."""
+    latitud, longitud = radianes(puntos).T
+    return np.column_stack([
+        np.cos(latitud) * np.cos(longitud),
+        np.cos(latitud) * np.sin(longitud),
+        np.sin(latitud),
+    ])
+
+
+def _construir(conjunto):
+    from sklearn.neighbors import BallTree
+
+    puntos = _leer_puntos(conjunto)
+    return {"puntos": puntos, "arbol": BallTree(radianes(puntos), metric="haversine")}
+
+
+def _construir_vecinos(puntos, arbol):
+    k = min(MIN_SAMPLES_MAXIMO, len(puntos))
+    distancias, _ = arbol.query(radianes(puntos), k=k)
+    return distancias
+
+
+def indice(conjunto):
+    """Puntos y ``BallTree`` haversine del conjunto, por versión de los datos."""
+    if conjunto not in CONJUNTOS:
+        raise KeyError(f"Conjunto de puntos desconocido: {conjunto}")
+    with metricas.tramo(f"geografia.{conjunto}", "carga"), _lock:
+        actual = datos.version(*CONJUNTOS[conjunto]["tablas"])
+        en_cache = _cache.get(conjunto)
+        if en_cache is None or en_cache[0] != actual:
+            metricas.cache("geografia", "calculo")
+            en_cache = (actual, _construir(conjunto))
+            _cache[conjunto] = en_cache
+        else:
+            metricas.cache("geografia", "memoria")
+    return en_cache[1]
+
+
+def vecinos(conjunto):
+    """Distancias (radianes) de cada punto a sus ``MIN_SAMPLES_MAXIMO`` vecinos más cercanos.
+
+    La primera columna es el propio punto. Se calcula la primera vez que se
+    pide, porque asignar sucursales no lo necesita.
+    """
+    actual = indice(conjunto)
+    with _lock:
+        if "vecinos" not in actual:
+            actual["vecinos"] = _construir_vecinos(actual["puntos"], actual["arbol"])
+    return actual["vecinos"]
+
+
+def puntos(conjunto):
+    return indice(conjunto)["puntos"].copy()
+
+
+def _bloques(cuentas):
+    """Límites de bloques consecutivos con a lo sumo ``ARISTAS_POR_BLOQUE`` pares cada uno."""
+    acumulado = np.cumsum(cuentas)
+    cortes = np.searchsorted(acumulado, np.arange(ARISTAS_POR_BLOQUE, acumulado[-1], ARISTAS_POR_BLOQUE), side="right")
+    return np.unique(np.concatenate([[0], cortes, [len(cuentas)]]))
+
+
+def _etiquetar(coordenadas, distancias_vecinos, eps_km, min_samples):
+    from scipy.sparse.csgraph import connected_components
+    from sklearn.neighbors import BallTree
+
+    total = len(coordenadas)
+    radio = eps_km / RADIO_TIERRA_KM
+    etiquetas = np.full(total, -1, dtype="int64")
+    if min_samples > distancias_vecinos.shape[1]:
+        return etiquetas
+    # Núcleo: su min_samples-ésimo vecino (contando el propio punto) está a menos de eps
+    nucleo = distancias_vecinos[:, min_samples - 1] <= radio
+    posiciones = np.flatnonzero(nucleo)
+    if not len(posiciones):
+        return etiquetas
+    arbol = BallTree(coordenadas[posiciones], metric="haversine")
+
+    # Componentes conexas entre núcleos, por bloques: cada bloque se une a la
+    # partición acumulada (cada núcleo enlazado al representante de su componente)
+    cantidad = len(posiciones)
+    representante = componente = np.arange(cantidad)
+    limites = _bloques(arbol.query_radius(coordenadas[posiciones], r=radio, count_only=True))
+    for inicio, fin in zip(limites[:-1], limites[1:]):
+        cercanos = arbol.query_radius(coordenadas[posiciones[inicio:fin]], r=radio)
+        largos = np.fromiter((len(c) for c in cercanos), dtype="int64", count=len(cercanos))
+        origen = representante[np.repeat(np.arange(inicio, fin), largos)]
+        destino = representante[np.concatenate(cercanos)]
+        distintos = origen != destino
+        filas = np.concatenate([np.arange(cantidad), origen[distintos]])
+        columnas = np.concatenate([representante, destino[distintos]])
+        enlaces = sparse.coo_matrix((np.ones(len(filas), dtype="int8"), (filas, columnas)), shape=(cantidad, cantidad))
+        _, componente = connected_components(enlaces, directed=False)
+        representante = np.unique(componente, return_index=True)[1][componente]
+
+    # Las componentes se numeran por su punto de menor índice, igual que sklearn
+    etiquetas[posiciones] = np.unique(componente, return_inverse=True)[1]
+
+    # Cada punto de borde queda en el primer cluster que lo alcanza; al no ser
+    # núcleo tiene menos de min_samples vecinos, así que la consulta es chica
+    otros = np.flatnonzero(~nucleo)
+    if len(otros):
+        cercanos = arbol.query_radius(coordenadas[otros], r=radio)
+        largos = np.fromiter((len(c) for c in cercanos), dtype="int64", count=len(cercanos))
+        primera = np.full(total, np.iinfo("int64").max)
+        np.minimum.at(primera, np.repeat(otros, largos), etiquetas[posiciones[np.concatenate(cercanos)]])
+        alcanzados = primera < np.iinfo("int64").max
+        etiquetas[alcanzados] = primera[alcanzados]
+    return etiquetas
+
+
+def dbscan(conjunto, eps_km, min_samples):
+    """Etiquetas de DBSCAN (-1: ruido) para ``puntos(conjunto)``, con eps en km.
+
+    Da las mismas etiquetas que ``sklearn.cluster.DBSCAN`` con métrica
+    haversine: los núcleos son los puntos con ``min_samples`` vecinos a menos
+    de ``eps_km`` (incluido el propio), los clusters son las componentes
+    conexas entre núcleos y cada punto de borde queda en el primer cluster
+    que lo alcanza.
+    """
+    radio = CONJUNTOS[conjunto]["radio_maximo_km"]
+    if eps_km > radio:
+        raise ValueError(f"eps no puede superar {radio:g} km para {conjunto}")
+    if not 1 <= min_samples <= MIN_SAMPLES_MAXIMO:
+        raise ValueError(f"min_samples tiene que estar entre 1 y {MIN_SAMPLES_MAXIMO}")
+    distancias_vecinos = vecinos(conjunto)
+    actual = indice(conjunto)
+    clave = (float(eps_km), int(min_samples))
+    with _lock:
+        guardados = actual.setdefault("dbscan", OrderedDict())
+        etiquetas = guardados.get(clave)
+        if etiquetas is not None:
+            guardados.move_to_end(clave)
+    if etiquetas is None:
+        etiquetas = _etiquetar(radianes(actual["puntos"]), distancias_vecinos, eps_km, min_samples)
+        with _lock:
+            guardados[clave] = etiquetas
+            while len(guardados) > DBSCAN_GUARDADOS:
+                guardados.popitem(last=False)
+    return etiquetas.copy()
+
+
+def kmeans(conjunto, k):
+    """Etiquetas de KMeans sobre las coordenadas en la esfera unitaria."""
+    from sklearn.cluster import KMeans
+    from modelos import ajustar
+
+    modelo = ajustar(KMeans(n_clusters=k, random_state=42, n_init=10), cartesianas(indice(conjunto)["puntos"]))
+    return modelo.labels_
+
+
+# -----------------------------
+# PROXIMIDAD A SUCURSALES
+# -----------------------------
+def _construir_asignacion(conjunto, k):
+    sucursales = indice("sucursales")
+    origen = indice(conjunto)["puntos"]
+    k = min(k, len(sucursales["puntos"]))
+    coordenadas = radianes(origen)
+
+    distancias, posiciones = [], []
+    for inicio in range(0, len(coordenadas), BLOQUE):
+        d, p = sucursales["arbol"].query(coordenadas[inicio:inicio + BLOQUE], k=k)
+        distancias.append(d)
+        posiciones.append(p)
+    distancias = np.concatenate(distancias) if distancias else np.empty((0, k))
+    posiciones = np.concatenate(posiciones) if posiciones else np.empty((0, k), dtype="int64")
+
+    elegidas = sucursales["puntos"].iloc[posiciones.ravel()]
+    return pd.DataFrame({
+        "Id": np.repeat(origen["Id"].to_numpy(), k),
+        "Nombre": np.repeat(origen["Nombre"].to_numpy(), k),
+        "Rango": np.tile(np.arange(1, k + 1), len(origen)),
+        "IdSucursal": elegidas["Id"].to_numpy(),
+        "Sucursal": elegidas["Nombre"].to_numpy(),
+        "DistanciaKm": distancias.ravel() * RADIO_TIERRA_KM,
+    })
+
+
+def ruta_asignacion(conjunto, k, version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "geografia", f"{conjunto}-k{k}-{version}.parquet")
+
+
+@metricas.medido("geografia.asignar", "carga")
+def asignar(conjunto, k=K_SUCURSALES):
+    """Las ``k`` sucursales más cercanas a cada cliente o proveedor.
+
+    Una fila por punto y rango (1 = la más cercana) con Id, Nombre,
+    IdSucursal, Sucursal y DistanciaKm.
+    """
+    if conjunto == "sucursales" or conjunto not in CONJUNTOS:
+        raise KeyError(f"No se asignan sucursales a: {conjunto}")
+    with _lock:
+        actual = datos.version(*set(CONJUNTOS[conjunto]["tablas"] + CONJUNTOS["sucursales"]["tablas"]))
+        en_cache = _cache.get(("asignacion", conjunto, k))
+    if en_cache is None or en_cache[0] != actual:
+        destino = ruta_asignacion(conjunto, k, actual)
+        if datos.HAY_PARQUET and os.path.exists(destino):
+            metricas.cache("asignacion", "disco")
+            tabla = pd.read_parquet(destino)
+        else:
+            metricas.cache("asignacion", "calculo")
+            tabla = _construir_asignacion(conjunto, k)
+            if datos.HAY_PARQUET:
+                datos.escribir_parquet(tabla, destino, reemplaza=f"{conjunto}-k{k}-*.parquet")
+        en_cache = (actual, tabla)
+        with _lock:
+            _cache[("asignacion", conjunto, k)] = en_cache
+    else:
+        metricas.cache("asignacion", "memoria")
+    return en_cache[1].copy(deep=False)
+
+
+def area_de_influencia(conjunto="clientes"):
+    """Por sucursal: cuántos puntos la tienen como la más cercana y a qué distancia (km)."""
+    cercanas = asignar(conjunto, k=1)
+    resumen = cercanas.groupby(["IdSucursal", "Sucursal"], sort=False)["DistanciaKm"].agg(
+        Cantidad="size",
+        DistanciaMedia="mean",
+        DistanciaMediana="median",
+        DistanciaP90=lambda d: d.quantile(0.9),
+        DistanciaMaxima="max",
+    ).reset_index()
+    # Sucursales que no son las más cercanas de ningún punto
+    sucursales = indice("sucursales")["puntos"][["Id", "Nombre"]].rename(columns={"Id": "IdSucursal", "Nombre": "Sucursal"})
+    resumen = sucursales.merge(resumen, on=["IdSucursal", "Sucursal"], how="left")
+    resumen["Cantidad"] = resumen["Cantidad"].fillna(0).astype("int64")
+    resumen["Participacion"] = resumen["Cantidad"] / max(len(cercanas), 1)
+    return resumen.sort_values("Cantidad", ascending=False, ignore_index=True)
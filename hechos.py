@@ -0,0 +1,130 @@
+"""Tabla de hechos de ventas ya enriquecida con sus dimensiones.
+
+En lugar de repetir en cada página los ``merge`` de ventas con productos,
+canales, sucursales, clientes y empleados, ``hechos_ventas()`` arma una sola
+vez por versión de datos un DataFrame con todas esas columnas. Las
+dimensiones se resuelven por posición sobre un índice de su clave entera, sin
+``merge``, así que la tabla conserva exactamente una fila por venta.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+import datos
+import metricas
+
+TABLAS = ("ventas", "productos", "canal", "sucursales", "clientes", "empleados")
+
+GRUPOS_EDAD = {"bins": [0, 20, 35, 50, 100], "labels": ["≤20", "21-35", "36-50", ">50"]}
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _posiciones(claves, dimension, clave_dimension):
+    """Fila de ``dimension`` que corresponde a cada clave (-1 si no existe).
+
+    Si la dimensión repite una clave se usa su primera aparición.
+    """
+    if isinstance(clave_dimension, str):
+        indice = pd.Index(dimension[clave_dimension])
+    else:
+        indice = pd.MultiIndex.from_frame(dimension[clave_dimension])
+    primeras = ~indice.duplicated(keep="first")
+    pos = indice[primeras].get_indexer(claves)
+    return np.where(pos >= 0, np.flatnonzero(primeras)[pos], -1)
+
+
+def _tomar(serie, posiciones):
+    """Equivalente a un left join de una columna, a partir de posiciones."""
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        codigos = np.where(posiciones >= 0, serie.cat.codes.to_numpy()[posiciones], -1)
+        return pd.Categorical.from_codes(codigos, dtype=serie.dtype).remove_unused_categories()
+    valores = serie.to_numpy()
+    if posiciones.min(initial=0) >= 0:
+        return valores[posiciones]
+    if valores.dtype.kind in "iu":
+        valores = valores.astype("float32")
+    resultado = valores[posiciones]
+    resultado[posiciones < 0] = np.nan if valores.dtype.kind == "f" else None
+    return resultado
+
+
+def _construir():
+    ventas = datos.load_ventas()
+    productos = datos.load_productos()
+    canal = datos.load_canal()
+    sucursales = datos.load_sucursales()
+    clientes = datos.load_clientes()
+    empleados = datos.load_empleados()
+
+    hechos = ventas.copy()
+
+    # Producto
+    pos = _posiciones(ventas["IdProducto"], productos, "ID_PRODUCTO")
+    hechos["Concepto"] = pd.Categorical(_tomar(productos["Concepto"], pos))
+    hechos["Tipo"] = _tomar(productos["Tipo"], pos)
+    hechos["PrecioLista"] = _tomar(productos["Precio"], pos)
+
+    # Canal y sucursal
+    pos = _posiciones(ventas["IdCanal"], canal, "CODIGO")
+    hechos["Canal"] = _tomar(canal["DESCRIPCION"], pos)
+    pos = _posiciones(ventas["IdSucursal"], sucursales, "ID")
+    hechos["Sucursal"] = pd.Categorical(_tomar(sucursales["Sucursal"], pos))
+
+    # Cliente
+    pos = _posiciones(ventas["IdCliente"], clientes, "ID")
+    hechos["Edad"] = _tomar(clientes["Edad"], pos)
+    hechos["Edad_grupo"] = pd.cut(hechos["Edad"], **GRUPOS_EDAD)
+
+    # Empleado: los ids se repiten entre sucursales, así que primero se busca
+    # el par (id, sucursal de la venta) y, si no aparece, sólo el id.
+    empleados = empleados.assign(Sucursal=empleados["Sucursal"].astype(str))
+    claves = pd.MultiIndex.from_arrays([ventas["IdEmpleado"], hechos["Sucursal"].astype(str)])
+    pos = _posiciones(claves, empleados, ["ID_empleado", "Sucursal"])
+    faltantes = pos < 0
+    pos[faltantes] = _posiciones(ventas["IdEmpleado"][faltantes], empleados, "ID_empleado")
+    hechos["EmpleadoNombre"] = pd.Categorical(_tomar(empleados["Nombre"], pos))
+    hechos["EmpleadoApellido"] = pd.Categorical(_tomar(empleados["Apellido"], pos))
+    hechos["EmpleadoSucursal"] = pd.Categorical(_tomar(empleados["Sucursal"], pos))
+    hechos["Salario"] = _tomar(empleados["Salario"], pos)
+
+    hechos["Ingreso"] = hechos["Precio"] * hechos["Cantidad"]
+    return hechos
+
+
+def ruta_persistida(version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "hechos", f"ventas-{version}.parquet")
+
+
+def hechos_ventas(columnas=None):
+    """Ventas enriquecidas, construidas una vez por versión de los datos.
+
+    Además de las columnas de ventas incluye Concepto, Tipo, PrecioLista,
+    Canal, Sucursal, Edad, Edad_grupo, EmpleadoNombre, EmpleadoApellido,
+    EmpleadoSucursal, Salario e Ingreso (Precio * Cantidad).
+    """
+    with metricas.tramo("hechos.ventas", "carga"), _lock:
+        actual = datos.version(*TABLAS)
+        en_cache = _cache.get("ventas")
+        if en_cache is None or en_cache[0] != actual:
+            destino = ruta_persistida(actual)
+            if datos.HAY_PARQUET and os.path.exists(destino):
+                metricas.cache("hechos", "disco")
+                hechos = pd.read_parquet(destino)
+            else:
+                metricas.cache("hechos", "calculo")
+                hechos = _construir()
+                if datos.HAY_PARQUET:
+                    datos.escribir_parquet(hechos, destino, reemplaza="ventas-*.parquet")
+            en_cache = (actual, hechos)
+            _cache["ventas"] = en_cache
+        else:
+            metricas.cache("hechos", "memoria")
+
+    hechos = en_cache[1]
+    if columnas is not None:
+        hechos = hechos[list(columnas)]
+    return hechos.copy(deep=False)
@@ -0,0 +1,313 @@
+"""Informes estáticos de los análisis, generados sin abrir la app.
+
+``python informes.py`` recorre las páginas de "Análisis exploratorio" y
+"Análisis cruzado" del registro (``paginas.PAGINAS``) y ejecuta el mismo
+``mostrar()`` que usa la app, pero fuera de Streamlit y repartido en varios
+procesos: los gráficos de matplotlib se guardan como PNG, los de Plotly y los
+mapas (folium incluido) como HTML, las tablas como HTML, y cada página queda en un
+``index.html`` con sus textos y figuras. Los widgets toman su valor inicial,
+como al abrir la página por primera vez.
+
+Antes de repartir las páginas se calculan (o se leen de disco) las tablas y
+agregados que declaran, así que cada proceso sólo lee las copias ya
+guardadas en ``.cache_datos``. ``informes/ultimo.json`` apunta siempre a la
+última tanda completa: la sección "Informes" de la app la muestra desde ahí
+(``ultimo()`` y ``bloques()``) sin volver a ejecutar las páginas, y avisa si
+los datos cambiaron desde que se generó.
+
+Uso típico, por la noche::
+
+    python informes.py                                   # informes/AAAA-MM-DD/
+    python informes.py --secciones "Análisis cruzado" --procesos 4
+"""
+import argparse
+import html
+import json
+import multiprocessing
+import os
+import re
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import datos
+
+SECCIONES = ("Análisis exploratorio", "Análisis cruzado")
+
+DIRECTORIO = os.path.join(datos.DIRECTORIO_DATOS, "informes")
+
+
+def nombre_archivo(texto):
+    """Texto apto para nombre de carpeta: sin acentos, emojis ni espacios."""
+    ascii_ = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", ascii_.lower()).strip("-") or "pagina"
+
+
+class _Captura:
+    """Reemplaza las salidas de Streamlit por archivos dentro de ``carpeta``."""
+
+    def __init__(self, carpeta):
+        self.carpeta = carpeta
+        self.bloques = []
+        self.errores = []
+
+    def _archivo(self, extension):
+        nombre = f"{len(self.bloques) + 1:02d}.{extension}"
+        return nombre, os.path.join(self.carpeta, nombre)
+
+    def texto(self, cuerpo="", *args, **kwargs):
+        import pandas as pd
+
+        if isinstance(cuerpo, (pd.DataFrame, pd.Series)):
+            return self.tabla(cuerpo)
+        self.bloques.append(("texto", str(cuerpo)))
+
+    def titulo(self, cuerpo="", *args, **kwargs):
+        self.bloques.append(("titulo", str(cuerpo)))
+
+    def error(self, cuerpo="", *args, **kwargs):
+        self.errores.append(str(cuerpo))
+        self.bloques.append(("error", str(cuerpo)))
+
+    def pyplot(self, fig=None, *args, **kwargs):
+        import matplotlib.pyplot as plt
+
+        fig = fig or plt.gcf()
+        nombre, ruta = self._archivo("png")
+        fig.savefig(ruta, dpi=110, bbox_inches="tight")
+        plt.close(fig)
+        self.bloques.append(("imagen", nombre))
+
+    def imagen(self, contenido, *args, **kwargs):
+        # Las figuras de ``figuras.mostrar`` llegan ya dibujadas: bytes PNG o texto SVG
+        svg = isinstance(contenido, str)
+        nombre, ruta = self._archivo("svg" if svg else "png")
+        with open(ruta, "wb") as archivo:
+            archivo.write(contenido.encode("utf-8") if svg else contenido)
+        self.bloques.append(("imagen", nombre))
+
+    def plotly_chart(self, fig, *args, **kwargs):
+        nombre, ruta = self._archivo("html")
+        fig.write_html(ruta, include_plotlyjs="cdn")
+        self.bloques.append(("html", nombre))
+
+    def html(self, cuerpo, *args, **kwargs):
+        nombre, ruta = self._archivo("html")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(cuerpo)
+        self.bloques.append(("html", nombre))
+
+    def folium(self, mapa, *args, **kwargs):
+        nombre, ruta = self._archivo("html")
+        mapa.save(ruta)
+        self.bloques.append(("html", nombre))
+
+    def tabla(self, datos_tabla=None, *args, **kwargs):
+        import pandas as pd
+
+        self.bloques.append(("tabla", pd.DataFrame(datos_tabla).to_html(border=0, max_rows=200)))
+
+    def instalar(self):
+        import streamlit as st
+        import streamlit.components.v1 as components
+        import streamlit_folium
+
+        for nombre in ("markdown", "write", "text", "caption", "info", "success", "warning"):
+            setattr(st, nombre, self.texto)
+        for nombre in ("title", "header", "subheader"):
+            setattr(st, nombre, self.titulo)
+        st.error = self.error
+        st.pyplot = self.pyplot
+        st.image = self.imagen
+        st.plotly_chart = self.plotly_chart
+        st.dataframe = st.table = self.tabla
+        components.html = self.html
+        # Las páginas importan ``st_folium`` por nombre, así que se reemplaza antes de importarlas
+        streamlit_folium.st_folium = streamlit_folium.folium_static = self.folium
+
+
+def _escribir_pagina(carpeta, seccion, titulo, bloques):
+    partes = [f"<h1>{html.escape(titulo)}</h1>", f"<p><em>{html.escape(seccion)}</em></p>"]
+    for tipo, contenido in bloques:
+        if tipo == "titulo":
+            partes.append(f"<h2>{html.escape(contenido)}</h2>")
+        elif tipo == "texto" and contenido.lstrip().startswith("#"):
+            # Los títulos en markdown ("### ...") de las páginas
+            partes.append(f"<h3>{html.escape(contenido.strip().lstrip('#').strip())}</h3>")
+        elif tipo == "texto":
+            partes.append(f'<div class="texto">{html.escape(contenido)}</div>')
+        elif tipo == "error":
+            partes.append(f'<div class="error">{html.escape(contenido)}</div>')
+        elif tipo == "imagen":
+            partes.append(f'<img src="{contenido}">')
+        elif tipo == "html":
+            partes.append(f'<iframe src="{contenido}" width="100%" height="620"></iframe>')
+        else:
+            partes.append(contenido)
+    _escribir_html(os.path.join(carpeta, "index.html"), titulo, "\n".join(partes))
+
+
+def _escribir_html(ruta, titulo, cuerpo):
+    estilo = (
+        "body{font-family:sans-serif;max-width:1100px;margin:auto;padding:1em}"
+        ".texto{white-space:pre-wrap;margin:.5em 0}.error{color:#b00}"
+        "img{max-width:100%}table{border-collapse:collapse;font-size:.85em}td,th{padding:2px 6px}"
+    )
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write(
+            f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{html.escape(titulo)}</title>'
+            f"<style>{estilo}</style></head><body>\n{cuerpo}\n</body></html>\n"
+        )
+
+
+def renderizar(seccion, titulo, carpeta):
+    """Ejecuta una página fuera de Streamlit y guarda sus salidas en ``carpeta``."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import streamlit.config
+    import streamlit.logger
+    import paginas
+
+    # Fuera de ``streamlit run`` cada widget avisa que no hay sesión; acá es lo esperado.
+    # La configuración se lee antes, porque al leerla vuelve a fijar el nivel de log.
+    streamlit.config.get_config_options()
+    streamlit.logger.set_log_level("error")
+
+    inicio = time.perf_counter()
+    os.makedirs(carpeta, exist_ok=True)
+    captura = _Captura(carpeta)
+    captura.instalar()
+    try:
+        paginas.cargar(paginas.buscar(seccion, titulo)).mostrar()
+    except Exception as e:
+        captura.error(f"{type(e).__name__}: {e}")
+    _escribir_pagina(carpeta, seccion, titulo, captura.bloques)
+    # Los mismos bloques, para que la app los vuelva a mostrar sin ejecutar la página
+    with open(os.path.join(carpeta, "bloques.json"), "w", encoding="utf-8") as archivo:
+        json.dump(captura.bloques, archivo, ensure_ascii=False)
+    return {
+        "seccion": seccion,
+        "titulo": titulo,
+        "carpeta": carpeta,
+        "figuras": sum(tipo in ("imagen", "html") for tipo, _ in captura.bloques),
+        "errores": captura.errores,
+        "segundos": round(time.perf_counter() - inicio, 3),
+    }
+
+
+def _precalcular(lista):
+    """Tablas y agregados de las páginas, calculados una vez y guardados en disco."""
+    import precarga
+
+    requisitos = []
+    for _, pagina in lista:
+        requisitos += [r for r in pagina["tablas"] + pagina["agregados"] if r not in requisitos]
+    for requisito in requisitos:
+        precarga._cargar(requisito)
+    return requisitos
+
+
+def generar(secciones=SECCIONES, destino=None, procesos=None):
+    """Genera los informes de ``secciones`` en ``destino`` y devuelve el manifiesto."""
+    import streamlit.config
+    import streamlit.logger
+    import paginas
+
+    # Fuera de ``streamlit run`` cada widget avisa que no hay sesión; acá es lo esperado.
+    # La configuración se lee antes, porque al leerla vuelve a fijar el nivel de log.
+    streamlit.config.get_config_options()
+    streamlit.logger.set_log_level("error")
+
+    inicio = time.perf_counter()
+    destino = os.path.abspath(destino or os.path.join(DIRECTORIO, time.strftime("%Y-%m-%d")))
+    lista = [(seccion, pagina) for seccion in secciones for pagina in paginas.PAGINAS[seccion]]
+    _precalcular(lista)
+    tareas = [
+        (seccion, pagina["titulo"], os.path.join(destino, nombre_archivo(seccion), nombre_archivo(pagina["titulo"])))
+        for seccion, pagina in lista
+    ]
+
+    procesos = procesos or os.cpu_count() or 1
+    if procesos == 1:
+        resultados = [renderizar(*tarea) for tarea in tareas]
+    else:
+        # spawn: cada proceso arranca limpio y reemplaza las salidas de su propio streamlit
+        pool = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context("spawn"))
+        with pool:
+            resultados = list(pool.map(renderizar, *zip(*tareas)))
+
+    manifiesto = {
+        "generado": time.strftime("%Y-%m-%d %H:%M:%S"),
+        # De todas las tablas: los agregados salen de tablas que las páginas no declaran
+        "version_datos": datos.version(),
+        "segundos": round(time.perf_counter() - inicio, 3),
+        "paginas": [dict(r, carpeta=os.path.relpath(r["carpeta"], destino)) for r in resultados],
+    }
+    with open(os.path.join(destino, "manifiesto.json"), "w", encoding="utf-8") as archivo:
+        json.dump(manifiesto, archivo, indent=2, ensure_ascii=False)
+
+    filas = [
+        f'<li><a href="{r["carpeta"]}/index.html">{html.escape(r["seccion"])} / {html.escape(r["titulo"])}</a>'
+        f' ({r["figuras"]} figuras{", con errores" if r["errores"] else ""})</li>'
+        for r in manifiesto["paginas"]
+    ]
+    _escribir_html(
+        os.path.join(destino, "index.html"), "Informes DataEnterprise",
+        f"<h1>Informes DataEnterprise</h1><p>{manifiesto['generado']}</p><ul>\n" + "\n".join(filas) + "\n</ul>",
+    )
+
+    # Puntero a la última tanda completa
+    os.makedirs(DIRECTORIO, exist_ok=True)
+    temporal = os.path.join(DIRECTORIO, f"ultimo.json.{os.getpid()}.tmp")
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump({"directorio": destino, "generado": manifiesto["generado"]}, archivo, indent=2)
+    os.replace(temporal, os.path.join(DIRECTORIO, "ultimo.json"))
+    return manifiesto
+
+
+def ultimo():
+    """Manifiesto de la última tanda completa, con su ``directorio``; None si no hay."""
+    try:
+        with open(os.path.join(DIRECTORIO, "ultimo.json"), encoding="utf-8") as archivo:
+            directorio = json.load(archivo)["directorio"]
+        with open(os.path.join(directorio, "manifiesto.json"), encoding="utf-8") as archivo:
+            manifiesto = json.load(archivo)
+    except (OSError, ValueError, KeyError):
+        return None
+    manifiesto["directorio"] = directorio
+    return manifiesto
+
+
+def vigente(manifiesto):
+    """Si los datos son los mismos con los que se generó la tanda."""
+    return manifiesto.get("version_datos") == datos.version()
+
+
+def bloques(manifiesto, pagina):
+    """Bloques (tipo, contenido) guardados de una página; los archivos, con su ruta completa."""
+    carpeta = os.path.join(manifiesto["directorio"], pagina["carpeta"])
+    try:
+        with open(os.path.join(carpeta, "bloques.json"), encoding="utf-8") as archivo:
+            guardados = json.load(archivo)
+    except (OSError, ValueError):
+        return []
+    return [
+        (tipo, os.path.join(carpeta, contenido) if tipo in ("imagen", "html") else contenido)
+        for tipo, contenido in guardados
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera los informes de análisis como PNG y HTML")
+    parser.add_argument("--secciones", nargs="*", default=list(SECCIONES), choices=list(SECCIONES))
+    parser.add_argument("--destino", default=None, help="Carpeta de salida (por defecto informes/AAAA-MM-DD)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos en paralelo (por defecto, uno por CPU)")
+    args = parser.parse_args()
+
+    manifiesto = generar(args.secciones, args.destino, args.procesos)
+    figuras = sum(p["figuras"] for p in manifiesto["paginas"])
+    con_errores = [p["titulo"] for p in manifiesto["paginas"] if p["errores"]]
+    print(f"{len(manifiesto['paginas'])} páginas, {figuras} figuras, {manifiesto['segundos']:.1f}s")
+    if con_errores:
+        print(f"Páginas con errores: {', '.join(con_errores)}")
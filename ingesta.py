@@ -0,0 +1,183 @@
+"""Ingesta incremental de ventas, compras y gastos.
+
+Los extractos de estas tablas sólo crecen por el final (``datos.INCREMENTALES``
+da la clave creciente de cada una). Para cada tabla se guarda un manifiesto
+con el byte del CSV hasta donde ya se leyó y el último id visto; una
+actualización lee únicamente los bytes nuevos, descarta las filas con id ya
+visto, las agrega como una parte Parquet más al almacén columnar y suma su
+agregado a los cubos de ``cubo.py`` (mensual, totales por sucursal y por
+empleado, gastos por sucursal) sin recorrer lo que ya estaba. Los gastos nuevos
+y las ventas nuevas además se puntúan con los modelos de ``anomalias.py`` ya
+ajustados.
+
+Si el archivo cambió en otro lugar que no sea el final (se achicó o cambiaron
+los últimos bytes ya leídos) se vuelve a armar el almacén desde cero.
+
+Uso típico, después de cada descarga diaria::
+
+    python ingesta.py            # todas las tablas
+    python ingesta.py ventas
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+
+import datos
+import cubo
+import anomalias
+
+# Bytes finales ya leídos que se comparan para confirmar que el archivo sólo creció
+COLA = 1 << 16
+
+
+def ruta_manifiesto(tabla):
+    return os.path.join(datos.ruta_ingesta(tabla), "manifiesto.json")
+
+
+def leer_manifiesto(tabla):
+    if not os.path.exists(ruta_manifiesto(tabla)):
+        return None
+    with open(ruta_manifiesto(tabla), encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def _guardar_manifiesto(tabla, estado):
+    destino = ruta_manifiesto(tabla)
+    temporal = f"{destino}.{os.getpid()}.tmp"
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(estado, archivo, indent=2)
+    os.replace(temporal, destino)
+
+
+def _hash_cola(archivo, fin):
+    inicio = max(0, fin - COLA)
+    archivo.seek(inicio)
+    return hashlib.sha1(archivo.read(fin - inicio)).hexdigest()
+
+
+def _solo_crecio(tabla, estado):
+    """True si el CSV conserva intactos los bytes ya ingeridos."""
+    if estado is None or estado.get("esquema") != datos.hash_esquema(tabla):
+        return False
+    if datos.firma(tabla)[1] < estado["offset"]:
+        return False
+    with open(datos.ruta(tabla), "rb") as archivo:
+        return _hash_cola(archivo, estado["offset"]) == estado["cola"]
+
+
+def _leer_bloque(tabla, desde):
+    """Bytes desde ``desde`` hasta la última línea completa del CSV."""
+    with open(datos.ruta(tabla), "rb") as archivo:
+        archivo.seek(desde)
+        bloque = archivo.read()
+    return bloque[: bloque.rfind(b"\n") + 1]
+
+
+def _escribir_parte(tabla, estado, df):
+    nombre = f"parte-{len(estado['partes']):05d}.parquet"
+    datos.escribir_parquet(df, os.path.join(datos.ruta_ingesta(tabla), nombre))
+    estado["partes"].append(nombre)
+
+
+def _cerrar(tabla, estado, df, fin):
+    """Actualiza offset, cola, último id y versión luego de leer hasta ``fin``."""
+    clave = datos.INCREMENTALES[tabla]
+    estado["offset"] = fin
+    with open(datos.ruta(tabla), "rb") as archivo:
+        estado["cola"] = _hash_cola(archivo, fin)
+    if len(df):
+        estado["ultimo_id"] = max(estado["ultimo_id"], int(df[clave].max()))
+    # Sólo si se leyó el archivo entero las partes equivalen al CSV actual
+    firma = datos.firma(tabla)
+    completo = firma[1] == fin
+    estado["firma"] = list(firma) if completo else None
+    # El hash de la fuente se sigue desde el último bloque ya hasheado: sólo se leen los bytes nuevos
+    estado["hash"] = datos.hash_fuente(tabla, desde=estado.get("punto_hash")) if completo else None
+    estado["punto_hash"] = list(datos.punto_hash(tabla)) if completo else None
+    estado["version"] = datos.version(tabla) if completo else None
+
+
+def reconstruir(tabla):
+    """Arma el almacén incremental de la tabla leyendo el CSV completo."""
+    carpeta = datos.ruta_ingesta(tabla)
+    if os.path.isdir(carpeta):
+        for viejo in os.listdir(carpeta):
+            if viejo.startswith("parte-"):
+                os.remove(os.path.join(carpeta, viejo))
+
+    bloque = _leer_bloque(tabla, 0)
+    df = datos._leer_csv(tabla, fuente=io.BytesIO(bloque))
+    estado = {
+        "tabla": tabla,
+        "esquema": datos.hash_esquema(tabla),
+        "encabezado": list(df.columns),
+        "ultimo_id": 0,
+        "partes": [],
+    }
+    _escribir_parte(tabla, estado, df)
+    _cerrar(tabla, estado, df, len(bloque))
+    _guardar_manifiesto(tabla, estado)
+    datos.invalidar(tabla)
+    return df
+
+
+def ingerir(tabla):
+    """Incorpora las filas nuevas de la tabla y devuelve un DataFrame con ellas.
+
+    La primera vez (o si el archivo no sólo creció) arma el almacén completo
+    y devuelve la tabla entera.
+    """
+    if tabla not in datos.INCREMENTALES:
+        raise KeyError(f"La tabla {tabla} no admite ingesta incremental")
+    if not datos.HAY_PARQUET:
+        raise RuntimeError("Se necesita pyarrow para el almacén incremental")
+
+    estado = leer_manifiesto(tabla)
+    if not _solo_crecio(tabla, estado):
+        return reconstruir(tabla)
+
+    bloque = _leer_bloque(tabla, estado["offset"])
+    fin = estado["offset"] + len(bloque)
+    nuevas = datos._leer_csv(tabla, fuente=io.BytesIO(bloque), encabezado=estado["encabezado"])
+    # Filas reexportadas con un id ya visto no se vuelven a contar
+    nuevas = nuevas[nuevas[datos.INCREMENTALES[tabla]] > estado["ultimo_id"]].reset_index(drop=True)
+
+    firma_anterior = tuple(estado["firma"]) if estado.get("firma") else None
+    version_anterior = estado.get("version")
+    if len(nuevas):
+        _escribir_parte(tabla, estado, nuevas)
+    _cerrar(tabla, estado, nuevas, fin)
+    _guardar_manifiesto(tabla, estado)
+
+    # Agregados derivados: se les suman sólo las filas nuevas
+    if len(nuevas) and estado["version"] is not None:
+        datos.anexar(tabla, nuevas, firma_anterior, tuple(estado["firma"]))
+        if tabla in cubo.CUBOS and version_anterior is not None and version_anterior != estado["version"]:
+            cubo.incorporar(tabla, nuevas, version_anterior, estado["version"])
+        # Los gastos nuevos se puntúan con los modelos de anomalías ya ajustados
+        if tabla == "gastos" and version_anterior is not None and version_anterior != estado["version"]:
+            anomalias.incorporar(nuevas, version_anterior, estado["version"])
+    # Las ventas nuevas pasan por el puntaje de fraude apenas llegan
+    if tabla == "ventas" and len(nuevas):
+        anomalias.vigilar_ventas(nuevas)
+    return nuevas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingesta incremental de ventas, compras y gastos")
+    parser.add_argument("tablas", nargs="*", help=f"Tablas a actualizar (por defecto todas): {', '.join(datos.INCREMENTALES)}")
+    parser.add_argument("--reconstruir", action="store_true", help="Ignora lo ingerido y vuelve a leer el CSV completo")
+    args = parser.parse_args()
+
+    desconocidas = set(args.tablas) - set(datos.INCREMENTALES)
+    if desconocidas:
+        parser.error(f"Tablas desconocidas: {', '.join(sorted(desconocidas))}")
+    if not datos.HAY_PARQUET:
+        parser.error("Se necesita pyarrow para el almacén incremental")
+
+    for tabla in args.tablas or datos.INCREMENTALES:
+        filas = reconstruir(tabla) if args.reconstruir else ingerir(tabla)
+        estado = leer_manifiesto(tabla)
+        print(f"{tabla}: {len(filas)} filas nuevas, último id {estado['ultimo_id']}, {len(estado['partes'])} partes")
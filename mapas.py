@@ -0,0 +1,80 @@
+"""Mapas de folium armados en bloque y cacheados por versión de datos.
+
+En lugar de agregar un marcador por fila, los puntos se pasan de una vez como
+arreglos a una sola capa (``FastMarkerCluster``, que agrupa en el navegador, o
+``HeatMap``). El HTML resultante se guarda en memoria y en
+``.cache_datos/mapas`` por versión de los datos, así que sólo se vuelve a
+generar cuando cambia la tabla.
+"""
+import os
+import threading
+
+import numpy as np
+
+import datos
+
+CAPAS = ("clusters", "calor")
+
+# Decimales de las coordenadas en el HTML (~1 m); achica bastante el archivo
+DECIMALES = 5
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def _puntos(df, latitud, longitud):
+    coordenadas = df[[latitud, longitud]].dropna().to_numpy(dtype="float64")
+    return np.round(coordenadas, DECIMALES)
+
+
+def construir(puntos, capa, zoom_start=5):
+    """Mapa de folium con todos los ``puntos`` (lat, lon) en una sola capa."""
+    import folium
+    from folium import plugins
+
+    centro = puntos.mean(axis=0).tolist() if len(puntos) else [0.0, 0.0]
+    mapa = folium.Map(location=centro, zoom_start=zoom_start)
+    if capa == "calor":
+        plugins.HeatMap(puntos.tolist(), radius=8).add_to(mapa)
+    else:
+        plugins.FastMarkerCluster(puntos.tolist()).add_to(mapa)
+    return mapa
+
+
+def ruta_persistida(nombre, capa, version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "mapas", f"{nombre}-{capa}-{version}.html")
+
+
+def _html_cacheado(nombre, capa, tabla, generar):
+    """HTML del mapa ``nombre``; ``generar()`` sólo corre si cambió ``tabla``."""
+    if capa not in CAPAS:
+        raise KeyError(f"Capa desconocida: {capa}")
+    with _lock:
+        actual = datos.version(tabla)
+        en_cache = _cache.get((nombre, capa))
+        if en_cache is None or en_cache[0] != actual:
+            destino = ruta_persistida(nombre, capa, actual)
+            if os.path.exists(destino):
+                with open(destino, encoding="utf-8") as archivo:
+                    html = archivo.read()
+            else:
+                html = generar().get_root().render()
+                os.makedirs(os.path.dirname(destino), exist_ok=True)
+                temporal = f"{destino}.{os.getpid()}.tmp"
+                with open(temporal, "w", encoding="utf-8") as archivo:
+                    archivo.write(html)
+                os.replace(temporal, destino)
+                for viejo in os.listdir(os.path.dirname(destino)):
+                    if viejo.startswith(f"{nombre}-{capa}-") and viejo != os.path.basename(destino):
+                        os.remove(os.path.join(os.path.dirname(destino), viejo))
+            en_cache = (actual, html)
+            _cache[(nombre, capa)] = en_cache
+    return en_cache[1]
+
+
+def mapa_clientes(capa="clusters"):
+    """HTML del mapa de todos los clientes con coordenadas."""
+    return _html_cacheado(
+        "clientes", capa, "clientes",
+        lambda: construir(_puntos(datos.load_clientes(columnas=["X", "Y"]), "Y", "X"), capa),
+    )
@@ -0,0 +1,270 @@
+"""Tramos medidos y contadores de caché, para ver dónde se va el tiempo.
+
+Cada render de una página (``paginas.mostrar``) se mide completo con
+``pagina()``. Dentro, las capas de la app abren tramos con ``tramo()`` o
+``@medido``, cada uno en una etapa:
+
+- ``importacion``: la primera importación del módulo de la página y sus librerías;
+- ``carga``: loaders de ``datos`` y agregados (hechos, cubos, índices, puntajes);
+- ``modelo``: ajustes de ``modelos.ajustar``;
+- ``render``: las llamadas de salida de Streamlit (``st.pyplot``,
+  ``st.plotly_chart``, ...), envueltas por ``instrumentar_streamlit()``;
+- ``transformacion``: lo que queda del render sin medir (merges, agrupaciones
+  y armado de figuras en la página), o tramos marcados a mano.
+
+Las cachés cuentan sus consultas con ``cache(nombre, resultado)``, donde
+``resultado`` es "memoria" (ya estaba cargado), "disco" (se leyó la copia
+persistida) o "calculo" (se reconstruyó).
+
+Todo se acumula por proceso. Cada render de página agrega una línea JSON a
+``.cache_datos/metricas/tramos.jsonl`` (que se rota a ``tramos.1.jsonl``
+cuando pasa de ``MAXIMO_BYTES``) y ``exportar()`` escribe los acumulados en
+formato de texto de Prometheus (``.cache_datos/metricas/dataenterprise.prom``),
+apto para el colector de archivos de texto de node_exporter, a lo sumo una vez
+cada ``INTERVALO_EXPORTACION`` segundos. La sección "Diagnóstico" de la app los
+muestra a los administradores.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+ETAPAS = ("importacion", "carga", "transformacion", "modelo", "render")
+
+RESULTADOS = ("memoria", "disco", "calculo")
+
+# Límites (segundos) de los histogramas de Prometheus
+LIMITES = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Salidas de Streamlit que se miden como etapa "render"
+SALIDAS = (
+    "pyplot", "image", "plotly_chart", "dataframe", "table", "map",
+    "line_chart", "bar_chart", "area_chart", "scatter_chart",
+)
+
+SEGUNDO_PLANO = "(segundo plano)"
+
+MAXIMO_BYTES = 5 * 2**20
+
+# node_exporter lee el archivo cada tanto: no hace falta reescribirlo en cada rerun
+INTERVALO_EXPORTACION = 15.0
+
+_tramos = {}
+_caches = {}
+ultimos = {}
+_ultima_exportacion = None
+_lock = threading.Lock()
+# Streamlit ejecuta cada sesión en su propio hilo: la página en curso es por hilo
+_hilo = threading.local()
+
+
+def directorio():
+    # Se importa acá: datos importa este módulo
+    import datos
+    return os.path.join(datos.DIRECTORIO_CACHE, "metricas")
+
+
+# -----------------------------
+# TRAMOS Y CONTADORES
+# -----------------------------
+def _acumular(pagina, etapa, nombre, segundos):
+    with _lock:
+        acumulado = _tramos.get((pagina, etapa, nombre))
+        if acumulado is None:
+            acumulado = _tramos[(pagina, etapa, nombre)] = {
+                "llamadas": 0, "segundos": 0.0, "maximo": 0.0, "cubetas": [0] * len(LIMITES),
+            }
+        acumulado["llamadas"] += 1
+        acumulado["segundos"] += segundos
+        acumulado["maximo"] = max(acumulado["maximo"], segundos)
+        for i, limite in enumerate(LIMITES):
+            if segundos <= limite:
+                acumulado["cubetas"][i] += 1
+
+
+@contextmanager
+def tramo(nombre, etapa):
+    """Mide el bloque como un tramo ``nombre`` de ``etapa`` en la página en curso."""
+    profundidad = getattr(_hilo, "profundidad", 0)
+    _hilo.profundidad = profundidad + 1
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        segundos = time.perf_counter() - inicio
+        _hilo.profundidad = profundidad
+        _acumular(getattr(_hilo, "pagina", None) or SEGUNDO_PLANO, etapa, nombre, segundos)
+        detalle = getattr(_hilo, "detalle", None)
+        if detalle is not None:
+            # Un tramo dentro de otro (datos.cargar dentro de hechos) no suma dos veces a su etapa
+            detalle.append({"nombre": nombre, "etapa": etapa, "segundos": round(segundos, 4),
+                            "anidado": profundidad > 0})
+
+
+def medido(nombre, etapa):
+    """Decorador: cada llamada a la función es un tramo."""
+    def decorador(funcion):
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with tramo(nombre, etapa):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def cache(nombre, resultado):
+    """Cuenta una consulta a la caché ``nombre`` ("memoria", "disco" o "calculo")."""
+    with _lock:
+        _caches[(nombre, resultado)] = _caches.get((nombre, resultado), 0) + 1
+
+
+@contextmanager
+def pagina(nombre):
+    """Mide un render completo de la página y lo deja en ``ultimos`` y en el log."""
+    _hilo.pagina, _hilo.detalle, _hilo.profundidad = nombre, [], 0
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        total = time.perf_counter() - inicio
+        detalle = _hilo.detalle
+        _hilo.pagina = _hilo.detalle = None
+
+        etapas = dict.fromkeys(ETAPAS, 0.0)
+        for medicion in detalle:
+            if not medicion["anidado"]:
+                etapas[medicion["etapa"]] += medicion["segundos"]
+        resto = max(total - sum(etapas.values()), 0.0)
+        etapas["transformacion"] += resto
+        _acumular(nombre, "transformacion", "sin medir", resto)
+        _acumular(nombre, "total", "pagina", total)
+
+        registro = {
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "pagina": nombre,
+            "total_s": round(total, 4),
+            "etapas": {etapa: round(segundos, 4) for etapa, segundos in etapas.items()},
+            "tramos": detalle,
+        }
+        with _lock:
+            ultimos[nombre] = registro
+        _escribir_log(registro)
+
+
+def _escribir_log(registro):
+    try:
+        os.makedirs(directorio(), exist_ok=True)
+        destino = os.path.join(directorio(), "tramos.jsonl")
+        if os.path.exists(destino) and os.path.getsize(destino) > MAXIMO_BYTES:
+            os.replace(destino, destino[:-len(".jsonl")] + ".1.jsonl")
+        with open(destino, "a", encoding="utf-8") as archivo:
+            archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    except OSError:
+        # Sin disco escribible las mediciones siguen en memoria
+        pass
+
+
+def instrumentar_streamlit():
+    """Envuelve las salidas de Streamlit (``SALIDAS``) para medirlas como "render".
+
+    Se envuelven tanto ``st.pyplot`` como el método de ``DeltaGenerator``, que
+    es el que usan las columnas y la barra lateral. Llamarla más de una vez no
+    cambia nada.
+    """
+    import streamlit as st
+    from streamlit.delta_generator import DeltaGenerator
+
+    for salida in SALIDAS:
+        for dueno in (st, DeltaGenerator):
+            original = getattr(dueno, salida, None)
+            if original is not None and not getattr(original, "_medido", False):
+                envoltura = medido(f"st.{salida}", "render")(original)
+                envoltura._medido = True
+                setattr(dueno, salida, envoltura)
+
+
+# -----------------------------
+# CONSULTA Y EXPORTACION
+# -----------------------------
+def resumen_tramos():
+    """Filas (pagina, etapa, nombre, llamadas, segundos, maximo) de lo acumulado."""
+    with _lock:
+        return [
+            {"pagina": pagina, "etapa": etapa, "nombre": nombre, "llamadas": a["llamadas"],
+             "segundos": a["segundos"], "maximo": a["maximo"]}
+            for (pagina, etapa, nombre), a in _tramos.items()
+        ]
+
+
+def resumen_caches():
+    """Consultas por caché y resultado, con la proporción resuelta sin recalcular."""
+    with _lock:
+        copia = dict(_caches)
+    filas = []
+    for nombre in sorted({n for n, _ in copia}):
+        fila = {"cache": nombre, **{r: copia.get((nombre, r), 0) for r in RESULTADOS}}
+        consultas = sum(fila[r] for r in RESULTADOS)
+        fila["aciertos"] = (fila["memoria"] + fila["disco"]) / consultas if consultas else 0.0
+        filas.append(fila)
+    return filas
+
+
+def _etiquetas(**valores):
+    escapar = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{clave}="{escapar(valor)}"' for clave, valor in valores.items()) + "}"
+
+
+def texto_prometheus():
+    """Acumulados del proceso en el formato de texto de Prometheus."""
+    with _lock:
+        tramos = {clave: dict(a, cubetas=list(a["cubetas"])) for clave, a in _tramos.items()}
+        caches = dict(_caches)
+
+    lineas = [
+        "# HELP dataenterprise_tramo_segundos Duracion de los tramos por pagina, etapa y nombre.",
+        "# TYPE dataenterprise_tramo_segundos histogram",
+    ]
+    for (pagina, etapa, nombre), a in sorted(tramos.items()):
+        for limite, cuenta in zip(LIMITES, a["cubetas"]):
+            etiquetas = _etiquetas(pagina=pagina, etapa=etapa, nombre=nombre, le=limite)
+            lineas.append(f"dataenterprise_tramo_segundos_bucket{etiquetas} {cuenta}")
+        etiquetas = _etiquetas(pagina=pagina, etapa=etapa, nombre=nombre, le="+Inf")
+        lineas.append(f"dataenterprise_tramo_segundos_bucket{etiquetas} {a['llamadas']}")
+        etiquetas = _etiquetas(pagina=pagina, etapa=etapa, nombre=nombre)
+        lineas.append(f"dataenterprise_tramo_segundos_sum{etiquetas} {a['segundos']:.6f}")
+        lineas.append(f"dataenterprise_tramo_segundos_count{etiquetas} {a['llamadas']}")
+
+    lineas += [
+        "# HELP dataenterprise_cache_consultas_total Consultas a cada cache segun donde se resolvieron.",
+        "# TYPE dataenterprise_cache_consultas_total counter",
+    ]
+    for (nombre, resultado), cuenta in sorted(caches.items()):
+        lineas.append(f"dataenterprise_cache_consultas_total{_etiquetas(cache=nombre, resultado=resultado)} {cuenta}")
+    return "\n".join(lineas) + "\n"
+
+
+def exportar(destino=None, forzar=False):
+    """Escribe ``texto_prometheus()`` de forma atómica y devuelve la ruta.
+
+    Si la última exportación fue hace menos de ``INTERVALO_EXPORTACION``
+    segundos (y no se pide ``forzar``) no escribe nada y devuelve None.
+    """
+    global _ultima_exportacion
+    ahora = time.perf_counter()
+    with _lock:
+        if not forzar and _ultima_exportacion is not None and ahora - _ultima_exportacion < INTERVALO_EXPORTACION:
+            return None
+        _ultima_exportacion = ahora
+    destino = destino or os.path.join(directorio(), "dataenterprise.prom")
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporal = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(texto_prometheus())
+        os.replace(temporal, destino)
+    except OSError:
+        return None
+    return destino
@@ -0,0 +1,130 @@
+"""Registro persistente de modelos entrenados.
+
+``ajustar(estimador, X, y)`` devuelve el estimador ya entrenado con esos
+datos: si el mismo tipo de modelo, con los mismos hiperparámetros, ya se
+entrenó con exactamente los mismos datos, se levanta del registro (en memoria
+o en ``.cache_datos/modelos`` con joblib) en lugar de volver a ajustarlo.
+
+La clave combina la clase del estimador, sus hiperparámetros, la versión de
+sklearn y una huella del contenido de ``X`` e ``y``. Esa huella cumple el
+papel de versión de los datos: si cambia la tabla de origen, o un filtro que
+eligió el usuario, cambia la clave y el modelo se vuelve a entrenar.
+"""
+import glob
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from scipy import sparse
+
+import datos
+import metricas
+
+DIRECTORIO = os.path.join(datos.DIRECTORIO_CACHE, "modelos")
+
+# Modelos que se conservan en memoria y, por cada tipo de estimador, en disco
+# (un Random Forest de 100 árboles ocupa decenas de MB)
+MAXIMO_MEMORIA = 32
+MAXIMO_POR_TIPO = 4
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def huella(datos_entrada):
+    """Hash del contenido de un DataFrame, Series, arreglo o matriz dispersa."""
+    sha = hashlib.sha1()
+    if datos_entrada is None:
+        return "sin-datos"
+    if isinstance(datos_entrada, pd.DataFrame):
+        sha.update(repr((list(datos_entrada.columns), list(datos_entrada.dtypes))).encode())
+        sha.update(pd.util.hash_pandas_object(datos_entrada, index=False).to_numpy().tobytes())
+    elif isinstance(datos_entrada, pd.Series):
+        sha.update(repr((datos_entrada.name, datos_entrada.dtype)).encode())
+        sha.update(pd.util.hash_pandas_object(datos_entrada, index=False).to_numpy().tobytes())
+    elif sparse.issparse(datos_entrada):
+        matriz = datos_entrada.tocsr()
+        for parte in (matriz.data, matriz.indices, matriz.indptr):
+            sha.update(np.ascontiguousarray(parte).tobytes())
+        sha.update(repr(matriz.shape).encode())
+    else:
+        arreglo = np.ascontiguousarray(datos_entrada)
+        sha.update(repr((arreglo.shape, arreglo.dtype.str)).encode())
+        sha.update(arreglo.tobytes())
+    return sha.hexdigest()[:16]
+
+
+def tipo(estimador):
+    """Clase del estimador; en un ``Pipeline``, la del último paso."""
+    final = estimador.steps[-1][1] if hasattr(estimador, "steps") else estimador
+    return type(final).__name__
+
+
+def clave(estimador, X, y=None):
+    parametros = repr(sorted(estimador.get_params(deep=True).items()))
+    partes = [type(estimador).__name__, parametros, sklearn.__version__, huella(X), huella(y)]
+    return hashlib.sha1("|".join(partes).encode()).hexdigest()[:16]
+
+
+def ruta(estimador, clave_modelo):
+    return os.path.join(DIRECTORIO, f"{tipo(estimador)}-{clave_modelo}.joblib")
+
+
+def _recordar(clave_modelo, modelo):
+    _cache[clave_modelo] = modelo
+    _cache.move_to_end(clave_modelo)
+    while len(_cache) > MAXIMO_MEMORIA:
+        _cache.popitem(last=False)
+
+
+def _podar(estimador):
+    """Deja en disco sólo los modelos más recientes de ese tipo."""
+    archivos = sorted(
+        glob.glob(os.path.join(DIRECTORIO, f"{tipo(estimador)}-*.joblib")),
+        key=os.path.getmtime, reverse=True,
+    )
+    for viejo in archivos[MAXIMO_POR_TIPO:]:
+        os.remove(viejo)
+
+
+def ajustar(estimador, X, y=None):
+    """Devuelve ``estimador`` entrenado con ``X`` (e ``y``), del registro si ya existe."""
+    with metricas.tramo(f"modelos.{tipo(estimador)}", "modelo"):
+        return _ajustar(estimador, X, y)
+
+
+def _ajustar(estimador, X, y):
+    clave_modelo = clave(estimador, X, y)
+    with _lock:
+        if clave_modelo in _cache:
+            metricas.cache("modelos", "memoria")
+            _cache.move_to_end(clave_modelo)
+            return _cache[clave_modelo]
+
+    destino = ruta(estimador, clave_modelo)
+    modelo = None
+    if os.path.exists(destino):
+        try:
+            modelo = joblib.load(destino)
+            os.utime(destino)
+            metricas.cache("modelos", "disco")
+        except Exception:
+            # Archivo incompleto o de otra versión: se vuelve a entrenar
+            modelo = None
+    if modelo is None:
+        metricas.cache("modelos", "calculo")
+        modelo = estimador.fit(X) if y is None else estimador.fit(X, y)
+        os.makedirs(DIRECTORIO, exist_ok=True)
+        temporal = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+        joblib.dump(modelo, temporal)
+        os.replace(temporal, destino)
+        _podar(estimador)
+
+    with _lock:
+        _recordar(clave_modelo, modelo)
+    return modelo
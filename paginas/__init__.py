@@ -0,0 +1,165 @@
+"""Registro de las páginas de la app.
+
+Cada sección del menú agrupa una o más páginas y cada página vive en su propio
+módulo dentro de este paquete (``paginas/eda/clientes.py``,
+``paginas/ml/ventas.py``, ...) con una función ``mostrar()``. Como sólo se
+importa el módulo de la página abierta, una interacción ejecuta nada más que
+esa página, junto con las librerías que ella usa.
+
+Además, cada página declara las tablas de ``datos`` y los agregados
+(``hechos_ventas``, ``cubo_ventas``, ``cubo_gastos``, ``pronosticos``,
+``similitud_productos``, ``similitud_proveedores``, ``anomalias_gastos``,
+``anomalias_ventas``) que necesita, para que se puedan precargar antes de
+abrirla; los de ``precarga.PESADOS`` se arman recién cuando se abre.
+
+Cada render queda medido en ``metricas`` (importación, carga, transformación,
+modelo y render); las secciones de ``SOLO_ADMIN`` sólo aparecen en el menú de
+los administradores. A pedido, un render también se perfila con ``perfiles``.
+"""
+import importlib
+from contextlib import nullcontext
+
+import metricas
+import perfiles
+import precarga
+
+SECCIONES = {
+    "Inicio": {
+        "encabezado": "📊 DataEnterprise - Proyecto de Análisis de Datos Empresariales",
+        "selector": None,
+    },
+    "Análisis exploratorio": {
+        "encabezado": "📈 Análisis exploratorio de datos (EDA)",
+        "selector": "Seleccioná el dataset a explorar:",
+    },
+    "Análisis cruzado": {
+        "encabezado": "🔀 Análisis cruzado entre áreas",
+        "selector": "Seleccioná el análisis cruzado a visualizar:",
+    },
+    "Modelos de ML": {
+        "encabezado": "🤖 Modelos de Machine Learning",
+        "selector": "📊 Elegí una categoría de datos:",
+    },
+    "Mapa de sucursales y empleados": {
+        "encabezado": "🗺️ Mapa de sucursales y empleados",
+        "selector": None,
+    },
+    "Informes": {
+        "encabezado": "🗂️ Informes generados",
+        "selector": None,
+    },
+    "Diagnóstico": {
+        "encabezado": "🩺 Diagnóstico de rendimiento",
+        "selector": None,
+    },
+}
+
+SOLO_ADMIN = {"Diagnóstico"}
+
+PAGINAS = {
+    "Inicio": [
+        {"titulo": "Inicio", "modulo": "inicio",
+         "tablas": (), "agregados": ()},
+    ],
+    "Análisis exploratorio": [
+        {"titulo": "Clientes", "modulo": "eda.clientes",
+         "tablas": ("clientes",), "agregados": ()},
+        {"titulo": "Compras", "modulo": "eda.compras",
+         "tablas": ("compras",), "agregados": ()},
+        {"titulo": "Empleados", "modulo": "eda.empleados",
+         "tablas": ("empleados",), "agregados": ()},
+        {"titulo": "Gastos", "modulo": "eda.gastos",
+         "tablas": ("gastos",), "agregados": ()},
+        {"titulo": "Productos", "modulo": "eda.productos",
+         "tablas": ("compras", "productos"), "agregados": ()},
+        {"titulo": "Proveedores", "modulo": "eda.proveedores",
+         "tablas": ("proveedores",), "agregados": ()},
+        {"titulo": "Sucursales", "modulo": "eda.sucursales",
+         "tablas": ("sucursales",), "agregados": ()},
+        {"titulo": "Ventas", "modulo": "eda.ventas",
+         "tablas": ("ventas", "productos", "canal", "sucursales"), "agregados": ("cubo_ventas",)},
+    ],
+    "Análisis cruzado": [
+        {"titulo": "🛍️ Productos más vendidos vs. más comprados", "modulo": "cruzado.vendidos_comprados",
+         "tablas": ("ventas", "compras", "productos"), "agregados": ()},
+        {"titulo": "📍 Sucursales con más ventas vs. más gastos", "modulo": "cruzado.ventas_gastos_sucursal",
+         "tablas": ("sucursales",), "agregados": ("cubo_ventas", "cubo_gastos")},
+        {"titulo": "💸 Relación entre salario de empleados y volumen de ventas", "modulo": "cruzado.salario_ventas",
+         "tablas": ("empleados",), "agregados": ("cubo_ventas",)},
+        {"titulo": "👥 Perfil de cliente vs. tipo de producto vendido", "modulo": "cruzado.perfil_cliente",
+         "tablas": (), "agregados": ("hechos_ventas",)},
+        {"titulo": "🛒 Canal de venta vs. volumen/monto de ventas", "modulo": "cruzado.canal_volumen",
+         "tablas": (), "agregados": ("hechos_ventas",)},
+        {"titulo": "📈 Evolución histórica de ventas por canal", "modulo": "cruzado.evolucion_canal",
+         "tablas": ("canal",), "agregados": ("cubo_ventas",)},
+        {"titulo": "📊 Proveedor con mayor volumen de compra", "modulo": "cruzado.proveedor_volumen",
+         "tablas": ("compras", "proveedores"), "agregados": ()},
+        {"titulo": "💡 Comparar precios de compra vs. venta por producto (margen)", "modulo": "cruzado.margen",
+         "tablas": ("ventas", "compras", "productos"), "agregados": ()},
+    ],
+    "Modelos de ML": [
+        {"titulo": "🛍️ Compras", "modulo": "ml.compras",
+         "tablas": ("compras",), "agregados": ("pronosticos",)},
+        {"titulo": "🧾 Ventas", "modulo": "ml.ventas",
+         "tablas": ("ventas",), "agregados": ("anomalias_ventas",)},
+        {"titulo": "👥 Empleados", "modulo": "ml.empleados",
+         "tablas": ("empleados",), "agregados": ()},
+        {"titulo": "🧩 Sucursales", "modulo": "ml.sucursales",
+         "tablas": ("ventas", "sucursales", "clientes", "proveedores"), "agregados": ()},
+        {"titulo": "💸 Gastos", "modulo": "ml.gastos",
+         "tablas": ("gastos", "sucursales", "tipos_gasto"), "agregados": ("anomalias_gastos",)},
+        {"titulo": "📦 Productos", "modulo": "ml.productos",
+         "tablas": ("productos",), "agregados": ("cubo_ventas", "pronosticos", "similitud_productos")},
+        {"titulo": "🚚 Proveedores", "modulo": "ml.proveedores",
+         "tablas": ("compras", "productos", "proveedores"), "agregados": ("similitud_proveedores",)},
+        {"titulo": "🌐 Canal de ventas", "modulo": "ml.canal",
+         "tablas": (), "agregados": ("hechos_ventas",)},
+    ],
+    "Mapa de sucursales y empleados": [
+        {"titulo": "Mapa de sucursales y empleados", "modulo": "mapa",
+         "tablas": ("empleados", "sucursales", "clientes", "proveedores"), "agregados": ("hechos_ventas",)},
+    ],
+    "Informes": [
+        {"titulo": "Informes", "modulo": "informes",
+         "tablas": (), "agregados": ()},
+    ],
+    "Diagnóstico": [
+        {"titulo": "Diagnóstico", "modulo": "diagnostico",
+         "tablas": (), "agregados": ()},
+    ],
+}
+
+
+def secciones(admin=False):
+    return [seccion for seccion in SECCIONES if admin or seccion not in SOLO_ADMIN]
+
+
+def titulos(seccion):
+    return [pagina["titulo"] for pagina in PAGINAS[seccion]]
+
+
+def buscar(seccion, titulo):
+    for pagina in PAGINAS[seccion]:
+        if pagina["titulo"] == titulo:
+            return pagina
+    raise KeyError(f"Página desconocida: {seccion} / {titulo}")
+
+
+def cargar(pagina):
+    """Importa (la primera vez) el módulo de la página."""
+    return importlib.import_module(f"{__name__}.{pagina['modulo']}")
+
+
+def mostrar(seccion, titulo, perfilar=False):
+    """Muestra la página; si se perfiló, devuelve las rutas del perfil guardado."""
+    pagina = buscar(seccion, titulo)
+    nombre = f"{seccion} / {titulo}"
+    perfil = perfiles.perfilar(nombre) if perfilar or perfiles.SIEMPRE else nullcontext({})
+    with perfil as resultado, metricas.pagina(nombre):
+        # Si la precarga ya está leyendo lo que usa la página, se espera a que termine
+        with metricas.tramo("precarga.esperar", "carga"):
+            precarga.esperar(pagina["tablas"] + pagina["agregados"])
+        with metricas.tramo(f"paginas.{pagina['modulo']}", "importacion"):
+            modulo = cargar(pagina)
+        modulo.mostrar()
+    return resultado
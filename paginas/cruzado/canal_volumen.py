@@ -0,0 +1,43 @@
+"""Canal de venta vs. volumen/monto de ventas."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from hechos import TABLAS, hechos_ventas
+
+
+def mostrar():
+    st.markdown("### 🛒 Canal de venta vs. volumen/monto de ventas")
+    st.markdown("🔎 ¿Qué revela el gráfico?\n- Compara el volumen y la distribución de ventas por canal.\n- Permite identificar cuál canal tiene mayor actividad o ingresos.\n\n💡 Útil para ajustar estrategias comerciales y reforzar canales más rentables.")
+
+    def volumen_por_canal():
+        # Ventas con nombre de canal y precio de lista del producto
+        df_ventas = hechos_ventas(columnas=["IdVenta", "Canal", "PrecioLista"])
+
+        # Agrupamos por canal
+        canal_resumen = df_ventas.groupby("Canal", observed=True).agg({
+            "IdVenta": "count",
+            "PrecioLista": "sum"
+        }).reset_index().rename(columns={
+            "IdVenta": "Total_Vendido",
+            "PrecioLista": "Monto_Total"
+        })
+
+        # Visualización combinada
+        fig, ax1 = plt.subplots(figsize=(10, 6))
+        sns.barplot(data=canal_resumen, x="Canal", y="Total_Vendido", ax=ax1, color="skyblue")
+        ax1.set_ylabel("Cantidad de ventas", color="skyblue")
+        ax1.set_xlabel("Canal de venta")
+        ax1.set_title("Volumen y monto de ventas por canal")
+        ax1.tick_params(axis='y', labelcolor="skyblue")
+        plt.xticks(rotation=30)
+
+        # Eje secundario para monto total
+        ax2 = ax1.twinx()
+        sns.lineplot(data=canal_resumen, x="Canal", y="Monto_Total", ax=ax2, color="darkblue", marker="o")
+        ax2.set_ylabel("Monto total ($)", color="darkblue")
+        ax2.tick_params(axis='y', labelcolor="darkblue")
+
+        return fig
+    figuras.mostrar("volumen_por_canal", volumen_por_canal, TABLAS)
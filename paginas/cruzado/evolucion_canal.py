@@ -0,0 +1,25 @@
+"""Evolución histórica de ventas por canal."""
+import streamlit as st
+import plotly.express as px
+
+from cubo import rollup, etiquetar
+
+
+def mostrar():
+    st.markdown("### 📈 Evolución histórica de ventas por canal")
+    st.markdown("🔎 ¿Qué revela el gráfico?\n- Muestra cómo evolucionaron las ventas en el tiempo según el canal de comercialización.\n- Ayuda a detectar estacionalidades, tendencias de migración entre canales, y evaluar desempeño a largo plazo.\n\n💡 Ideal para planificación comercial y campañas estacionales.")
+
+    # Cantidad de ventas por mes y canal, desde el cubo precalculado
+    resumen = etiquetar(rollup(["Mes", "IdCanal"]))
+    resumen = resumen[["Mes", "Canal", "Registros"]].rename(columns={"Registros": "Cantidad"})
+
+    fig = px.line(
+        resumen,
+        x="Mes",
+        y="Cantidad",
+        color="Canal",
+        markers=True,
+        title="Evolución mensual de ventas por canal",
+        labels={"Canal": "Canal de Venta", "Mes": "Fecha", "Cantidad": "Cantidad de Ventas"},
+    )
+    st.plotly_chart(fig, use_container_width=True)
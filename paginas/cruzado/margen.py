@@ -0,0 +1,40 @@
+"""Precios de compra vs. venta por producto (margen)."""
+import streamlit as st
+import matplotlib.pyplot as plt
+
+import figuras
+from datos import load_ventas, load_compras, load_productos
+
+TABLAS = ("ventas", "compras", "productos")
+
+
+def mostrar():
+    st.markdown("### 💡 Comparar precios de compra vs. venta por producto (margen)")
+    st.markdown("🔎 ¿Qué muestra el gráfico?\n- Compara el precio promedio de compra y venta de cada producto.\n- Muestra el margen estimado por unidad.\n\n💡 Muy útil para análisis de rentabilidad por producto y toma de decisiones comerciales.")
+
+    def margen():
+        df_ventas = load_ventas(columnas=["IdProducto", "Precio"])
+        df_compras = load_compras(columnas=["IdProducto", "Precio"])
+        df_productos = load_productos()
+
+        # Precio promedio de compra por producto
+        compra_por_prod = df_compras.groupby("IdProducto")["Precio"].mean().reset_index(name="Precio_Compra")
+
+        # Precio promedio de venta por producto
+        venta_por_prod = df_ventas.groupby("IdProducto")["Precio"].mean().reset_index(name="Precio_Venta")
+
+        # Merge de ambos
+        comparacion = compra_por_prod.merge(venta_por_prod, on="IdProducto")
+        comparacion = comparacion.merge(df_productos[["ID_PRODUCTO", "Concepto"]], left_on="IdProducto", right_on="ID_PRODUCTO")
+        comparacion["Margen"] = comparacion["Precio_Venta"] - comparacion["Precio_Compra"]
+        comparacion = comparacion.sort_values(by="Margen", ascending=False).head(10)
+
+        # Gráfico
+        fig, ax = plt.subplots(figsize=(10, 6))
+        comparacion.set_index("Concepto")[["Precio_Compra", "Precio_Venta"]].plot(kind="bar", ax=ax)
+        ax.set_title("Comparación de precios de compra vs. venta (Top 10 por margen)")
+        ax.set_ylabel("Precio promedio por unidad")
+        ax.set_xlabel("Producto")
+        plt.xticks(rotation=45, ha="right")
+        return fig
+    figuras.mostrar("margen", margen, TABLAS)
@@ -0,0 +1,27 @@
+"""Perfil de cliente vs. tipo de producto vendido."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from hechos import TABLAS, hechos_ventas
+
+
+def mostrar():
+    st.markdown("### 👥 Perfil de cliente vs. tipo de producto vendido")
+    st.markdown("🔎 ¿Qué revela el gráfico?\n- Analiza qué tipo de productos prefieren distintos perfiles de clientes según edad.\n- Permite identificar patrones de consumo, segmentaciones de marketing y oportunidades de fidelización.\n\n💡 Ideal para definir campañas específicas para cada grupo etario.")
+
+    def tipo_por_edad():
+        # Ventas con el tipo de producto y el grupo etario del cliente
+        df_ventas = hechos_ventas(columnas=["Edad", "Tipo", "Edad_grupo"])
+        df_ventas = df_ventas.dropna(subset=["Edad", "Tipo"])
+
+        # Gráfico
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.countplot(data=df_ventas, x="Tipo", hue="Edad_grupo", ax=ax)
+        ax.set_title("Tipo de producto vendido según grupo etario del cliente")
+        ax.set_xlabel("Tipo de producto")
+        ax.set_ylabel("Cantidad de ventas")
+        ax.tick_params(axis='x', rotation=45)
+        return fig
+    figuras.mostrar("tipo_por_edad", tipo_por_edad, TABLAS)
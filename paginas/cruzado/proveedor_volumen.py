@@ -0,0 +1,33 @@
+"""Proveedor con mayor volumen de compra."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_compras, load_proveedores
+
+TABLAS = ("compras", "proveedores")
+
+
+def mostrar():
+    st.markdown("### 📊 Proveedor con mayor volumen de compra")
+    st.markdown("🔎 ¿Qué muestra el gráfico?\n- Permite identificar cuáles proveedores concentran mayor cantidad de productos adquiridos.\n- Ayuda a tomar decisiones sobre negociación, dependencia o diversificación de proveedores.\n\n💡 Ideal para compras estratégicas y análisis de riesgo.")
+
+    def top_proveedores():
+        df_compras = load_compras(columnas=["IdProveedor", "Cantidad"])
+        df_proveedores = load_proveedores()
+
+        # Agrupar por proveedor
+        proveedor_resumen = df_compras.groupby("IdProveedor")["Cantidad"].sum().reset_index()
+        proveedor_resumen = proveedor_resumen.merge(df_proveedores, left_on="IdProveedor", right_on="IDProveedor", how="left")
+        proveedor_resumen = proveedor_resumen.sort_values(by="Cantidad", ascending=False).head(10)
+
+        # Gráfico
+        fig, ax = plt.subplots(figsize=(10, 5))
+        sns.barplot(data=proveedor_resumen, x="Nombre", y="Cantidad", ax=ax, palette="magma")
+        ax.set_title("Top 10 proveedores por volumen de compra")
+        ax.set_ylabel("Cantidad total de productos comprados")
+        ax.set_xlabel("Proveedor")
+        ax.tick_params(axis='x', rotation=45)
+        return fig
+    figuras.mostrar("top_proveedores", top_proveedores, TABLAS)
@@ -0,0 +1,47 @@
+"""Relación entre salario de empleados y volumen de ventas."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_empleados
+from cubo import rollup
+
+TABLAS = ("ventas", "empleados")
+
+
+def mostrar():
+    st.markdown("### 💸 Relación entre salario de empleados y volumen de ventas")
+    st.markdown("🔎 ¿Qué revela el gráfico?.\n- No hay una correlación directa fuerte entre salario y ventas generadas.\n- Algunos empleados con salarios medios generan altas ventas, lo cual sugiere alto rendimiento.\n- También hay empleados con salario alto y ventas bajas, lo cual puede indicar o Cargos administrativos o Antigüedad o jerarquía sin tareas comerciales directas.\n- 💡 Muy útil para evaluar productividad individual y tomar decisiones sobre incentivos o comisiones.")
+
+    df_empleados = load_empleados()
+
+    # Ventas por empleado, desde el cubo
+    ventas_empleado = rollup(["IdEmpleado"]).rename(columns={"Registros": "Ventas"})[["IdEmpleado", "Ventas"]]
+    empleados_merge = df_empleados.merge(ventas_empleado, left_on="ID_empleado", right_on="IdEmpleado", how="left").fillna({"Ventas": 0})
+    top_20 = empleados_merge.sort_values(by="Ventas", ascending=False).head(20)
+
+    def salario_vs_ventas():
+        fig, ax = plt.subplots(figsize=(10, 6))
+        sns.scatterplot(data=top_20, x="Salario", y="Ventas", hue="Nombre", ax=ax)
+        ax.set_title("Relación entre salario y volumen de ventas (Top 20 empleados)")
+        return fig
+    figuras.mostrar("salario_vs_ventas", salario_vs_ventas, TABLAS)
+
+    # Comparador entre dos empleados
+    st.markdown("### 🤝 Comparador entre empleados")
+    opciones = top_20["Nombre"].tolist()
+    col1, col2 = st.columns(2)
+    with col1:
+        emp1 = st.selectbox("Empleado 1", opciones, key="emp1")
+    with col2:
+        emp2 = st.selectbox("Empleado 2", opciones, key="emp2")
+
+    def comparacion():
+        emp_data = top_20[top_20["Nombre"].isin([emp1, emp2])]
+        fig2, ax2 = plt.subplots()
+        sns.barplot(data=emp_data, x="Nombre", y="Ventas", ax=ax2, palette="viridis")
+        ax2.set_title("Comparación de volumen de ventas entre empleados")
+        return fig2
+    # Una figura por par de empleados elegido
+    figuras.mostrar("comparacion", comparacion, TABLAS, entradas=(emp1, emp2))
@@ -0,0 +1,48 @@
+"""Productos más vendidos vs. más comprados."""
+import streamlit as st
+import matplotlib.pyplot as plt
+
+import figuras
+from datos import load_ventas, load_compras, load_productos
+
+TABLAS = ("ventas", "compras", "productos")
+
+
+def mostrar():
+    st.markdown("### 🛍️ Productos más vendidos vs. más comprados")
+    st.markdown("🔎 ¿Qué muestra el gráfico?\n- Comparación directa de la cantidad vendida vs. la cantidad comprada por producto.\n- Podés ver claramente si hay productos:\n    - Con más ventas que compras → posible falta de stock o desabastecimiento.\n    - Con más compras que ventas → posible exceso de stock o baja rotación.")
+
+    st.markdown("### 📊 Comparación de productos más vendidos y comprados")
+    def vendidos_comprados():
+        df_ventas = load_ventas(columnas=["IdProducto"])
+        df_compras = load_compras(columnas=["IdProducto"])
+        df_productos = load_productos()
+
+        # Agrupamos ventas y compras por producto
+        ventas = df_ventas["IdProducto"].value_counts().reset_index()
+        ventas.columns = ["IdProducto", "Cantidad_Vendida"]
+
+        compras = df_compras["IdProducto"].value_counts().reset_index()
+        compras.columns = ["IdProducto", "Cantidad_Comprada"]
+
+        # Merge y agregamos nombres
+        df_merge = ventas.merge(compras, on="IdProducto", how="outer").fillna(0)
+        df_merge = df_merge.merge(df_productos[["ID_PRODUCTO", "Concepto"]], left_on="IdProducto", right_on="ID_PRODUCTO")
+
+        # Top 10 productos por ventas
+        top = df_merge.sort_values(by="Cantidad_Vendida", ascending=False).head(10)
+
+        # Gráfico comparativo
+        fig, ax = plt.subplots(figsize=(10, 6))
+        bar_width = 0.4
+        x = range(len(top))
+
+        ax.bar(x, top["Cantidad_Vendida"], width=bar_width, label="Vendidos", color="blue")
+        ax.bar([i + bar_width for i in x], top["Cantidad_Comprada"], width=bar_width, label="Comprados", color="orange")
+        ax.set_xticks([i + bar_width/2 for i in x])
+        ax.set_xticklabels(top["Concepto"], rotation=45, ha="right")
+        ax.set_ylabel("Cantidad")
+        ax.set_title("Productos más vendidos vs. más comprados")
+        ax.legend()
+        return fig
+    figuras.mostrar("vendidos_comprados", vendidos_comprados, TABLAS)
@@ -0,0 +1,45 @@
+"""Sucursales con más ventas vs. más gastos."""
+import streamlit as st
+import matplotlib.pyplot as plt
+
+import figuras
+from datos import load_sucursales
+from cubo import rollup
+
+TABLAS = ("ventas", "gastos", "sucursales")
+
+
+def mostrar():
+    st.markdown("### 📍 Sucursales con más ventas vs. más gastos")
+    st.markdown("🔎 ¿Qué observamos?\n- Las sucursales con mayor volumen de ventas no siempre son las que más gastan.\n- Algunas sucursales tienen gastos elevados en proporción a sus ventas, lo que podría indicar:\n    - Ineficiencia operativa\n    - Costos fijos altos\n    - Gasto en infraestructura/logística no rentable\n\n💡 Ideal para analizar rentabilidad por punto de venta.")
+
+    def ventas_gastos():
+        df_sucursales = load_sucursales()
+
+        # Ventas por sucursal (totales del cubo, se actualizan con la ingesta incremental)
+        ventas_sucursal = rollup(["IdSucursal"]).rename(columns={"Registros": "Ventas"})[["IdSucursal", "Ventas"]]
+
+        # Gastos por sucursal
+        gastos_sucursal = rollup(["IdSucursal"], tabla="gastos").rename(columns={"Monto": "Gastos"})[["IdSucursal", "Gastos"]]
+
+        # Merge con nombres de sucursales
+        df_merge = ventas_sucursal.merge(gastos_sucursal, on="IdSucursal")
+        sucursal_map = df_sucursales.set_index("ID")["Sucursal"].to_dict()
+        df_merge["Sucursal"] = df_merge["IdSucursal"].map(sucursal_map)
+
+        df_top = df_merge.sort_values(by="Ventas", ascending=False).head(10)
+
+        # Gráfico comparativo
+        fig, ax = plt.subplots(figsize=(10, 6))
+        bar_width = 0.4
+        x = range(len(df_top))
+
+        ax.bar(x, df_top["Ventas"], width=bar_width, label="Ventas", color="blue")
+        ax.bar([i + bar_width for i in x], df_top["Gastos"], width=bar_width, label="Gastos", color="orange")
+        ax.set_xticks([i + bar_width/2 for i in x])
+        ax.set_xticklabels(df_top["Sucursal"], rotation=45, ha="right")
+        ax.set_ylabel("Cantidad")
+        ax.set_title("Top 10 sucursales con más ventas vs. más gastos")
+        ax.legend()
+        return fig
+    figuras.mostrar("ventas_gastos", ventas_gastos, TABLAS)
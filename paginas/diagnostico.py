@@ -0,0 +1,103 @@
+"""Diagnóstico de rendimiento: tramos medidos, cachés, precarga, arranque y perfiles (sólo administradores)."""
+import os
+
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+import arranque
+import figuras
+import metricas
+import perfiles
+import precarga
+
+
+def mostrar():
+    st.markdown(
+        "Tiempos medidos en este proceso desde que arrancó, compartidos por todas las sesiones. "
+        "**transformacion** incluye lo que la página hace sin medir (merges, agrupaciones, armado de figuras)."
+    )
+
+    # -----------------------------
+    # ULTIMO RENDER POR PAGINA
+    # -----------------------------
+    st.subheader("⏱️ Último render de cada página")
+    ultimos = list(metricas.ultimos.values())
+    if not ultimos:
+        st.info("Todavía no se abrió ninguna página en este proceso.")
+    else:
+        resumen = pd.DataFrame([
+            {"Página": r["pagina"], "Fecha": r["fecha"], "Total (s)": r["total_s"], **r["etapas"]}
+            for r in ultimos
+        ]).sort_values("Total (s)", ascending=False)
+        largo = resumen.melt(id_vars="Página", value_vars=list(metricas.ETAPAS), var_name="Etapa", value_name="Segundos")
+        fig = px.bar(largo, x="Segundos", y="Página", color="Etapa", orientation="h",
+                     title="Tiempo por etapa en el último render")
+        fig.update_layout(yaxis={"categoryorder": "total ascending"})
+        st.plotly_chart(fig)
+        st.dataframe(resumen)
+
+        elegida = st.selectbox("Detalle de tramos de:", resumen["Página"])
+        detalle = pd.DataFrame(metricas.ultimos[elegida]["tramos"])
+        if detalle.empty:
+            st.write("La página no abrió tramos medidos.")
+        else:
+            st.dataframe(detalle.rename(columns={"anidado": "dentro de otro tramo"}))
+
+    # -----------------------------
+    # ACUMULADO DEL PROCESO
+    # -----------------------------
+    st.subheader("📊 Tramos acumulados")
+    tramos = pd.DataFrame(metricas.resumen_tramos())
+    if not tramos.empty:
+        tramos["media"] = tramos["segundos"] / tramos["llamadas"]
+        st.dataframe(tramos.sort_values("segundos", ascending=False))
+
+    st.subheader("🗄️ Cachés")
+    caches = pd.DataFrame(metricas.resumen_caches())
+    if caches.empty:
+        st.write("Sin consultas todavía.")
+    else:
+        st.dataframe(caches.style.format({"aciertos": "{:.0%}"}))
+    ocupacion = figuras.estado()
+    st.caption(
+        f"Figuras dibujadas en memoria: {ocupacion['figuras']} "
+        f"({ocupacion['bytes'] / 2**20:.1f} de {ocupacion['maximo'] / 2**20:.0f} MB)."
+    )
+
+    st.subheader("🧵 Precarga")
+    estado = precarga.estado()
+    st.dataframe(pd.DataFrame({"Requisito": list(estado), "Estado": list(estado.values())}))
+
+    st.subheader("🚀 Arranque")
+    st.dataframe(pd.DataFrame(list(arranque.historial)[-20:]))
+
+    # -----------------------------
+    # PERFILES
+    # -----------------------------
+    st.subheader("🔬 Perfiles guardados")
+    guardados = perfiles.listar()
+    if not guardados:
+        st.write("Todavía no hay perfiles: usá \"🔬 Perfilar esta página\" en la barra lateral "
+                 f"o arrancá la app con {perfiles.ENTORNO}=1.")
+    else:
+        opciones = {f"{p['pagina']} — {p['fecha']}": p for p in guardados}
+        elegido = opciones[st.selectbox("Perfil:", list(opciones))]
+        with open(elegido["txt"], encoding="utf-8") as archivo:
+            informe = archivo.read()
+        st.code(informe, language=None)
+        with open(elegido["prof"], "rb") as archivo:
+            st.download_button("⬇️ Perfil de cProfile (.prof)", archivo.read(),
+                               file_name=os.path.basename(elegido["prof"]))
+        st.download_button("⬇️ Informe (.txt)", informe, file_name=os.path.basename(elegido["txt"]))
+
+    # -----------------------------
+    # EXPORTACION
+    # -----------------------------
+    st.subheader("📤 Exportar")
+    st.download_button("⬇️ Métricas en formato Prometheus", metricas.texto_prometheus(),
+                       file_name="dataenterprise.prom", mime="text/plain")
+    st.caption(
+        f"También se escriben en {os.path.join(metricas.directorio(), 'dataenterprise.prom')} al final de "
+        f"cada ejecución, y cada render de página en {os.path.join(metricas.directorio(), 'tramos.jsonl')}."
+    )
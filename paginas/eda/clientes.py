@@ -0,0 +1,63 @@
+"""Análisis exploratorio del dataset de clientes."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+import streamlit.components.v1 as components
+
+import figuras
+from datos import load_clientes
+from mapas import mapa_clientes
+
+TABLAS = ("clientes",)
+
+
+def mostrar():
+    st.subheader("🧍‍♂️ Exploración de Clientes")
+    st.markdown("✅ Conclusiones preliminares del análisis del dataset Clientes: - Edad promedio de los clientes es de 40 años, con una alta concentración entre los 25 y 55.\n- Hay una clara concentración geográfica en el AMBA, especialmente Ciudad de Buenos Aires.\n- El 100% de los clientes están activos (no hay marca de baja).\n- La diversidad de localidades es grande (527), pero unas pocas concentran la mayoría.\n- La base de clientes parece limpia y homogénea, con pocos outliers.")
+
+    df_clientes = load_clientes()
+
+    # Histograma de edades
+    st.markdown("### 📊 Distribución de edades")
+    def edades():
+        fig, ax = plt.subplots(figsize=(8, 4))
+        sns.histplot(df_clientes["Edad"], bins=20, kde=True, ax=ax, color="skyblue")
+        ax.set_title("Distribución de edades de los clientes")
+        ax.set_xlabel("Edad")
+        ax.set_ylabel("Cantidad")
+        return fig
+    figuras.mostrar("edades", edades, TABLAS)
+
+    # Top 10 localidades
+    st.markdown("### 🏙️ Top 10 Localidades con más clientes")
+    def top_localidades():
+        top_localidades = df_clientes["Localidad"].value_counts().head(10)
+        fig2, ax2 = plt.subplots()
+        top_localidades.plot(kind="barh", ax=ax2, color="teal")
+        ax2.invert_yaxis()
+        ax2.set_title("Top 10 Localidades")
+        ax2.set_xlabel("Cantidad de clientes")
+        return fig2
+    figuras.mostrar("top_localidades", top_localidades, TABLAS)
+
+    # Mapa geográfico de clientes (si hay coordenadas)
+    if "X" in df_clientes.columns and "Y" in df_clientes.columns:
+        st.markdown("### 🌍 Mapa de distribución geográfica")
+        capa = st.radio("Vista del mapa:", ["Agrupado", "Mapa de calor"], horizontal=True)
+        # Una sola capa con todos los puntos; el HTML se genera una vez por versión de los datos
+        html = mapa_clientes("calor" if capa == "Mapa de calor" else "clusters")
+        components.html(html, width=700, height=400)
+
+    # Heatmap de correlaciones
+    st.markdown("### 🔥 Correlación entre variables numéricas")
+    def correlaciones():
+        corr = df_clientes.select_dtypes(include="number").corr()
+        fig3, ax3 = plt.subplots()
+        sns.heatmap(corr, annot=True, cmap="coolwarm", ax=ax3)
+        ax3.set_title("Heatmap de correlaciones")
+        return fig3
+    figuras.mostrar("correlaciones", correlaciones, TABLAS)
+
+    # Estadísticas descriptivas
+    st.subheader("📋 Estadísticas descriptivas")
+    st.dataframe(df_clientes.describe(include="number"))
@@ -0,0 +1,64 @@
+"""Análisis exploratorio del dataset de compras."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_compras
+
+TABLAS = ("compras",)
+
+
+def mostrar():
+    st.subheader("🛒 Exploración de Compras")
+    st.markdown("✅ Conclusiones preliminares del análisis de Compras: - El volumen principal de compras se concentra en productos de bajo a mediano precio (menos de $1200).\n-Se compran en promedio 9 unidades por operación, con pocas compras mayores a 25 unidades..\n- Proveedor 8, seguido de 12 y 7, domina en volumen de compras..\n- No hay relación directa entre Precio y Cantidad, lo que sugiere que el tipo de producto define el patrón más que el monto.\n- Existen outliers en precios que podrían representar productos premium, errores de carga o compras especiales.")
+
+    df_compras = load_compras()
+
+    # Histograma de cantidad de compras
+    st.markdown("### 📦 Distribución de cantidad por compra")
+    def cantidades():
+        fig, ax = plt.subplots(figsize=(8, 4))
+        sns.histplot(df_compras["Cantidad"], bins=30, kde=True, ax=ax, color="orange")
+        ax.set_title("Distribución de cantidades por compra")
+        ax.set_xlabel("Cantidad")
+        ax.set_ylabel("Frecuencia")
+        return fig
+    figuras.mostrar("cantidades", cantidades, TABLAS)
+
+    # Top 10 productos más comprados
+    st.markdown("### 🥇 Top 10 productos más comprados")
+    def top_productos():
+        top_productos = df_compras["IdProducto"].value_counts().head(10)
+        fig2, ax2 = plt.subplots()
+        top_productos.plot(kind="bar", ax=ax2, color="green")
+        ax2.set_title("Top 10 productos por frecuencia de compra")
+        ax2.set_xlabel("IdProducto")
+        ax2.set_ylabel("Número de compras")
+        return fig2
+    figuras.mostrar("top_productos", top_productos, TABLAS)
+
+    # Heatmap de correlaciones
+    st.markdown("### 🔥 Correlación entre variables numéricas")
+    def correlaciones():
+        corr_compras = df_compras.select_dtypes(include="number").corr()
+        fig4, ax4 = plt.subplots()
+        sns.heatmap(corr_compras, annot=True, cmap="coolwarm", ax=ax4)
+        ax4.set_title("Heatmap de correlaciones - Compras")
+        return fig4
+    figuras.mostrar("correlaciones", correlaciones, TABLAS)
+
+    # Visualización bivariada: IdProducto vs Cantidad
+    st.markdown("### 📊 Relación entre Producto y Cantidad Comprada")
+    def cantidad_por_producto():
+        fig3, ax3 = plt.subplots(figsize=(10, 4))
+        top_ids = df_compras['IdProducto'].value_counts().head(10).index
+        sns.boxplot(data=df_compras[df_compras['IdProducto'].isin(top_ids)],
+                    x="IdProducto", y="Cantidad", ax=ax3, palette="pastel")
+        ax3.set_title("Distribución de cantidades por producto (Top 10)")
+        return fig3
+    figuras.mostrar("cantidad_por_producto", cantidad_por_producto, TABLAS)
+
+    # Estadísticas descriptivas
+    st.subheader("📋 Estadísticas descriptivas")
+    st.dataframe(df_compras.describe(include="number"))
@@ -0,0 +1,76 @@
+"""Análisis exploratorio del dataset de empleados."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_empleados
+
+TABLAS = ("empleados",)
+
+
+def mostrar():
+    st.subheader("👔 Exploración de Empleados")
+    st.markdown("✅ Conclusiones preliminares del dataset Empleados:\n- El salario más frecuente es $32.000, y la mayoría de empleados cobra entre $15.000 y $36.000.\n- El rol de vendedor domina la estructura laboral (más del 60% del total).\n- El sector más numeroso es ventas, seguido de administración y logística.\n- Los salarios más altos se encuentran en administración y sistemas.\n- Las sucursales están bastante equilibradas, con una leve concentración en morón, caseros y cabildo.")
+
+    df_empleados = load_empleados()
+
+    # Histograma de salarios
+    st.markdown("### 💵 Distribución de Salarios")
+    def salarios():
+        fig, ax = plt.subplots()
+        sns.histplot(df_empleados["Salario"], bins=30, kde=True, ax=ax, color="lightgreen")
+        ax.set_title("Distribución de salarios")
+        return fig
+    figuras.mostrar("salarios", salarios, TABLAS)
+
+    # Empleados por cargo
+    st.markdown("### 👷‍♂️ Distribución por Cargo")
+    def cargos():
+        fig2, ax2 = plt.subplots()
+        df_empleados["Cargo"].value_counts().plot(kind="bar", ax=ax2, color="steelblue")
+        ax2.set_title("Cantidad de empleados por cargo")
+        ax2.set_ylabel("Cantidad")
+        return fig2
+    figuras.mostrar("cargos", cargos, TABLAS)
+
+    # Boxplot salario por cargo
+    st.markdown("### 📊 Salario por Cargo")
+    def salario_por_cargo():
+        fig3, ax3 = plt.subplots(figsize=(10, 5))
+        sns.boxplot(data=df_empleados, x="Cargo", y="Salario", ax=ax3, palette="pastel")
+        ax3.set_title("Distribución de salario por cargo")
+        ax3.tick_params(axis='x', rotation=45)
+        return fig3
+    figuras.mostrar("salario_por_cargo", salario_por_cargo, TABLAS)
+
+    # Gráfico de conteo por Sucursal
+    st.markdown("### 🏢 Empleados por Sucursal")
+    def por_sucursal():
+        fig1, ax1 = plt.subplots()
+        df_empleados['Sucursal'].value_counts().plot(kind='bar', ax=ax1, color='lightblue')
+        ax1.set_title("Cantidad de empleados por sucursal")
+        return fig1
+    figuras.mostrar("por_sucursal", por_sucursal, TABLAS)
+
+    # Gráfico de conteo por Sector
+    st.markdown("### 🗂️ Empleados por Sector")
+    def por_sector():
+        fig2, ax2 = plt.subplots()
+        df_empleados['Sector'].value_counts().plot(kind='bar', ax=ax2, color='lightgreen')
+        ax2.set_title("Cantidad de empleados por sector")
+        return fig2
+    figuras.mostrar("por_sector", por_sector, TABLAS)
+
+    # Gráfico de conteo por Cargo
+    st.markdown("### 👷‍♂️ Empleados por Cargo")
+    def por_cargo():
+        fig3, ax3 = plt.subplots()
+        df_empleados['Cargo'].value_counts().plot(kind='bar', ax=ax3, color='salmon')
+        ax3.set_title("Cantidad de empleados por cargo")
+        return fig3
+    figuras.mostrar("por_cargo", por_cargo, TABLAS)
+
+    # Estadísticas descriptivas
+    st.subheader("📋 Estadísticas descriptivas")
+    st.dataframe(df_empleados.describe())
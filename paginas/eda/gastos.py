@@ -0,0 +1,67 @@
+"""Análisis exploratorio del dataset de gastos."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_gastos
+
+TABLAS = ("gastos",)
+
+
+def mostrar():
+    st.subheader("💸 Exploración de Gastos")
+    st.markdown("✅ Conclusiones preliminares del dataset Gasto:\n- El monto promedio por gasto es de $660, con un máximo de casi $1.200.\n- El gasto diario es estable, con picos regulares, lo que sugiere planificación.\n- Las sucursales 18, 1 y 2 son las de mayor gasto.\n- Los tipos de gasto 1 y 4 concentran la mayor parte del presupuesto.\n- No se observan outliers ni anomalías significativas.")
+
+    df_gastos = load_gastos()
+
+    # Histograma de montos
+    st.markdown("### 💰 Distribución de Montos de Gasto")
+    def montos():
+        fig1, ax1 = plt.subplots()
+        sns.histplot(df_gastos["Monto"], bins=30, kde=True, color="coral", ax=ax1)
+        ax1.set_title("Distribución de montos de gasto")
+        return fig1
+    figuras.mostrar("montos", montos, TABLAS)
+
+    # Gasto por tipo
+    st.markdown("### 🧾 Gasto por Tipo")
+    def por_tipo():
+        fig2, ax2 = plt.subplots()
+        df_gastos["IdTipoGasto"].value_counts().plot(kind="bar", ax=ax2, color="orchid")
+        ax2.set_title("Cantidad de registros por tipo de gasto")
+        return fig2
+    figuras.mostrar("por_tipo", por_tipo, TABLAS)
+
+    # Gasto por sucursal
+    st.markdown("### 🏢 Gasto total por Sucursal")
+    def por_sucursal():
+        gasto_sucursal = df_gastos.groupby("IdSucursal")["Monto"].sum().sort_values(ascending=False)
+        fig3, ax3 = plt.subplots()
+        gasto_sucursal.plot(kind="bar", ax=ax3, color="skyblue")
+        ax3.set_title("Gasto total por sucursal")
+        return fig3
+    figuras.mostrar("por_sucursal", por_sucursal, TABLAS)
+
+    # Serie temporal de gastos
+    st.markdown("### 📅 Evolución temporal de los gastos")
+    def serie_diaria():
+        serie = df_gastos.groupby("Fecha")["Monto"].sum()
+        fig4, ax4 = plt.subplots()
+        serie.plot(ax=ax4, color="green")
+        ax4.set_title("Gastos diarios totales")
+        return fig4
+    figuras.mostrar("serie_diaria", serie_diaria, TABLAS)
+
+    # Heatmap de correlación
+    st.markdown("### 🔥 Correlación entre variables numéricas")
+    def correlaciones():
+        fig5, ax5 = plt.subplots()
+        sns.heatmap(df_gastos.select_dtypes(include="number").corr(), annot=True, cmap="coolwarm", ax=ax5)
+        ax5.set_title("Matriz de correlaciones - Gastos")
+        return fig5
+    figuras.mostrar("correlaciones", correlaciones, TABLAS)
+
+    # Estadísticas
+    st.subheader("📋 Estadísticas descriptivas")
+    st.dataframe(df_gastos.describe(include="number"))
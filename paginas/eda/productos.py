@@ -0,0 +1,60 @@
+"""Análisis exploratorio del dataset de productos."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_compras, load_productos
+
+TABLAS = ("productos", "compras")
+
+
+def mostrar():
+    st.subheader("📦 Exploración de Productos")
+    st.markdown("✅ Conclusiones del análisis del dataset PRODUCTOS_transformado.csv + Compras:\n- Catálogo con 291 productos únicos; destacan impresión e informática.\n- 10 tipos de producto; revisar duplicados por concepto.\n- Precios entre $400 y $2000; algunos outliers elevan el promedio.\n- Producto más caro real: NAS QNAP ($9555). Más barato: funda para tablet ($3).\n- Top comprados: valijas, cartuchos, mouse pad, etc.\n- Alta rotación de insumos sugiere operación comercial o institucional.\n- Posible análisis futuro de rentabilidad y rotación con datos de ventas.")
+
+    df_productos = load_productos()
+
+    # Histograma de precios
+    st.markdown("### 💰 Distribución de precios (con outliers)")
+    def precios():
+        fig1, ax1 = plt.subplots()
+        sns.histplot(df_productos["Precio"], bins=50, ax=ax1, color="skyblue")
+        ax1.set_title("Distribución de precios de productos")
+        return fig1
+    figuras.mostrar("precios", precios, TABLAS)
+
+    # Productos más comprados con nombres
+    st.markdown("### 🏆 Top 10 productos más comprados (con nombre)")
+    def top_nombres():
+        df_compras = load_compras(columnas=["IdProducto"])
+        top_ids = df_compras["IdProducto"].value_counts().head(10).reset_index()
+        top_ids.columns = ["IdProducto", "Total"]
+
+        # Merge con productos para obtener nombres
+        top_nombres = top_ids.merge(df_productos[["ID_PRODUCTO", "Concepto"]], left_on="IdProducto", right_on="ID_PRODUCTO")
+
+        fig, ax = plt.subplots()
+        sns.barplot(data=top_nombres, x="Total", y="Concepto", ax=ax, palette="Blues_d")
+        ax.set_title("Productos más comprados (por nombre)")
+        ax.set_xlabel("Cantidad comprada")
+        ax.set_ylabel("Producto")
+        return fig
+    figuras.mostrar("top_nombres", top_nombres, TABLAS)
+
+
+    # Top productos más comprados
+    st.markdown("### 🥇 Productos más comprados (Top 10)")
+    def top_ids():
+        df_compras = load_compras(columnas=["IdProducto"])
+        top_ids = df_compras["IdProducto"].value_counts().head(10)
+        fig3, ax3 = plt.subplots()
+        top_ids.plot(kind="bar", ax=ax3, color="lightgreen")
+        ax3.set_title("Top productos más comprados")
+        ax3.set_xlabel("IdProducto")
+        return fig3
+    figuras.mostrar("top_ids", top_ids, TABLAS)
+
+    # Estadísticas descriptivas
+    st.subheader("📋 Estadísticas descriptivas de precios")
+    st.dataframe(df_productos.describe())
@@ -0,0 +1,39 @@
+"""Análisis exploratorio del dataset de proveedores."""
+import streamlit as st
+import matplotlib.pyplot as plt
+
+import figuras
+from datos import load_proveedores
+
+TABLAS = ("proveedores",)
+
+
+def mostrar():
+    st.subheader("🏭 Exploración de Proveedores")
+    st.markdown("✅ Conclusiones del análisis del dataset Proveedores:\n- Hay un total de 14 proveedores registrados, todos en Argentina.\n- La mayoría se encuentran en la provincia de Buenos Aires, especialmente en el departamento capital.\n- Hay 3 proveedores repetidos por nombre, lo que sugiere sucursales o registros duplicados.\n- El dataset parece limpio, sin valores nulos, aunque podría mejorarse agregando CUIT, rubros, emails o teléfonos.")
+
+    df_proveedores = load_proveedores()
+
+    # Proveedores por provincia
+    st.markdown("### 🗺️ Proveedores por Provincia")
+    def por_provincia():
+        fig1, ax1 = plt.subplots()
+        df_proveedores['State'].value_counts().plot(kind='bar', ax=ax1, color='skyblue')
+        ax1.set_title("Cantidad de proveedores por provincia")
+        return fig1
+    figuras.mostrar("por_provincia", por_provincia, TABLAS)
+
+    # Proveedores por ciudad
+    st.markdown("### 🏙️ Proveedores por Ciudad")
+    def por_ciudad():
+        fig2, ax2 = plt.subplots()
+        df_proveedores['City'].value_counts().head(10).plot(kind='bar', ax=ax2, color='coral')
+        ax2.set_title("Top 10 ciudades con más proveedores")
+        return fig2
+    figuras.mostrar("por_ciudad", por_ciudad, TABLAS)
+
+    # Duplicados por nombre
+    st.markdown("### 🔍 Posibles Duplicados por Nombre")
+    duplicados = df_proveedores['Nombre'].value_counts()
+    duplicados = duplicados[duplicados > 1]
+    st.dataframe(duplicados)
@@ -0,0 +1,42 @@
+"""Análisis exploratorio del dataset de sucursales."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import folium
+from streamlit_folium import st_folium
+
+import figuras
+from datos import load_sucursales
+
+TABLAS = ("sucursales",)
+
+
+def mostrar():
+    st.subheader("🏢 Exploración de Sucursales")
+    st.markdown("✅ Conclusiones del análisis del dataset Sucursales:\n- La empresa tiene 31 sucursales distribuidas en 17 provincias argentinas.\n- La mayor presencia está en Buenos Aires (9 sucursales).\n- Varias localidades clave tienen más de una sucursal: CABA, Rosario, Mendoza, etc.\n- Las coordenadas permiten análisis espaciales y mapas.\n- Hay posibles redundancias en nombres de localidades (\"CABA\" y \"Ciudad de Buenos Aires\").")
+
+    df_sucursales = load_sucursales()
+
+    # Conteo por provincia
+    st.markdown("### 🗺️ Cantidad de sucursales por provincia")
+    def por_provincia():
+        fig1, ax1 = plt.subplots()
+        df_sucursales["Provincia"].value_counts().plot(kind="bar", ax=ax1, color="lightblue")
+        ax1.set_title("Sucursales por provincia")
+        return fig1
+    figuras.mostrar("por_provincia", por_provincia, TABLAS)
+
+    # Conteo por localidad
+    st.markdown("### 🏙️ Top localidades con más sucursales")
+    def top_localidades():
+        fig2, ax2 = plt.subplots()
+        df_sucursales["Localidad"].value_counts().head(10).plot(kind="bar", ax=ax2, color="lightgreen")
+        ax2.set_title("Top localidades")
+        return fig2
+    figuras.mostrar("top_localidades", top_localidades, TABLAS)
+
+    # Mapa de sucursales
+    st.markdown("### 🌍 Mapa geográfico de sucursales")
+    mapa = folium.Map(location=[df_sucursales["Latitud"].mean(), df_sucursales["Longitud"].mean()], zoom_start=5)
+    for _, row in df_sucursales.iterrows():
+        folium.Marker(location=[row["Latitud"], row["Longitud"]], popup=row["Sucursal"]).add_to(mapa)
+    st_folium(mapa, width=700, height=400)
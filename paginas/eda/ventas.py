@@ -0,0 +1,64 @@
+"""Análisis exploratorio del dataset de ventas."""
+import streamlit as st
+import matplotlib.pyplot as plt
+import seaborn as sns
+
+import figuras
+from datos import load_ventas
+from cubo import rollup, etiquetar
+
+# Los gráficos salen del cubo de ventas, con los nombres de producto, canal y sucursal
+TABLAS = ("ventas", "productos", "canal", "sucursales")
+
+
+def mostrar():
+    st.subheader("💰 Exploración de Ventas")
+    st.markdown("✅ Conclusiones del análisis del dataset Ventas:\n- El volumen de ventas es muy alto (más de 46.000 registros).\n- La mayoría de las ventas son de 1 a 3 unidades, con pocos casos mayores a 10.\n- Las ventas diarias son constantes, con picos estacionales.\n- Los productos más vendidos incluyen:\n    - Periféricos (mouse pads)\n    - Estuchería (mochilas y fundas)\n    - Insumos (cartuchos, limpiadores)\n- Hay una coherencia importante con los productos más comprados, lo que sugiere buena planificación de stock.")
+
+    # Ventas mensuales
+    st.markdown("### 📅 Ventas mensuales")
+    def mensuales():
+        ventas_mensuales = rollup(["Mes"]).set_index("Mes")["Registros"]
+        fig1, ax1 = plt.subplots()
+        ventas_mensuales.plot(ax=ax1, color="green")
+        ax1.set_title("Ventas mensuales")
+        return fig1
+    figuras.mostrar("mensuales", mensuales, TABLAS)
+
+  # Ventas por canal
+    st.markdown("### 🛍️ Ventas por canal")
+    def por_canal():
+        fig2, ax2 = plt.subplots()
+        ventas_canal = etiquetar(rollup(["IdCanal"])).set_index("Canal")["Registros"]
+        ventas_canal.sort_values(ascending=False).plot(kind="bar", ax=ax2, color="skyblue")
+        ax2.set_title("Cantidad de ventas por canal (con nombres)")
+        return fig2
+    figuras.mostrar("por_canal", por_canal, TABLAS)
+
+    # Ventas por sucursal
+    st.markdown("### 🏢 Ventas por sucursal")
+    def por_sucursal():
+        fig3, ax3 = plt.subplots()
+        ventas_sucursal = etiquetar(rollup(["IdSucursal"])).set_index("Sucursal")["Registros"]
+        ventas_sucursal.sort_values(ascending=False).plot(kind="bar", ax=ax3, color="orange")
+        ax3.set_title("Ventas por sucursal (con nombre)")
+        return fig3
+    figuras.mostrar("por_sucursal", por_sucursal, TABLAS)
+
+    # Top productos más vendidos (con nombre)
+    st.markdown("### 🏆 Top 10 productos más vendidos (por nombre)")
+    def top_productos():
+        top_ventas = rollup(["IdProducto"]).nlargest(10, "Registros").rename(columns={"Registros": "Total"})
+        top_ventas = etiquetar(top_ventas)
+
+        fig, ax = plt.subplots()
+        sns.barplot(data=top_ventas, x="Total", y="Concepto", ax=ax, palette="Blues_d")
+        ax.set_title("Productos más vendidos (por nombre)")
+        ax.set_xlabel("Cantidad vendida")
+        ax.set_ylabel("Producto")
+        return fig
+    figuras.mostrar("top_productos", top_productos, TABLAS)
+
+    # Estadísticas descriptivas
+    st.subheader("📋 Estadísticas descriptivas")
+    st.dataframe(load_ventas().describe(include="number"))
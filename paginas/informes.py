@@ -0,0 +1,40 @@
+"""Última tanda de informes generada con ``python informes.py``, sin volver a ejecutar las páginas."""
+import streamlit as st
+import streamlit.components.v1 as components
+
+import informes
+
+
+def mostrar():
+    manifiesto = informes.ultimo()
+    if manifiesto is None:
+        st.info("Todavía no se generaron informes. Se generan con `python informes.py`.")
+        return
+
+    st.caption(f"Generados el {manifiesto['generado']} en {manifiesto['directorio']}.")
+    if not informes.vigente(manifiesto):
+        st.warning("⚠️ Los datos cambiaron desde que se generaron estos informes: pueden estar desactualizados.")
+
+    opciones = {f"{p['seccion']} / {p['titulo']}": p for p in manifiesto["paginas"]}
+    pagina = opciones[st.selectbox("Seleccioná el informe:", list(opciones))]
+
+    bloques = informes.bloques(manifiesto, pagina)
+    if not bloques:
+        st.info(f"Este informe no se puede mostrar acá; está en {pagina['carpeta']}/index.html.")
+    for tipo, contenido in bloques:
+        if tipo == "titulo":
+            st.subheader(contenido)
+        elif tipo == "texto":
+            st.markdown(contenido)
+        elif tipo == "error":
+            st.error(contenido)
+        elif tipo == "imagen" and contenido.endswith(".svg"):
+            with open(contenido, encoding="utf-8") as archivo:
+                st.image(archivo.read(), width="stretch")
+        elif tipo == "imagen":
+            st.image(contenido, width="stretch")
+        elif tipo == "html":
+            with open(contenido, encoding="utf-8") as archivo:
+                components.html(archivo.read(), height=620, scrolling=True)
+        elif tipo == "tabla":
+            st.html(contenido)
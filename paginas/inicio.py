@@ -0,0 +1,7 @@
+"""Pantalla de bienvenida."""
+import streamlit as st
+
+
+def mostrar():
+    st.markdown("Bienvenido al panel interactivo de análisis, exploración y predicción.")
+    st.markdown("Usá el menú de la izquierda para navegar por las secciones.")
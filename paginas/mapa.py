@@ -0,0 +1,103 @@
+"""Mapa de sucursales y ventas de sus empleados."""
+import streamlit as st
+import folium
+import plotly.express as px
+from streamlit_folium import st_folium
+
+from datos import load_empleados, load_sucursales
+from hechos import hechos_ventas
+from geografia import asignar, area_de_influencia
+
+
+def mostrar():
+    # Cargar los datos
+    sucursales_df = load_sucursales()
+    empleados_df = load_empleados()
+
+    # Limpiar columnas
+    sucursales_df.columns = sucursales_df.columns.str.strip()
+    empleados_df.columns = empleados_df.columns.str.strip()
+
+    # Selector de sucursales
+    sucursal_seleccionada = st.selectbox("Selecciona una sucursal", ["Todas"] + list(sucursales_df["Sucursal"].unique()))
+
+    # Crear mapa base
+    mapa = folium.Map(location=[sucursales_df["Latitud"].mean(), sucursales_df["Longitud"].mean()], zoom_start=5)
+
+    if sucursal_seleccionada == "Todas":
+        for _, row in sucursales_df.iterrows():
+            folium.Marker([row["Latitud"], row["Longitud"]], popup=row["Sucursal"]).add_to(mapa)
+    else:
+        row = sucursales_df[sucursales_df["Sucursal"] == sucursal_seleccionada].iloc[0]
+        folium.Marker([row["Latitud"], row["Longitud"]], popup=row["Sucursal"]).add_to(mapa)
+
+    st_folium(mapa, width=700, height=500)
+
+    # Empleados por sucursal
+    st.subheader("👔 Empleados por sucursal")
+    empleados_por_sucursal = empleados_df.groupby("Sucursal", observed=True)["ID_empleado"].count().reset_index()
+    st.bar_chart(empleados_por_sucursal.set_index("Sucursal"))
+
+    if sucursal_seleccionada != "Todas":
+        st.subheader(f"👥 Empleados en {sucursal_seleccionada}")
+        empleados_sucursal = empleados_df[empleados_df["Sucursal"] == sucursal_seleccionada]
+        st.dataframe(empleados_sucursal[["Nombre", "Apellido", "Cargo"]])
+
+        if not empleados_sucursal.empty:
+            empleado_seleccionado = st.selectbox("Selecciona un empleado", empleados_sucursal["Nombre"].unique())
+
+            # Ventas de los empleados de la sucursal desde 2015 (ya unidas a empleados)
+            ventas_df = hechos_ventas(columnas=["Fecha", "EmpleadoNombre", "EmpleadoApellido", "EmpleadoSucursal", "Ingreso"])
+            ventas_df = ventas_df[(ventas_df["Fecha"] >= "2015-01-01") & (ventas_df["EmpleadoSucursal"] == sucursal_seleccionada)]
+            ventas_df = ventas_df.rename(columns={
+                "EmpleadoNombre": "Nombre",
+                "EmpleadoApellido": "Apellido",
+                "EmpleadoSucursal": "Sucursal",
+                "Ingreso": "Ventas_totales"
+            })
+
+            # Agrupación de ventas por empleado
+            resumen_ventas = ventas_df.groupby(["Nombre", "Apellido", "Sucursal"], observed=True)["Ventas_totales"].sum().reset_index()
+            ventas_filtradas = resumen_ventas[resumen_ventas["Nombre"] == empleado_seleccionado]
+
+            st.subheader(f"📈 Ventas de {empleado_seleccionado} desde 2015")
+            st.write(ventas_filtradas[["Nombre", "Apellido", "Ventas_totales"]])
+
+            # Gráfico
+            fig = px.bar(ventas_filtradas, x="Nombre", y="Ventas_totales", color="Sucursal",
+                         title=f"Ventas de {empleado_seleccionado} en {sucursal_seleccionada}")
+            st.plotly_chart(fig)
+
+            # Comparación de ventas totales por empleado
+            st.subheader("Comparación de ventas por empleado")
+            empleado_comparar = st.selectbox("Selecciona otro empleado para comparar", empleados_sucursal["Nombre"].unique())
+
+            resumen_por_nombre = resumen_ventas.groupby("Nombre", observed=True)["Ventas_totales"].sum().reset_index()
+            resumen_comparativo = resumen_por_nombre[resumen_por_nombre["Nombre"].isin([empleado_seleccionado, empleado_comparar])]
+
+            fig = px.bar(resumen_comparativo, x="Nombre", y="Ventas_totales", color="Nombre",
+                         title=f"Comparación de ventas totales en {sucursal_seleccionada}")
+
+            st.plotly_chart(fig)
+
+            # Comparación de todos los empleados de la sucursal
+            st.subheader("Ventas por empleado en la sucursal")
+            resumen_sucursal = resumen_por_nombre.sort_values(by="Ventas_totales", ascending=False)
+
+            fig_all = px.bar(resumen_sucursal, x="Nombre", y="Ventas_totales", color="Nombre",
+                             title=f"Ventas totales por empleado en {sucursal_seleccionada}")
+            st.plotly_chart(fig_all)
+
+    # Proximidad logística: sucursal más cercana de cada cliente y proveedor (ver geografia.py)
+    st.subheader("🚚 Proximidad de clientes y proveedores")
+    influencia = area_de_influencia("clientes")
+    proveedores_cercanos = asignar("proveedores", k=1)
+    if sucursal_seleccionada != "Todas":
+        influencia = influencia[influencia["Sucursal"] == sucursal_seleccionada]
+        proveedores_cercanos = proveedores_cercanos[proveedores_cercanos["Sucursal"] == sucursal_seleccionada]
+
+    st.markdown("##### 👥 Clientes que tienen a cada sucursal como la más cercana (distancias en km)")
+    st.dataframe(influencia.drop(columns="IdSucursal"))
+
+    st.markdown("##### 🏭 Sucursal más cercana a cada proveedor")
+    st.dataframe(proveedores_cercanos[["Nombre", "Sucursal", "DistanciaKm"]])
@@ -0,0 +1,82 @@
+"""Modelos de ML sobre canales de venta: efectividad y segmentación."""
+import streamlit as st
+import plotly.express as px
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from hechos import hechos_ventas
+from modelos import ajustar
+
+
+def mostrar():
+    st.subheader("🌐 Análisis del canal de ventas")
+
+    submenu = st.radio("Seleccioná el tipo de análisis:", [
+        "📊 Comparativo de efectividad por canal",
+        "📈 Segmentación de canales por rendimiento"
+    ])
+
+    # ✅ Ventas con la descripción del canal ya resuelta
+    df = hechos_ventas(columnas=["IdVenta", "IdCliente", "Cantidad", "Canal"])
+
+    if submenu == "📊 Comparativo de efectividad por canal":
+        st.markdown("#### 📊 Comparativo de métricas por canal de venta")
+
+        resumen = df.groupby("Canal", observed=True).agg({
+            "Cantidad": "sum",
+            "IdCliente": "nunique",
+            "IdVenta": "count"
+        }).reset_index().rename(columns={
+            "Cantidad": "Total Vendido",
+            "IdCliente": "Clientes únicos",
+            "IdVenta": "Transacciones"
+        })
+
+        resumen["Promedio por cliente"] = resumen["Total Vendido"] / resumen["Clientes únicos"]
+        st.dataframe(resumen)
+
+        fig = px.bar(
+            resumen,
+            x="Canal", y="Total Vendido", color="Canal",
+            title="Total de productos vendidos por canal",
+            labels={"Total Vendido": "Cantidad"}
+        )
+        fig.update_layout(showlegend=False)
+        st.plotly_chart(fig)
+
+    elif submenu == "📈 Segmentación de canales por rendimiento":
+        st.markdown("#### 📈 Clusterización de canales según métricas de desempeño")
+
+        df_cluster = df.groupby("Canal", observed=True).agg({
+            "Cantidad": "sum",
+            "IdCliente": "nunique",
+            "IdVenta": "count"
+        }).rename(columns={
+            "Cantidad": "Total Vendido",
+            "IdCliente": "Clientes únicos",
+            "IdVenta": "Transacciones"
+        })
+
+        df_cluster["Promedio por cliente"] = df_cluster["Total Vendido"] / df_cluster["Clientes únicos"]
+
+
+        features = ["Total Vendido", "Clientes únicos", "Transacciones", "Promedio por cliente"]
+        X = df_cluster[features]
+
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+
+        kmeans = ajustar(KMeans(n_clusters=3, random_state=42, n_init=10), X_scaled)
+        df_cluster["Cluster"] = kmeans.labels_
+
+        df_cluster_reset = df_cluster.reset_index()
+
+        st.dataframe(df_cluster_reset)
+
+        fig = px.scatter(
+            df_cluster_reset,
+            x="Total Vendido", y="Promedio por cliente",
+            size="Transacciones", color="Cluster", hover_name="Canal",
+            title="Segmentación de canales de venta (KMeans)"
+        )
+        st.plotly_chart(fig)
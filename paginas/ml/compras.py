@@ -0,0 +1,97 @@
+"""Modelos de ML sobre compras: predicción de demanda."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import mean_squared_error
+
+from datos import load_compras
+from codificacion import modelo_lineal, modelo_arboles
+from modelos import ajustar
+from pronosticos import pronostico, SERIE_COMPRAS
+
+
+def mostrar():
+    st.subheader("🛍️ Predicción de demanda de productos")
+    modelo = st.selectbox("Elegí un modelo de ML:", [
+        "Regresión Lineal", "Random Forest", "ARIMA (Series Temporales)"
+    ])
+
+    df = load_compras()
+
+    if modelo in ["Regresión Lineal", "Random Forest"]:
+        df["mes"] = df["Fecha"].dt.month
+        df["año"] = df["Fecha"].dt.year
+
+        features = ["mes", "año"]
+        if "IdProducto" in df.columns:
+            features.append("IdProducto")
+        if "IdProveedor" in df.columns:
+            features.append("IdProveedor")
+
+        X = df[features]
+        y = df["Cantidad"]
+
+        # Producto y proveedor se codifican dentro del pipeline, ajustados sólo con el entrenamiento
+        categoricas = [c for c in ["IdProducto", "IdProveedor"] if c in features]
+        numericas = [c for c in features if c not in categoricas]
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42)
+
+        if modelo == "Regresión Lineal":
+            model = modelo_lineal(LinearRegression(), numericas, categoricas)
+            st.markdown("#### 🧠 Sobre el modelo: Regresión Lineal")
+            st.markdown("""
+            Modelo simple que busca predecir la cantidad comprada a partir de variables como mes, año, producto y proveedor.
+            Es útil para observar tendencias generales.
+            """)
+        else:
+            model = modelo_arboles(RandomForestRegressor(n_estimators=100, random_state=42), numericas, categoricas)
+            st.markdown("#### 🌲 Sobre el modelo: Random Forest")
+            st.markdown("""
+            Modelo basado en árboles de decisión, más robusto ante relaciones no lineales.
+            Mejora la precisión en escenarios más complejos como compras por proveedor y producto.
+            """)
+
+        model = ajustar(model, X_train, y_train)
+        y_pred = model.predict(X_test)
+
+        try:
+            rmse = np.sqrt(mean_squared_error(y_test, np.ravel(y_pred)))
+            st.write(f"🔍 Error cuadrático medio (RMSE): {rmse:.2f}")
+        except Exception as e:
+            st.error(f"❌ Error en cálculo de RMSE: {e}")
+
+        try:
+            st.markdown("#### 📊 Comparación entre valores reales y predichos")
+            chart_df = pd.DataFrame({
+                "Real": y_test.values[:50],
+                "Predicho": np.ravel(y_pred)[:50]
+            })
+            st.line_chart(chart_df)
+        except Exception as e:
+            st.error(f"❌ Error en gráfico: {e}")
+
+    elif modelo == "ARIMA (Series Temporales)":
+        st.info("Usando solo la serie temporal agregada total por mes.")
+        st.markdown("#### ⏳ Sobre el modelo: ARIMA")
+        st.markdown("""
+        ARIMA es un modelo estadístico para series temporales que predice la cantidad total de productos comprados mes a mes,
+        a partir del comportamiento histórico de la demanda.
+        """)
+
+        df_ts = df.copy()
+        df_ts = df_ts.set_index("Fecha").resample("M").sum(numeric_only=True)["Cantidad"]
+
+        st.line_chart(df_ts)
+
+        # Pronóstico ya calculado en lote junto con el de los productos (ver pronosticos.py)
+        forecast, diagnostico = pronostico(SERIE_COMPRAS)
+        if diagnostico is None or diagnostico["Error"]:
+            st.error(f"❌ Error en modelo ARIMA: {diagnostico['Error'] if diagnostico else 'sin pronóstico'}")
+        else:
+            st.write("📈 Predicción para los próximos 6 meses:")
+            st.line_chart(forecast)
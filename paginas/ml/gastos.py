@@ -0,0 +1,95 @@
+"""Modelos de ML sobre gastos: detección de gastos anómalos."""
+import streamlit as st
+import plotly.express as px
+
+from datos import load_gastos, load_sucursales, load_tipos_gasto
+from anomalias import puntajes_gastos
+from dispersion import scatter
+
+
+def mostrar():
+    st.subheader("💸 Análisis de gastos")
+
+    submenu = st.radio("Seleccioná el tipo de análisis:", [
+        "📊 Análisis general de gastos",
+        "🏢 Análisis por sucursal",
+        "🧾 Análisis por tipo de gasto"
+    ])
+
+    df = load_gastos()
+    df_tipos = load_tipos_gasto()
+    df_suc = load_sucursales()
+
+    # Puntajes de Isolation Forest ya calculados en lote para todos los gastos (ver anomalias.py)
+    df = df.merge(puntajes_gastos(), on="IdGasto", how="left")
+
+    if submenu == "📊 Análisis general de gastos":
+        st.markdown("#### 📊 Detección general de outliers con Isolation Forest")
+
+        df = df.merge(df_tipos, left_on="IdTipoGasto", right_on="IdTipoGasto", how="left")
+        df = df.merge(df_suc, left_on="IdSucursal", right_on="ID", how="left")
+
+        df_filtrado = df[["Monto", "Descripcion", "Sucursal", "AtipicoGeneral"]].dropna()
+        df_filtrado["anomaly"] = df_filtrado.pop("AtipicoGeneral").map({True: -1, False: 1})
+        df_filtrado["color"] = df_filtrado["anomaly"].map({1: "Normal", -1: "Atípico"})
+
+        st.markdown("#### 📌 Resumen de detecciones")
+        st.dataframe(df_filtrado[df_filtrado["color"] == "Atípico"].sort_values(by="Monto", ascending=False))
+
+        try:
+            fig = scatter(df_filtrado, x="Descripcion", y="Monto", destacar=df_filtrado["anomaly"] == -1,
+                          color="color", hover_data=["Sucursal"], title="Gastos detectados como atípicos por tipo")
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"❌ Error al generar el gráfico: {e}")
+
+    elif submenu == "🏢 Análisis por sucursal":
+        st.markdown("#### 🏢 Historial de gastos por sucursal con media general")
+
+        df = df.merge(df_suc, left_on="IdSucursal", right_on="ID", how="left")
+        df_grouped = df.groupby(["Fecha", "Sucursal"]).agg({"Monto": "sum"}).reset_index()
+
+        sucursales_disp = df_grouped["Sucursal"].dropna().unique().tolist()
+        sucursales_seleccionadas = st.multiselect("Seleccioná una o más sucursales:", sucursales_disp, default=sucursales_disp)
+        df_grouped = df_grouped[df_grouped["Sucursal"].isin(sucursales_seleccionadas)]
+
+        promedio = df_grouped.groupby("Fecha")["Monto"].mean().reset_index(name="MediaGeneral")
+        df_plot = df_grouped.merge(promedio, on="Fecha")
+
+        try:
+            fig = px.line(df_plot, x="Fecha", y="Monto", color="Sucursal",
+                          title="Evolución de gastos por sucursal", labels={"Monto": "Monto gastado"})
+            fig.add_scatter(x=df_plot["Fecha"], y=df_plot["MediaGeneral"], mode="lines",
+                            name="Media General", line=dict(color="black", dash="dash"))
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"❌ Error en gráfico histórico: {e}")
+
+        st.markdown("#### 🚩 Gastos atípicos dentro de cada sucursal")
+        atipicos = df[df["AtipicoSucursal"].eq(True) & df["Sucursal"].isin(sucursales_seleccionadas)]
+        st.dataframe(atipicos[["Fecha", "Sucursal", "IdTipoGasto", "Monto", "PuntajeSucursal"]]
+                     .sort_values(by="PuntajeSucursal", ascending=False))
+
+    elif submenu == "🧾 Análisis por tipo de gasto":
+        st.markdown("#### 🧾 Outliers dentro de cada tipo de gasto")
+
+        df = df.merge(df_tipos, left_on="IdTipoGasto", right_on="IdTipoGasto", how="left")
+        df = df.merge(df_suc, left_on="IdSucursal", right_on="ID", how="left")
+
+        tipos = df["Descripcion"].dropna().unique()
+        tipo_seleccionado = st.selectbox("Seleccioná un tipo de gasto:", tipos)
+
+        df_tipo = df[df["Descripcion"] == tipo_seleccionado]
+        df_tipo = df_tipo[["Monto", "Sucursal", "AtipicoTipo"]].dropna()
+        df_tipo["anomaly"] = df_tipo.pop("AtipicoTipo").map({True: -1, False: 1})
+        df_tipo["color"] = df_tipo["anomaly"].map({1: "Normal", -1: "Atípico"})
+
+        st.markdown(f"#### 📊 Detección de outliers en {tipo_seleccionado}")
+        st.dataframe(df_tipo[df_tipo["color"] == "Atípico"])  # Mostrar detalle con sucursal
+
+        try:
+            fig = scatter(df_tipo, x="Sucursal", y="Monto", destacar=df_tipo["anomaly"] == -1, color="color",
+                          title=f"Outliers detectados en {tipo_seleccionado}")
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"❌ Error al generar el gráfico: {e}")
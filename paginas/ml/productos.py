@@ -0,0 +1,124 @@
+"""Modelos de ML sobre productos: recomendación, series temporales y ranking mensual."""
+import streamlit as st
+import pandas as pd
+import calendar
+
+from datos import load_productos
+from cubo import rollup, etiquetar
+from pronosticos import pronostico, serie_producto
+from similitud import productos_similares
+from dispersion import scatter
+
+
+def mostrar():
+    st.subheader("📦 Análisis de productos")
+
+    submenu = st.radio("Seleccioná el tipo de análisis:", [
+        "🤝 Recomendación de productos",
+        "📈 Predicción temporal de ventas",
+        "🔝 Top 10 productos por mes"
+    ])
+
+    df_productos = load_productos()
+
+    if submenu == "🤝 Recomendación de productos":
+        st.markdown("#### 🤝 Sistema de recomendación basado en volumen de compra")
+        st.markdown("""
+        Este sistema utiliza KNN (vecinos más cercanos) para encontrar productos relacionados
+        según los patrones de compra de los clientes.
+        Recomendamos productos similares al seleccionado, basándonos en clientes que compraron ambos.
+        """)
+
+        producto_ids = rollup(["IdProducto"])["IdProducto"].tolist()
+        producto_nombres = df_productos[df_productos["ID_PRODUCTO"].isin(producto_ids)][["ID_PRODUCTO", "Concepto"]].drop_duplicates()
+        producto_opciones = producto_nombres.set_index("Concepto").to_dict()["ID_PRODUCTO"]
+
+        producto_nombre_sel = st.selectbox("Seleccioná un producto:", list(producto_opciones.keys()))
+        producto_id_sel = producto_opciones[producto_nombre_sel]
+
+        # Vecinos coseno de cada producto, precalculados por versión de las ventas
+        recomendados = productos_similares(producto_id_sel, cantidad=5)
+
+        st.write("### Productos recomendados:")
+        for prod_id, similitud in recomendados.itertuples(index=False):
+            descripcion = df_productos[df_productos["ID_PRODUCTO"] == prod_id]["Concepto"].values
+            st.markdown(f"- {descripcion[0] if len(descripcion) else prod_id} (similaridad: {similitud:.2f})")
+
+    elif submenu == "📈 Predicción temporal de ventas":
+        st.markdown("#### 📈 Predicción de ventas futuras por producto (ARIMA)")
+        st.markdown("""
+        Este análisis muestra la evolución histórica de las ventas de un producto y proyecta su comportamiento
+        para los próximos 6 meses utilizando un modelo ARIMA.
+        """)
+
+        productos_disp = etiquetar(rollup(["IdProducto"]))[["IdProducto", "Concepto"]]
+
+        producto_nombre = st.selectbox("Seleccioná un producto:", productos_disp["Concepto"].tolist())
+        producto_id = productos_disp[productos_disp["Concepto"] == producto_nombre]["IdProducto"].values[0]
+
+        # Serie mensual del producto desde el cubo (meses sin ventas en 0)
+        df_ts = rollup(["Mes"], {"IdProducto": producto_id}).set_index("Mes")["Cantidad"]
+        df_ts = df_ts.asfreq("MS", fill_value=0)
+
+        st.line_chart(df_ts)
+
+        # Pronóstico ya calculado en lote para todos los productos (ver pronosticos.py)
+        forecast, diagnostico = pronostico(serie_producto(producto_id))
+        if diagnostico is None:
+            st.error("❌ Error al generar el modelo ARIMA: no hay pronóstico para este producto")
+        elif diagnostico["Error"]:
+            st.error(f"❌ Error al generar el modelo ARIMA: {diagnostico['Error']}")
+        else:
+            st.markdown("#### 📊 Predicción para los próximos 6 meses")
+            st.line_chart(forecast)
+
+    elif submenu == "🔝 Top 10 productos por mes":
+        st.markdown("#### 🔝 Top 10 productos más vendidos por mes")
+
+        # Meses con ventas, desde el cubo
+        meses = rollup(["Mes"])["Mes"]
+
+        # Filtros año y mes
+        años_disponibles = sorted(meses.dt.year.unique())
+        año_sel = st.selectbox("Seleccioná un año:", años_disponibles)
+
+        meses_disponibles = [calendar.month_name[m] for m in meses[meses.dt.year == año_sel].dt.month.unique()]
+        mes_nombre_sel = st.selectbox("Seleccioná un mes:", sorted(meses_disponibles, key=lambda x: list(calendar.month_name).index(x)))
+        mes_sel = list(calendar.month_name).index(mes_nombre_sel)
+
+        # Cantidad vendida por producto en el mes elegido
+        df_filtrado = etiquetar(rollup(["IdProducto"], {"Mes": pd.Timestamp(año_sel, mes_sel, 1)}))
+
+        # TOP 10 productos más vendidos
+        top10 = df_filtrado.groupby("Concepto")["Cantidad"].sum().sort_values(ascending=False).head(10).reset_index()
+
+        st.markdown("##### 📊 Top 10 productos más vendidos")
+        st.dataframe(top10)
+
+        # Dispersión de todos los productos clasificados
+        st.markdown("##### 📈 Dispersión de productos (clasificados por cantidad vendida)")
+
+        resumen = df_filtrado.groupby("Concepto")["Cantidad"].sum().reset_index()
+        promedio = resumen["Cantidad"].mean()
+
+        def clasificar(cantidad):
+            if cantidad > promedio:
+                return "Más vendidos"
+            elif cantidad < promedio:
+                return "Menos vendidos"
+            else:
+                return "Promedio"
+
+        resumen["Clasificación"] = resumen["Cantidad"].apply(clasificar)
+
+        fig = scatter(
+            resumen,
+            x="Concepto",
+            y="Cantidad",
+            destacar=resumen["Clasificación"] == "Más vendidos",
+            color="Clasificación",
+            title=f"Dispersión de ventas por producto - {mes_nombre_sel} {año_sel}",
+            labels={"Cantidad": "Cantidad Vendida", "Concepto": "Producto"}
+        )
+        fig.update_layout(xaxis_tickangle=-45)
+        st.plotly_chart(fig)
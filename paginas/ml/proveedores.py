@@ -0,0 +1,115 @@
+"""Modelos de ML sobre proveedores: ranking, productos y proveedores similares."""
+import streamlit as st
+import plotly.express as px
+
+from datos import load_compras, load_productos, load_proveedores
+from similitud import proveedores_similares
+
+
+def mostrar():
+    st.subheader("🚚 Proveedores")
+
+    submenu = st.radio("Seleccioná el tipo de análisis:", [
+        "💰 Top 10 proveedores por gasto",
+        "📦 Productos por proveedor",
+    ])
+
+    if submenu == "💰 Top 10 proveedores por gasto":
+        st.markdown("#### 💰 Top 10 proveedores por monto total de compra")
+
+        df_compras = load_compras()
+        df_prov = load_proveedores()
+
+        # 🔧 Unir el nombre del proveedor correctamente
+        df = df_compras.merge(df_prov, left_on="IdProveedor", right_on="IDProveedor", how="left")
+
+        # 🧮 Calcular top 10 por monto total
+        top10_prov = df.groupby("Nombre")["Precio"].sum().sort_values(ascending=False).head(10).reset_index()
+        st.markdown("##### 📋 Tabla: Top 10 proveedores por monto total")
+        st.dataframe(top10_prov)
+
+        st.markdown("##### 📈 Evolución mensual del gasto por proveedor")
+
+        # 📅 Agrupar por mes
+        df["Mes"] = df["Fecha"].dt.to_period("M").dt.to_timestamp()
+        gasto_mensual = df.groupby(["Mes", "Nombre"])["Precio"].sum().reset_index()
+
+        # 🔍 Filtro de selección múltiple
+        proveedores_disp = top10_prov["Nombre"].tolist()
+        proveedores_sel = st.multiselect(
+            "Seleccioná uno o más proveedores:",
+            options=proveedores_disp,
+            default=proveedores_disp[:3]
+        )
+
+        # 📊 Gráfico
+        fig = px.line(
+            gasto_mensual[gasto_mensual["Nombre"].isin(proveedores_sel)],
+            x="Mes", y="Precio", color="Nombre",
+            labels={"Precio": "Monto de compra", "Mes": "Mes", "Nombre": "Proveedor"},
+            title="Evolución mensual del gasto por proveedor"
+        )
+        fig.update_layout(xaxis_title="Mes", yaxis_title="Monto total")
+        st.plotly_chart(fig)
+
+    elif submenu == "📦 Productos por proveedor":
+        st.markdown("#### 📦 Análisis de productos por proveedor")
+
+        sub_opcion = st.radio("Seleccioná una opción de análisis:", [
+            "🛠️ Productos por proveedor",
+            "🤝 Recomendación de productos a proveedores similares"
+        ])
+
+        df_compras = load_compras()
+        df_prov = load_proveedores()
+        df_prod = load_productos()
+
+        # Merge base
+        df = df_compras.merge(df_prov, left_on="IdProveedor", right_on="IDProveedor", how="left")
+        df = df.merge(df_prod, left_on="IdProducto", right_on="ID_PRODUCTO", how="left")
+
+        if sub_opcion == "🛠️ Productos por proveedor":
+            resumen = df.groupby(["Nombre", "Concepto"])["Cantidad"].sum().reset_index()
+            st.markdown("##### 📋 Tabla: Productos por proveedor")
+            st.dataframe(resumen)
+
+            st.markdown("##### 📊 Gráfico: Cantidad total de productos por proveedor")
+            fig = px.bar(
+                resumen,
+                x="Nombre", y="Cantidad", color="Concepto",
+                title="Cantidad de productos comprados a cada proveedor",
+                labels={"Nombre": "Proveedor", "Cantidad": "Cantidad", "Concepto": "Producto"}
+            )
+            fig.update_layout(xaxis_tickangle=-45)
+            st.plotly_chart(fig)
+
+        elif sub_opcion == "🤝 Recomendación de productos a proveedores similares":
+            st.markdown("##### 🤝 Recomendación de productos a proveedores similares (KNN)")
+
+            # Los proveedores se identifican por id: hay nombres repetidos entre ellos
+            nombres = df_prov.drop_duplicates("IDProveedor").set_index("IDProveedor")["Nombre"]
+            proveedor_opciones = {
+                f"{nombres.get(i, 'Proveedor')} (#{i})": i for i in sorted(df["IdProveedor"].unique())
+            }
+
+            proveedor_seleccionado = st.selectbox("Seleccioná un proveedor:", list(proveedor_opciones.keys()))
+            proveedor_id = proveedor_opciones[proveedor_seleccionado]
+
+            # Vecinos coseno de cada proveedor, precalculados por versión de las compras
+            similares = proveedores_similares(proveedor_id, cantidad=3)
+
+            st.markdown("#### Proveedores similares:")
+            for vecino, similitud in similares.itertuples(index=False):
+                st.write(f"- {nombres.get(vecino, 'Proveedor')} (#{vecino}) (similaridad: {similitud:.2f})")
+
+            productos_actuales = set(df[df["IdProveedor"] == proveedor_id]["IdProducto"])
+            productos_vecinos = df[df["IdProveedor"].isin(similares["Vecino"])]["IdProducto"].value_counts().head(10)
+
+            conceptos = df_prod.drop_duplicates("ID_PRODUCTO").set_index("ID_PRODUCTO")["Concepto"]
+            recomendados = [conceptos.get(p, p) for p in productos_vecinos.index if p not in productos_actuales]
+            st.markdown("#### 📦 Productos recomendados:")
+            if recomendados:
+                for p in recomendados:
+                    st.markdown(f"- {p}")
+            else:
+                st.info("Este proveedor ya ofrece los mismos productos que sus vecinos.")
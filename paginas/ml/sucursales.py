@@ -0,0 +1,163 @@
+"""Modelos de ML sobre sucursales: clusters geográficos y clasificación por ventas."""
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from sklearn.model_selection import train_test_split
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.metrics import classification_report, confusion_matrix
+
+from datos import load_ventas, load_sucursales
+from modelos import ajustar
+from geografia import CONJUNTOS, MIN_SAMPLES_MAXIMO, puntos, kmeans, dbscan
+
+# Conjunto de puntos -> eps inicial de DBSCAN (km)
+EPS_INICIAL = {"sucursales": 20.0, "clientes": 2.0, "proveedores": 50.0}
+
+
+def mostrar():
+    st.subheader("🧩 Sucursales")
+
+    submenu = st.radio("Seleccioná el tipo de análisis:", [
+        "🧹 Cluster geográfico de sucursales",
+        "📊 Clasificación por volumen de ventas"
+    ])
+
+    if submenu == "🧹 Cluster geográfico de sucursales":
+        algoritmo = st.selectbox("Elegí el algoritmo de clusterización:", ["KMeans", "DBSCAN"])
+        conjunto = st.selectbox("Elegí qué ubicaciones agrupar:", list(CONJUNTOS), format_func=str.capitalize)
+        # Distancias haversine en km, con el índice y los vecinos más cercanos ya calculados (ver geografia.py)
+        df = puntos(conjunto)
+
+        st.markdown("#### 📅 Objetivo del análisis")
+        st.markdown("""
+        Este análisis agrupa sucursales según su ubicación geográfica.
+        Se busca identificar áreas de concentración o zonas con comportamiento similar,
+        lo cual puede ser útil para tomar decisiones logísticas, comerciales o de expansión.
+        También se pueden agrupar clientes y proveedores para comparar su distribución con la de las sucursales.
+        """)
+
+        if algoritmo == "KMeans":
+
+            st.markdown("#### 🔍 Clustering con KMeans")
+            st.markdown("""
+            KMeans divide las sucursales en un número fijo de grupos, buscando minimizar la distancia dentro de cada cluster.
+            Es útil para ver agrupamientos específicos según cercanía.
+            """)
+
+            k = st.slider("Seleccioná la cantidad de clusters", 2, 6, 3)
+            df["Cluster"] = kmeans(conjunto, k)
+
+        elif algoritmo == "DBSCAN":
+            st.markdown("#### 🔎 Clustering con DBSCAN")
+            st.markdown("""
+            DBSCAN encuentra agrupamientos naturales basados en la densidad de puntos, sin necesidad de indicar la cantidad de clusters.
+            Es útil para detectar zonas aisladas o con concentración geográfica alta.
+            """)
+
+            eps = st.slider("Seleccioná el radio de agrupamiento (eps, en km)", 0.5,
+                            CONJUNTOS[conjunto]["radio_maximo_km"], EPS_INICIAL[conjunto], step=0.5)
+            min_samples = st.slider("Cantidad mínima de puntos por grupo", 2, MIN_SAMPLES_MAXIMO, 3)
+
+            df["Cluster"] = dbscan(conjunto, eps, min_samples)
+
+        st.markdown("#### 🌍 Mapa de clusters geográficos")
+        try:
+            fig = px.scatter_map(
+                df,
+                lat="Latitud",
+                lon="Longitud",
+                color="Cluster",
+                hover_name="Nombre",
+                zoom=4,
+                height=600,
+                map_style="open-street-map",
+                title=f"Distribución de {conjunto} por cluster geográfico"
+            )
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"❌ Error al generar el mapa: {e}")
+
+        st.markdown("#### 🔢 Análisis final")
+        st.markdown("""
+        El resultado de la clusterización permite observar patrones de agrupamiento espacial entre sucursales.
+        - Si las sucursales están bien agrupadas, podrían compartirse logística, recursos o estrategias regionales.
+        - Las sucursales aisladas o con comportamiento atípico podrían requerir un análisis individualizado o mejoras específicas.
+        - Con DBSCAN, la detección de outliers espaciales puede ayudar a identificar sucursales que no pertenecen a ningún cluster estable,
+          lo que podría indicar una oportunidad de mejora o una estrategia personalizada.
+        """)
+
+    elif submenu == "📊 Clasificación por volumen de ventas":
+        st.markdown("#### 📊 Agrupamiento de sucursales según nivel de ventas")
+        st.markdown("""
+        En este análisis usamos un modelo de árbol de decisión para predecir qué categoría de ventas tiene cada sucursal:
+        **Altas**, **Medias** o **Bajas**, basándonos en sus registros históricos.
+        Esto permite entender qué variables (como ventas promedio, varianza o cantidad de registros) explican mejor su desempeño.
+        """)
+
+        df_ventas = load_ventas(columnas=["IdSucursal", "Cantidad"])
+        ventas_por_sucursal = df_ventas.groupby("IdSucursal")["Cantidad"].agg([
+            ("TotalVentas", "sum"),
+            ("PromedioVentas", "mean"),
+            ("MaxVentas", "max"),
+            ("MinVentas", "min"),
+            ("Desvio", "std"),
+            ("CantidadRegistros", "count")
+        ]).reset_index()
+
+        # Crear etiquetas
+        q1 = ventas_por_sucursal["TotalVentas"].quantile(0.33)
+        q2 = ventas_por_sucursal["TotalVentas"].quantile(0.66)
+
+        def clasificar(x):
+            if x < q1:
+                return "Bajas"
+            elif x < q2:
+                return "Medias"
+            else:
+                return "Altas"
+
+        ventas_por_sucursal["Categoria"] = ventas_por_sucursal["TotalVentas"].apply(clasificar)
+
+        X = ventas_por_sucursal.drop(columns=["Categoria", "IdSucursal"])
+        y = ventas_por_sucursal["Categoria"]
+
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+        model = DecisionTreeClassifier(max_depth=3, random_state=42)
+        model = ajustar(model, X_train, y_train)
+
+        y_pred = model.predict(X_test)
+
+        st.write("### Matriz de confusión")
+        st.write(pd.DataFrame(confusion_matrix(y_test, y_pred),
+                              index=model.classes_,
+                              columns=["Pred. " + c for c in model.classes_]))
+
+        st.write("### Métricas de clasificación")
+        st.text(classification_report(y_test, y_pred))
+
+        df = load_sucursales()
+        df = df.merge(ventas_por_sucursal[["IdSucursal", "Categoria"]], left_on="ID", right_on="IdSucursal", how="left")
+
+        try:
+            st.markdown("#### 🌍 Mapa de sucursales por categoría de ventas")
+            fig = px.scatter_map(
+                df,
+                lat="Latitud",
+                lon="Longitud",
+                color="Categoria",
+                hover_name="Sucursal",
+                zoom=4,
+                height=600,
+                map_style="open-street-map",
+                title="Sucursal agrupadas por nivel de ventas"
+            )
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"\u274c Error al generar el mapa de ventas: {e}")
+
+        st.markdown("#### 🔢 Análisis final")
+        st.markdown("""
+        Gracias al modelo de árbol de decisión pudimos identificar las variables que mejor explican el rendimiento de ventas por sucursal.
+        Este análisis no solo agrupa, sino que ayuda a explicar y anticipar comportamientos según patrones históricos.
+        Puede ser de gran valor para tomar decisiones de inversión o asignación de recursos.
+        """)
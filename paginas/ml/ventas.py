@@ -0,0 +1,87 @@
+"""Modelos de ML sobre ventas: predicción y detección de outliers."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import train_test_split
+from sklearn.metrics import mean_squared_error
+
+from datos import load_ventas
+from codificacion import modelo_lineal
+from modelos import ajustar
+from anomalias import puntajes_ventas, ventas_marcadas
+from dispersion import scatter
+
+
+def mostrar():
+    st.subheader("🧾 Análisis de ventas: predicción y detección de outliers")
+
+    tarea = st.radio("¿Qué querés hacer?", [
+        "🔮 Predicción de ventas futuras",
+        "🚨 Detección de outliers o fraudes"
+    ])
+
+    df = load_ventas()
+
+    df["mes"] = df["Fecha"].dt.month
+    df["año"] = df["Fecha"].dt.year
+
+    if tarea == "🔮 Predicción de ventas futuras":
+        st.markdown("#### 🔮 Predicción de ventas con Regresión Ridge")
+        st.markdown("""
+        Se busca predecir la cantidad vendida usando Regresión Ridge, una técnica útil cuando hay muchas variables
+        correlacionadas (producto, canal, mes, año).
+        """)
+
+        features = ["mes", "año", "IdProducto", "IdCanal"]
+        X = df[features]
+        y = df["Cantidad"]
+
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42)
+
+        # One-hot disperso de producto y canal, en lugar de get_dummies denso
+        model = modelo_lineal(Ridge(alpha=1.0), ["mes", "año"], ["IdProducto", "IdCanal"])
+        model = ajustar(model, X_train, y_train)
+        y_pred = model.predict(X_test)
+
+        try:
+            rmse = np.sqrt(mean_squared_error(y_test, np.ravel(y_pred)))
+            st.write(f"🔍 Error cuadrático medio (RMSE): {rmse:.2f}")
+        except Exception as e:
+            st.error(f"❌ Error en cálculo de RMSE: {e}")
+
+        try:
+            st.markdown("#### 📊 Comparación entre valores reales y predichos")
+            chart_df = pd.DataFrame({
+                "Real": y_test.values[:50],
+                "Predicho": np.ravel(y_pred)[:50]
+            })
+            st.line_chart(chart_df)
+        except Exception as e:
+            st.error(f"❌ Error en gráfico: {e}")
+
+    elif tarea == "🚨 Detección de outliers o fraudes":
+        st.markdown("#### 🚨 Detección de outliers con Isolation Forest")
+        st.markdown("""
+        Isolation Forest detecta ventas inusuales en función de precio y cantidad.
+        Los puntos anómalos podrían ser errores de carga, promociones extremas o fraudes.
+        """)
+
+        # Modelo ajustado una vez con la historia; las ventas nuevas se puntúan al ingerirlas (ver anomalias.py)
+        df_filtrado = puntajes_ventas()
+        df_filtrado["color"] = df_filtrado["Atipico"].map({False: "Normal", True: "Outlier"})
+
+        st.markdown("#### 📌 Resultados de detección")
+        st.write(df_filtrado["color"].value_counts())
+
+        st.markdown("#### 🚩 Ventas marcadas para revisar")
+        st.dataframe(ventas_marcadas()[["IdVenta", "Fecha", "Cantidad", "Precio", "Puntaje", "Puntuada"]])
+
+        try:
+            # Con muchas ventas se muestra una muestra de los normales y todos los outliers
+            fig = scatter(df_filtrado, x="Precio", y="Cantidad", destacar="Atipico", color="color",
+                          title="Detección de outliers en ventas")
+            st.plotly_chart(fig)
+        except Exception as e:
+            st.error(f"❌ Error en visualización: {e}")
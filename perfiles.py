@@ -0,0 +1,133 @@
+"""Perfiles de cProfile y tracemalloc de un render de página, a pedido.
+
+Apagado no cuesta nada: ``paginas.mostrar`` sólo mira una bandera antes de
+mostrar la página. Se enciende de dos maneras:
+
+- con la variable de entorno ``DATAENTERPRISE_PERFILAR=1`` se perfila cada
+  render de página del proceso;
+- en la app, un administrador toca "🔬 Perfilar esta página" en la barra
+  lateral y se perfila esa ejecución.
+
+Cada perfil queda en ``.cache_datos/perfiles/<pagina>/`` como
+``AAAAMMDD-HHMMSS.prof`` (formato de ``pstats``, se abre con ``python -m
+pstats`` o snakeviz) y ``AAAAMMDD-HHMMSS.txt`` con las funciones de mayor
+tiempo acumulado y las líneas que más memoria dejaron asignada. Se conservan
+los últimos ``MAXIMO_POR_PAGINA`` de cada página.
+
+cProfile sólo mide el hilo de la sesión perfilada, pero tracemalloc mide todo
+el proceso: si otra sesión trabaja al mismo tiempo, sus asignaciones también
+aparecen. Se perfila una sola ejecución a la vez; un pedido mientras otra
+está en curso se ignora.
+"""
+import cProfile
+import glob
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+
+ENTORNO = "DATAENTERPRISE_PERFILAR"
+SIEMPRE = os.environ.get(ENTORNO, "") not in ("", "0")
+
+MAXIMO_POR_PAGINA = 5
+FUNCIONES = 40
+ASIGNACIONES = 25
+
+_lock = threading.Lock()
+
+
+def directorio():
+    # paginas importa este módulo antes del login; datos (y pandas) se cargan recién al perfilar
+    import datos
+    return os.path.join(datos.DIRECTORIO_CACHE, "perfiles")
+
+
+def carpeta(pagina):
+    ascii_ = unicodedata.normalize("NFKD", pagina).encode("ascii", "ignore").decode()
+    return os.path.join(directorio(), re.sub(r"[^a-z0-9]+", "-", ascii_.lower()).strip("-") or "pagina")
+
+
+def _informe(pagina, perfil, instantanea, pico, segundos):
+    salida = io.StringIO()
+    salida.write(f"Página: {pagina}\n")
+    salida.write(f"Duración: {segundos:.3f} s   Pico de memoria trazada: {pico / 2**20:.1f} MB\n\n")
+
+    salida.write(f"=== Funciones por tiempo acumulado (primeras {FUNCIONES}) ===\n")
+    pstats.Stats(perfil, stream=salida).strip_dirs().sort_stats("cumulative").print_stats(FUNCIONES)
+
+    salida.write(f"=== Líneas con más memoria asignada al terminar (primeras {ASIGNACIONES}) ===\n")
+    instantanea = instantanea.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    for estadistica in instantanea.statistics("lineno")[:ASIGNACIONES]:
+        salida.write(f"{estadistica.size / 2**10:10.1f} KiB {estadistica.count:8d} bloques  {estadistica.traceback}\n")
+    return salida.getvalue()
+
+
+def _guardar(pagina, perfil, instantanea, pico, segundos):
+    destino = carpeta(pagina)
+    os.makedirs(destino, exist_ok=True)
+    base = os.path.join(destino, time.strftime("%Y%m%d-%H%M%S"))
+    perfil.dump_stats(f"{base}.prof")
+    with open(f"{base}.txt", "w", encoding="utf-8") as archivo:
+        archivo.write(_informe(pagina, perfil, instantanea, pico, segundos))
+
+    for viejo in sorted(glob.glob(os.path.join(destino, "*.prof")))[:-MAXIMO_POR_PAGINA]:
+        for ruta in (viejo, viejo[:-len(".prof")] + ".txt"):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+    return {"pagina": pagina, "prof": f"{base}.prof", "txt": f"{base}.txt"}
+
+
+@contextmanager
+def perfilar(pagina):
+    """Perfila el bloque; al salir, el dict entregado tiene las rutas guardadas.
+
+    Si ya hay otro perfil en curso el bloque corre igual, sin perfilar, y el
+    dict queda vacío.
+    """
+    resultado = {}
+    if not _lock.acquire(blocking=False):
+        yield resultado
+        return
+    try:
+        perfil = cProfile.Profile()
+        # Si tracemalloc ya estaba encendido (PYTHONTRACEMALLOC) se deja como estaba
+        propio = not tracemalloc.is_tracing()
+        if propio:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        perfil.enable()
+        try:
+            yield resultado
+        finally:
+            perfil.disable()
+            segundos = time.perf_counter() - inicio
+            instantanea = tracemalloc.take_snapshot()
+            pico = tracemalloc.get_traced_memory()[1]
+            if propio:
+                tracemalloc.stop()
+            resultado.update(_guardar(pagina, perfil, instantanea, pico, segundos))
+    finally:
+        _lock.release()
+
+
+def listar():
+    """Perfiles guardados, del más reciente al más antiguo."""
+    perfiles = []
+    for prof in glob.glob(os.path.join(directorio(), "*", "*.prof")):
+        txt = prof[:-len(".prof")] + ".txt"
+        if not os.path.exists(txt):
+            continue
+        with open(txt, encoding="utf-8") as archivo:
+            pagina = archivo.readline().removeprefix("Página: ").strip()
+        fecha = time.strftime("%Y-%m-%d %H:%M:%S", time.strptime(os.path.basename(prof)[:-len(".prof")], "%Y%m%d-%H%M%S"))
+        perfiles.append({"pagina": pagina, "fecha": fecha, "prof": prof, "txt": txt})
+    return sorted(perfiles, key=lambda p: p["fecha"], reverse=True)
@@ -0,0 +1,107 @@
+"""Precarga en segundo plano de tablas y agregados.
+
+Apenas el usuario inicia sesión, ``iniciar()`` encola en un pool de hilos la
+lectura de las tablas, la tabla de hechos de ventas y los cubos que declaran
+las páginas del registro (``paginas.PAGINAS``). Mientras tanto el usuario
+sigue en "Inicio"; cuando abre una página, ``esperar()`` espera a que terminen
+las tareas que esa página necesita en lugar de empezar una segunda lectura.
+
+Esas tareas sólo llenan las cachés de ``datos``, ``hechos`` y ``cubo``, que son
+compartidas por todo el proceso, así que la precarga de una sesión también
+sirve para las demás.
+
+Los agregados de ``PESADOS`` (el lote de pronósticos ARIMA en un pool de
+procesos, los índices de similitud y los modelos de anomalías) no se precargan
+al iniciar sesión: después de un cambio en los datos cuestan de segundos a
+minutos de CPU. Los arma la primera página que los usa, o se calculan antes
+con la línea de comandos de cada módulo (``python pronosticos.py``,
+``python anomalias.py``, ...). Pedidos explícitamente con
+``iniciar(requisitos)`` sí se encolan, e ``informes.py`` los calcula antes
+de generar las páginas.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+PESADOS = (
+    "pronosticos", "similitud_productos", "similitud_proveedores", "anomalias_gastos", "anomalias_ventas",
+)
+
+_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="precarga")
+_futuros = {}
+_lock = threading.Lock()
+
+
+def _cargar(requisito):
+    # Se importan en el hilo de la precarga para no sumar pandas al login
+    import datos
+    import hechos
+    import cubo
+    import pronosticos
+    import similitud
+    import anomalias
+
+    if requisito == "hechos_ventas":
+        hechos.hechos_ventas()
+    elif requisito == "cubo_ventas":
+        cubo.cubo_ventas()
+    elif requisito == "cubo_gastos":
+        cubo.cubo_gastos()
+    elif requisito == "pronosticos":
+        pronosticos.tablas()
+    elif requisito == "similitud_productos":
+        similitud.indice_productos()
+    elif requisito == "similitud_proveedores":
+        similitud.indice_proveedores()
+    elif requisito == "anomalias_gastos":
+        anomalias.puntajes_gastos()
+    elif requisito == "anomalias_ventas":
+        anomalias.puntajes_ventas()
+    else:
+        datos.cargar(requisito)
+
+
+def requisitos_registrados():
+    """Tablas y luego agregados livianos de todas las páginas, en orden de aparición."""
+    import paginas
+
+    tablas, agregados = [], []
+    for lista in paginas.PAGINAS.values():
+        for pagina in lista:
+            tablas += [t for t in pagina["tablas"] if t not in tablas]
+            agregados += [a for a in pagina["agregados"] if a not in agregados and a not in PESADOS]
+    return tablas + agregados
+
+
+def iniciar(requisitos=None):
+    """Encola los requisitos que no estén ya en curso y devuelve sus futuros.
+
+    Un requisito ya terminado se vuelve a encolar: si los datos no cambiaron
+    la tarea sale de la caché al instante, y si cambiaron se recargan.
+    """
+    with _lock:
+        for requisito in requisitos or requisitos_registrados():
+            futuro = _futuros.get(requisito)
+            if futuro is None or futuro.done():
+                _futuros[requisito] = _pool.submit(_cargar, requisito)
+        return dict(_futuros)
+
+
+def esperar(requisitos):
+    """Espera las tareas en curso de esos requisitos (las que no se encolaron se ignoran).
+
+    Un error en la precarga no se propaga acá: la página vuelve a cargar el
+    dato por su cuenta y muestra el error en su lugar.
+    """
+    with _lock:
+        pendientes = [_futuros[r] for r in requisitos if r in _futuros]
+    wait(pendientes)
+
+
+def estado():
+    """Requisito -> "en curso", "listo" o "error", para diagnóstico."""
+    with _lock:
+        copia = dict(_futuros)
+    return {
+        requisito: "en curso" if not futuro.done() else ("error" if futuro.exception() else "listo")
+        for requisito, futuro in copia.items()
+    }
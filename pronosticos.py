@@ -0,0 +1,159 @@
+"""Pronósticos ARIMA precalculados para todos los productos.
+
+En lugar de ajustar un ARIMA(1, 1, 1) cada vez que se elige un producto,
+``calcular()`` ajusta de una vez la serie mensual de ventas de cada
+IdProducto y la serie mensual total de compras, repartidas en un pool de
+procesos, y guarda dos tablas por versión de los datos:
+
+- pronósticos: Serie, Mes, Pronostico (6 meses hacia adelante)
+- diagnósticos: Serie, Observaciones, AIC, BIC, Error, Segundos
+
+Las series se identifican como ``producto:<IdProducto>`` y ``compras:total``.
+Las páginas sólo buscan la fila que necesitan. El cálculo también se puede
+lanzar a mano con ``python pronosticos.py``.
+"""
+import argparse
+import multiprocessing
+import os
+import shutil
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+import datos
+import metricas
+
+ORDEN = (1, 1, 1)
+PASOS = 6
+SERIE_COMPRAS = "compras:total"
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def serie_producto(id_producto):
+    return f"producto:{id_producto}"
+
+
+def series():
+    """Series mensuales a pronosticar: una por producto más el total de compras."""
+    from cubo import rollup
+
+    resultado = {}
+    por_mes = rollup(["Mes", "IdProducto"])
+    for id_producto, grupo in por_mes.groupby("IdProducto", sort=True):
+        # Meses sin ventas en 0, igual que el gráfico de la página
+        resultado[serie_producto(id_producto)] = grupo.set_index("Mes")["Cantidad"].asfreq("MS", fill_value=0)
+
+    compras = datos.load_compras(columnas=["Fecha", "Cantidad"])
+    resultado[SERIE_COMPRAS] = compras.set_index("Fecha").resample("ME").sum(numeric_only=True)["Cantidad"]
+    return resultado
+
+
+def _ajustar_lote(lote):
+    """Ajusta un lote de series; corre en los procesos del pool."""
+    import statsmodels.api as sm
+
+    pronosticos, diagnosticos = [], []
+    for nombre, serie in lote:
+        inicio = time.perf_counter()
+        fila = {"Serie": nombre, "Observaciones": len(serie), "AIC": None, "BIC": None, "Error": None}
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                resultados = sm.tsa.ARIMA(serie, order=ORDEN).fit()
+            pronostico = resultados.forecast(steps=PASOS)
+            fila["AIC"], fila["BIC"] = float(resultados.aic), float(resultados.bic)
+            pronosticos.append(pd.DataFrame({
+                "Serie": nombre, "Mes": pronostico.index, "Pronostico": pronostico.to_numpy(dtype="float64"),
+            }))
+        except Exception as e:
+            fila["Error"] = str(e)
+        fila["Segundos"] = time.perf_counter() - inicio
+        diagnosticos.append(fila)
+    return pronosticos, diagnosticos
+
+
+def calcular(procesos=None):
+    """Ajusta todas las series en paralelo y devuelve (pronósticos, diagnósticos)."""
+    procesos = procesos or os.cpu_count() or 1
+    pendientes = list(series().items())
+    # Varios lotes por proceso para repartir mejor series cortas y largas
+    cantidad = max(1, min(len(pendientes), procesos * 4))
+    lotes = [pendientes[i::cantidad] for i in range(cantidad)]
+
+    pronosticos, diagnosticos = [], []
+    if procesos == 1:
+        resultados = map(_ajustar_lote, lotes)
+    else:
+        # spawn: el proceso de Streamlit tiene hilos y un fork podría quedar trabado
+        pool = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context("spawn"))
+        with pool:
+            resultados = list(pool.map(_ajustar_lote, lotes))
+    for parcial_pronosticos, parcial_diagnosticos in resultados:
+        pronosticos += parcial_pronosticos
+        diagnosticos += parcial_diagnosticos
+
+    tabla = pd.concat(pronosticos, ignore_index=True) if pronosticos else pd.DataFrame(columns=["Serie", "Mes", "Pronostico"])
+    tabla = tabla.sort_values(["Serie", "Mes"], ignore_index=True)
+    diagnostico = pd.DataFrame(diagnosticos).sort_values("Serie", ignore_index=True)
+    return tabla, diagnostico
+
+
+def directorio(version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "pronosticos", version)
+
+
+def version():
+    return datos.version("ventas", "compras")
+
+
+def tablas(procesos=None):
+    """(pronósticos, diagnósticos) de la versión actual; se calculan si faltan."""
+    with metricas.tramo("pronosticos.tablas", "carga"), _lock:
+        actual = version()
+        en_cache = _cache.get("tablas")
+        if en_cache is None or en_cache[0] != actual:
+            carpeta = directorio(actual)
+            rutas = [os.path.join(carpeta, "pronosticos.parquet"), os.path.join(carpeta, "diagnosticos.parquet")]
+            if datos.HAY_PARQUET and all(os.path.exists(r) for r in rutas):
+                metricas.cache("pronosticos", "disco")
+                resultado = tuple(pd.read_parquet(r) for r in rutas)
+            else:
+                metricas.cache("pronosticos", "calculo")
+                resultado = calcular(procesos)
+                if datos.HAY_PARQUET:
+                    for df, destino in zip(resultado, rutas):
+                        datos.escribir_parquet(df, destino)
+                    raiz = os.path.dirname(carpeta)
+                    for vieja in os.listdir(raiz):
+                        if vieja != actual:
+                            shutil.rmtree(os.path.join(raiz, vieja), ignore_errors=True)
+            en_cache = (actual, resultado)
+            _cache["tablas"] = en_cache
+        else:
+            metricas.cache("pronosticos", "memoria")
+    return en_cache[1]
+
+
+def pronostico(serie):
+    """Pronóstico (Series indexada por mes) y fila de diagnóstico de una serie."""
+    tabla, diagnostico = tablas()
+    filas = tabla[tabla["Serie"] == serie]
+    fila = diagnostico[diagnostico["Serie"] == serie]
+    return filas.set_index("Mes")["Pronostico"], (fila.iloc[0].to_dict() if len(fila) else None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcula los pronósticos ARIMA de todos los productos")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool (por defecto, uno por CPU)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    tabla, diagnostico = tablas(args.procesos)
+    errores = diagnostico["Error"].notna().sum()
+    print(f"{len(diagnostico)} series, {errores} con error, {time.perf_counter() - inicio:.1f}s")
+    print(f"Versión {version()}: {directorio(version())}")
@@ -0,0 +1,158 @@
+"""Índices de similitud coseno precalculados sobre matrices dispersas.
+
+El recomendador de productos armaba en cada interacción una matriz densa
+IdCliente × IdProducto y ajustaba un ``NearestNeighbors`` por fuerza bruta
+para consultar un solo producto. Acá la matriz se arma dispersa (CSR, sólo
+los pares cliente-producto que existen) y ``vecinos_coseno`` calcula de una
+vez los N vecinos más parecidos de cada elemento, por bloques de filas para
+acotar la memoria. El resultado es una tabla chica que se guarda por versión
+de los datos (en memoria y en ``.cache_datos/similitud``); recomendar es
+buscar las filas de un producto.
+
+Lo mismo se hace con los proveedores, como filas IdProveedor × IdProducto de
+las compras: la clave es el id y no el nombre, que se repite entre proveedores.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+import datos
+import metricas
+
+VECINOS = 10
+
+# Celdas de similitud (filas del bloque × elementos) que se calculan juntas
+CELDAS_POR_BLOQUE = 4_000_000
+
+_cache = {}
+_lock = threading.Lock()
+
+
+def matriz_dispersa(filas, columnas, valores):
+    """Matriz CSR filas × columnas sumando ``valores``, con las etiquetas de cada eje."""
+    codigos_filas, etiquetas_filas = pd.factorize(filas, sort=True)
+    codigos_columnas, etiquetas_columnas = pd.factorize(columnas, sort=True)
+    matriz = sparse.coo_matrix(
+        (np.asarray(valores, dtype="float64"), (codigos_filas, codigos_columnas)),
+        shape=(len(etiquetas_filas), len(etiquetas_columnas)),
+    ).tocsr()
+    matriz.sum_duplicates()
+    return matriz, etiquetas_filas, etiquetas_columnas
+
+
+def vecinos_coseno(matriz, vecinos=VECINOS):
+    """Los ``vecinos`` elementos (filas) más parecidos a cada fila de ``matriz``.
+
+    Devuelve tres arreglos planos: fila, vecino y similitud coseno, ordenados
+    por fila y similitud descendente. No incluye a la fila misma ni vecinos
+    sin nada en común (similitud 0).
+    """
+    from sklearn.preprocessing import normalize
+
+    normalizada = normalize(sparse.csr_matrix(matriz, dtype="float64"), norm="l2", axis=1)
+    traspuesta = normalizada.T.tocsc()
+    total = normalizada.shape[0]
+    bloque = max(1, CELDAS_POR_BLOQUE // max(total, 1))
+    k = min(vecinos, max(total - 1, 0))
+    if k == 0:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="int64"), np.empty(0, dtype="float64")
+
+    filas, vecinos_encontrados, similitudes = [], [], []
+    for inicio in range(0, total, bloque):
+        fin = min(inicio + bloque, total)
+        parecidos = (normalizada[inicio:fin] @ traspuesta).toarray()
+        parecidos[np.arange(fin - inicio), np.arange(inicio, fin)] = -np.inf
+        mejores = np.argpartition(-parecidos, k - 1, axis=1)[:, :k]
+        valores = np.take_along_axis(parecidos, mejores, axis=1)
+        orden = np.argsort(-valores, axis=1, kind="stable")
+        mejores = np.take_along_axis(mejores, orden, axis=1)
+        valores = np.take_along_axis(valores, orden, axis=1)
+
+        validos = valores > 0
+        filas.append(np.broadcast_to(np.arange(inicio, fin)[:, None], mejores.shape)[validos])
+        vecinos_encontrados.append(mejores[validos])
+        similitudes.append(valores[validos])
+
+    return np.concatenate(filas), np.concatenate(vecinos_encontrados), np.concatenate(similitudes)
+
+
+def tabla_vecinos(matriz, etiquetas, clave, vecinos=VECINOS):
+    """Tabla ``clave``, Vecino, Similitud, Rango para las filas de ``matriz``."""
+    filas, encontrados, similitudes = vecinos_coseno(matriz, vecinos)
+    tabla = pd.DataFrame({
+        clave: np.asarray(etiquetas)[filas],
+        "Vecino": np.asarray(etiquetas)[encontrados],
+        "Similitud": similitudes,
+    })
+    tabla["Rango"] = tabla.groupby(clave, sort=False).cumcount() + 1
+    return tabla
+
+
+def _construir_productos():
+    ventas = datos.load_ventas(columnas=["IdCliente", "IdProducto", "Cantidad"])
+    # Cada producto es una fila con lo que compró cada cliente
+    matriz, productos, _ = matriz_dispersa(ventas["IdProducto"], ventas["IdCliente"], ventas["Cantidad"])
+    return tabla_vecinos(matriz, productos, "IdProducto")
+
+
+def _construir_proveedores():
+    compras = datos.load_compras(columnas=["IdProveedor", "IdProducto", "Cantidad"])
+    # Cada proveedor es una fila con lo que se le compró de cada producto
+    matriz, proveedores, _ = matriz_dispersa(compras["IdProveedor"], compras["IdProducto"], compras["Cantidad"])
+    return tabla_vecinos(matriz, proveedores, "IdProveedor")
+
+
+def ruta_persistida(nombre, version):
+    return os.path.join(datos.DIRECTORIO_CACHE, "similitud", f"{nombre}-{version}.parquet")
+
+
+def _indice(nombre, tablas, construir):
+    """Tabla de vecinos ``nombre``, reconstruida sólo si cambian ``tablas``."""
+    with metricas.tramo(f"similitud.{nombre}", "carga"), _lock:
+        actual = datos.version(*tablas)
+        en_cache = _cache.get(nombre)
+        if en_cache is None or en_cache[0] != actual:
+            destino = ruta_persistida(nombre, actual)
+            if datos.HAY_PARQUET and os.path.exists(destino):
+                metricas.cache("similitud", "disco")
+                tabla = pd.read_parquet(destino)
+            else:
+                metricas.cache("similitud", "calculo")
+                tabla = construir()
+                if datos.HAY_PARQUET:
+                    datos.escribir_parquet(tabla, destino, reemplaza=f"{nombre}-*.parquet")
+            clave = tabla.columns[0]
+            en_cache = (actual, tabla.set_index(clave).sort_index(kind="stable"))
+            _cache[nombre] = en_cache
+        else:
+            metricas.cache("similitud", "memoria")
+    return en_cache[1]
+
+
+def indice_productos():
+    """Vecinos más parecidos de cada IdProducto según los clientes que los compran."""
+    return _indice("productos", ("ventas",), _construir_productos)
+
+
+def _similares(indice, clave, cantidad):
+    if clave not in indice.index:
+        return pd.DataFrame(columns=["Vecino", "Similitud"])
+    return indice.loc[[clave], ["Vecino", "Similitud"]].head(cantidad).reset_index(drop=True)
+
+
+def productos_similares(id_producto, cantidad=5):
+    """Vecino y Similitud de los productos más parecidos a ``id_producto``."""
+    return _similares(indice_productos(), id_producto, cantidad)
+
+
+def indice_proveedores():
+    """Vecinos más parecidos de cada IdProveedor según los productos que se le compran."""
+    return _indice("proveedores", ("compras",), _construir_proveedores)
+
+
+def proveedores_similares(id_proveedor, cantidad=3):
+    """Vecino y Similitud de los proveedores más parecidos a ``id_proveedor``."""
+    return _similares(indice_proveedores(), id_proveedor, cantidad)
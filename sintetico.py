@@ -0,0 +1,199 @@
+"""Datos sintéticos con la forma de los CSV, para pruebas de carga.
+
+``python sintetico.py --factor 100`` genera ventas, compras y gastos 100 veces
+más grandes que los archivos del repositorio, en bloques de ``BLOQUE`` filas
+(nunca se arma la salida completa en memoria). Cada columna, o grupo de
+columnas que van juntas (sucursal y empleado), se sortea de su distribución
+observada en el CSV original: las fechas salen de la frecuencia diaria real,
+así que se conserva la estacionalidad, y los precios y montos salen del
+cociente observado contra el precio de lista del producto o el monto
+aproximado del tipo de gasto.
+
+Todas las claves (IdCliente, IdProducto, IdSucursal, IdEmpleado, IdProveedor,
+IdTipoGasto, IdCanal) se sortean sólo entre las que existen en su tabla
+(``CLAVES``); las filas del original con claves huérfanas no se usan para
+aprender. Las tablas de dimensión se copian tal cual, así que la carpeta de
+salida en CSV es un juego de datos completo para la app::
+
+    python sintetico.py --factor 100 --destino /tmp/dataenterprise-x100
+    DATAENTERPRISE_DATOS=/tmp/dataenterprise-x100 streamlit run Main.py
+
+Con ``--formato parquet`` los hechos se escriben en Parquet (un grupo de filas
+por bloque), para medir lectores sin pasar por el CSV.
+"""
+import argparse
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+import datos
+
+TABLAS = ("ventas", "compras", "gastos")
+
+BLOQUE = 500_000
+
+# Clave foránea -> (tabla, columna) donde tiene que existir
+CLAVES = {
+    "ventas": {
+        "IdCanal": ("canal", "CODIGO"), "IdCliente": ("clientes", "ID"),
+        "IdSucursal": ("sucursales", "ID"), "IdEmpleado": ("empleados", "ID_empleado"),
+        "IdProducto": ("productos", "ID_PRODUCTO"),
+    },
+    "compras": {
+        "IdProducto": ("productos", "ID_PRODUCTO"), "IdProveedor": ("proveedores", "IDProveedor"),
+    },
+    "gastos": {
+        "IdSucursal": ("sucursales", "ID"), "IdTipoGasto": ("tipos_gasto", "IdTipoGasto"),
+    },
+}
+
+# Grupos de columnas que se sortean juntos; cada grupo es independiente de los demás
+GRUPOS = {
+    "ventas": (
+        ("Fecha",), ("Demora",), ("IdCanal",), ("IdCliente",), ("IdSucursal", "IdEmpleado"),
+        ("IdProducto",), ("Relacion",), ("Cantidad",),
+    ),
+    "compras": (("Fecha",), ("IdProducto",), ("Relacion",), ("Cantidad",), ("IdProveedor",)),
+    "gastos": (("IdSucursal",), ("IdTipoGasto",), ("Fecha",), ("Relacion",)),
+}
+
+# Columna que da el precio o monto de referencia de cada fila, y su tabla
+REFERENCIAS = {
+    "ventas": ("IdProducto", "productos", "ID_PRODUCTO", "Precio"),
+    "compras": ("IdProducto", "productos", "ID_PRODUCTO", "Precio"),
+    "gastos": ("IdTipoGasto", "tipos_gasto", "IdTipoGasto", "Monto_Aproximado"),
+}
+
+IMPORTES = {"ventas": "Precio", "compras": "Precio", "gastos": "Monto"}
+
+
+# -----------------------------
+# DISTRIBUCIONES OBSERVADAS
+# -----------------------------
+def empirica(df, columnas):
+    """Combinaciones distintas de ``columnas`` y su probabilidad acumulada."""
+    conteo = df.groupby(list(columnas), observed=True, sort=False).size()
+    valores = conteo.index.to_frame(index=False)
+    return valores, np.cumsum(conteo.to_numpy()) / conteo.sum()
+
+
+def muestrear(distribucion, rng, cantidad):
+    valores, acumulada = distribucion
+    indices = np.searchsorted(acumulada, rng.random(cantidad), side="right")
+    # El último acumulado puede quedar apenas debajo de 1 por redondeo
+    return valores.iloc[np.minimum(indices, len(acumulada) - 1)].reset_index(drop=True)
+
+
+def _referencia(tabla):
+    _, dimension, clave, columna = REFERENCIAS[tabla]
+    return datos.cargar(dimension, [clave, columna]).set_index(clave)[columna].astype("float64")
+
+
+def aprender(tabla):
+    """Distribuciones de cada grupo de columnas de ``tabla`` en el CSV actual."""
+    df = datos.cargar(tabla)
+    filas = len(df)
+    for columna, (dimension, clave) in CLAVES[tabla].items():
+        df = df[df[columna].isin(datos.cargar(dimension, [clave])[clave])]
+
+    columna_referencia = REFERENCIAS[tabla][0]
+    df = df.assign(Relacion=df[IMPORTES[tabla]] / df[columna_referencia].map(_referencia(tabla)))
+    if tabla == "ventas":
+        df["Demora"] = (df["Fecha_Entrega"] - df["Fecha"]).dt.days
+    return {
+        "filas": filas,
+        "grupos": [empirica(df, grupo) for grupo in GRUPOS[tabla]],
+        "referencia": _referencia(tabla),
+    }
+
+
+def bloque(tabla, modelo, rng, primer_id, cantidad):
+    """``cantidad`` filas sintéticas de ``tabla`` con ids desde ``primer_id``."""
+    df = pd.concat([muestrear(grupo, rng, cantidad) for grupo in modelo["grupos"]], axis=1)
+    columna_referencia = REFERENCIAS[tabla][0]
+    importe = df["Relacion"] * df[columna_referencia].map(modelo["referencia"]).to_numpy()
+    df[IMPORTES[tabla]] = importe.round(2)
+    if tabla == "ventas":
+        df["Fecha_Entrega"] = df["Fecha"] + pd.to_timedelta(df["Demora"], unit="D")
+    df[datos.INCREMENTALES[tabla]] = np.arange(primer_id, primer_id + cantidad)
+
+    esquema = datos.ESQUEMAS[tabla]
+    return df[list(esquema)].astype({c: t for c, t in esquema.items() if t != datos.FECHA})
+
+
+# -----------------------------
+# ESCRITURA POR BLOQUES
+# -----------------------------
+def _archivo(tabla, destino, formato):
+    nombre = datos.ARCHIVOS[tabla]
+    if formato == "parquet":
+        nombre = os.path.splitext(nombre)[0] + ".parquet"
+    return os.path.join(destino, nombre)
+
+
+def generar(tabla, destino, factor=None, filas=None, formato="csv", semilla=0, tam_bloque=BLOQUE):
+    """Escribe ``filas`` (o ``factor`` veces las del original) filas sintéticas de ``tabla``.
+
+    Cada bloque usa su propio generador (semilla, tabla, número de bloque),
+    así que el resultado no depende de cuántos bloques se hayan escrito antes.
+    """
+    modelo = aprender(tabla)
+    total = filas if filas is not None else int(round(modelo["filas"] * (factor or 1)))
+    salida = _archivo(tabla, destino, formato)
+    os.makedirs(destino, exist_ok=True)
+    temporal = f"{salida}.{os.getpid()}.tmp"
+
+    escritor = None
+    try:
+        # Con total 0 igual se escribe un bloque vacío, para dejar el encabezado
+        for numero, inicio in enumerate(range(0, max(total, 1), tam_bloque)):
+            rng = np.random.default_rng([semilla, TABLAS.index(tabla), numero])
+            df = bloque(tabla, modelo, rng, inicio + 1, min(tam_bloque, total - inicio))
+            if formato == "parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                tabla_arrow = pa.Table.from_pandas(df, preserve_index=False)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(temporal, tabla_arrow.schema)
+                escritor.write_table(tabla_arrow)
+            else:
+                df.to_csv(temporal, mode="w" if numero == 0 else "a", header=numero == 0,
+                          index=False, date_format="%Y-%m-%d")
+    finally:
+        if escritor is not None:
+            escritor.close()
+    os.replace(temporal, salida)
+    return salida, total
+
+
+def copiar_dimensiones(destino):
+    """Copia las tablas que no se generan, para que ``destino`` sea un juego completo."""
+    os.makedirs(destino, exist_ok=True)
+    for tabla in datos.ARCHIVOS:
+        if tabla not in TABLAS:
+            shutil.copyfile(datos.ruta(tabla), os.path.join(destino, datos.ARCHIVOS[tabla]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera ventas, compras y gastos sintéticos a escala")
+    parser.add_argument("--factor", type=float, default=10, help="Múltiplo de las filas originales (por defecto 10)")
+    parser.add_argument("--filas", type=int, default=None, help="Filas exactas por tabla (en lugar de --factor)")
+    parser.add_argument("--tablas", nargs="*", default=list(TABLAS), choices=list(TABLAS))
+    parser.add_argument("--destino", default=None, help="Carpeta de salida (por defecto .cache_datos/sintetico/x<factor>)")
+    parser.add_argument("--formato", choices=("csv", "parquet"), default="csv")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--bloque", type=int, default=BLOQUE, help="Filas por bloque escrito")
+    args = parser.parse_args()
+
+    if args.formato == "parquet" and not datos.HAY_PARQUET:
+        parser.error("Se necesita pyarrow para escribir Parquet")
+    destino = args.destino or os.path.join(datos.DIRECTORIO_CACHE, "sintetico", f"x{args.factor:g}")
+    copiar_dimensiones(destino)
+    for tabla in args.tablas:
+        inicio = time.perf_counter()
+        salida, total = generar(tabla, destino, args.factor, args.filas, args.formato, args.semilla, args.bloque)
+        print(f"{tabla}: {total:,} filas en {time.perf_counter() - inicio:.1f}s -> {salida}")